@@ -7,7 +7,8 @@ from app.core.config import settings
 from app.api.v1.routes.sms import router as sms_router
 from app.api.v1.routes.email import router as email_router
 from app.core.tasks import cleanup_logs_task
-from app.services.otp.otp_consumer import otp_consumer_service
+from app.rabbitmq.config import rabbitmq_config
+from app.services.otp.otp_consumer import async_otp_consumer_service, otp_consumer_service
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.cron import CronTrigger
 
@@ -25,7 +26,10 @@ async def lifespan(app: FastAPI):
     # Start OTP consumer service
     try:
         logger.info("Starting OTP consumer service...")
-        otp_consumer_service.start_consuming()
+        if rabbitmq_config.async_consumers:
+            await async_otp_consumer_service.start_consuming()
+        else:
+            otp_consumer_service.start_consuming()
         logger.info("OTP consumer service started successfully")
     except Exception as e:
         logger.error(f"Failed to start OTP consumer service: {e}")
@@ -36,7 +40,10 @@ async def lifespan(app: FastAPI):
     # Shutdown
     logger.info(f"Shutting down {settings.app_name}")
     try:
-        otp_consumer_service.stop_consuming()
+        if rabbitmq_config.async_consumers:
+            await async_otp_consumer_service.stop_consuming()
+        else:
+            otp_consumer_service.stop_consuming()
         logger.info("OTP consumer service stopped")
     except Exception as e:
         logger.error(f"Error stopping OTP consumer service: {e}")
@@ -81,7 +88,8 @@ async def health_check():
     """
     Health check endpoint
     """
-    otp_consumer_healthy = otp_consumer_service.is_healthy()
+    consumer = async_otp_consumer_service if rabbitmq_config.async_consumers else otp_consumer_service
+    otp_consumer_healthy = consumer.is_healthy()
     
     return {
         "status": "healthy" if otp_consumer_healthy else "degraded",
@@ -17,6 +17,11 @@ class RabbitMQConfig(BaseSettings):
     connection_attempts: int = int(os.getenv("RABBITMQ_CONNECTION_ATTEMPTS", "3"))
     retry_delay: float = float(os.getenv("RABBITMQ_RETRY_DELAY", "2.0"))
     heartbeat: int = int(os.getenv("RABBITMQ_HEARTBEAT", "600"))
+
+    # Asyncio consumers (aio-pika) on the event loop instead of consumer threads
+    async_consumers: bool = os.getenv("RABBITMQ_ASYNC_CONSUMERS", "false").lower() == "true"
+    prefetch_count: int = int(os.getenv("RABBITMQ_PREFETCH_COUNT", "10"))
+    consumer_concurrency: int = int(os.getenv("RABBITMQ_CONSUMER_CONCURRENCY", "10"))
     
     # Exchange settings
     otp_exchange: str = "user.otp.exchange"
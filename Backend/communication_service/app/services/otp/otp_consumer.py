@@ -2,6 +2,7 @@ import logging
 import threading
 from typing import Optional
 
+from app.rabbitmq.aio_consumer import AsyncRabbitMQConsumer
 from app.rabbitmq.consumer import get_rabbitmq_consumer, create_otp_message_callback
 from app.rabbitmq.config import rabbitmq_config
 from .otp_handler import otp_handler
@@ -79,5 +80,37 @@ class OTPConsumerService:
         return self.is_running and self.consumer_thread and self.consumer_thread.is_alive()
 
 
-# Global OTP consumer service instance
+class AsyncOTPConsumerService:
+    """Consumes OTP messages on the event loop (RABBITMQ_ASYNC_CONSUMERS=true)"""
+
+    def __init__(self):
+        self.otp_handler = otp_handler
+        self.consumer: Optional[AsyncRabbitMQConsumer] = None
+
+    async def start_consuming(self) -> None:
+        """Start consuming OTP messages from both email and SMS queues"""
+        self.consumer = AsyncRabbitMQConsumer()
+        # Failed sends are discarded rather than requeued, as in the threaded consumer
+        self.consumer.add_handler(
+            rabbitmq_config.email_queue, self.otp_handler.handle_email_otp, requeue_on_failure=False
+        )
+        self.consumer.add_handler(
+            rabbitmq_config.sms_queue, self.otp_handler.handle_sms_otp, requeue_on_failure=False
+        )
+        await self.consumer.start()
+        logger.info("Async OTP consumer service started")
+
+    async def stop_consuming(self) -> None:
+        """Stop consuming OTP messages"""
+        if self.consumer is not None:
+            await self.consumer.stop()
+            self.consumer = None
+
+    def is_healthy(self) -> bool:
+        """Check if the consumer service is healthy"""
+        return self.consumer is not None and self.consumer.is_healthy()
+
+
+# Global OTP consumer service instances
 otp_consumer_service = OTPConsumerService()
+async_otp_consumer_service = AsyncOTPConsumerService()
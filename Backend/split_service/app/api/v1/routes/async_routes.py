@@ -0,0 +1,117 @@
+"""
+Async handlers for the read-heavy group, expense and settlement routes.
+
+Included ahead of the sync routers when DB_ASYNC_MODE is enabled, so these
+paths are served on the event loop with an AsyncSession instead of taking a
+threadpool slot. Paths, parameters and responses match the sync routes.
+"""
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional
+from datetime import datetime
+from app.api.v1.routes.groups import get_current_user_id
+from app.cache.group_slug_cache import GroupRef
+from app.db.async_database import get_async_db
+from app.services.expense_service import get_debt_summary_async, get_group_expenses_page_async, optimize_settlements
+from app.services.group_service import get_user_groups_async, is_group_member_async, resolve_group_slug_async
+from app.services.settlement_service import get_group_settlements_page_async
+from app.schemas.expense_schema import DebtSummary, ExpensePage
+from app.schemas.group_schema import GroupOut
+from app.schemas.settlement_schema import OptimizedSettlement, SettlementPage
+from app.utils.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+
+groups_router = APIRouter(prefix="/groups", tags=["groups"])
+expenses_router = APIRouter(prefix="/expenses", tags=["expenses"])
+settlements_router = APIRouter(prefix="/settlements", tags=["settlements"])
+
+
+async def _member_group(db: AsyncSession, group_slug: str, user_id: str) -> GroupRef:
+    """Resolve the group of a route and check the caller belongs to it"""
+    group = await resolve_group_slug_async(db, group_slug)
+    if not group:
+        raise HTTPException(status_code=404, detail="Group not found")
+
+    if not await is_group_member_async(db, group.id, user_id):
+        raise HTTPException(status_code=403, detail="You are not a member of this group")
+    return group
+
+
+@groups_router.get("/", response_model=List[GroupOut])
+async def get_my_groups(
+    user_id: str = Depends(get_current_user_id),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Get all groups for current user"""
+    return await get_user_groups_async(db, user_id)
+
+
+@expenses_router.get("/groups/{group_slug}", response_model=ExpensePage)
+async def get_group_expenses_list(
+    group_slug: str,
+    cursor: Optional[str] = Query(None, description="Cursor returned with the previous page"),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    date_from: Optional[datetime] = Query(None),
+    date_to: Optional[datetime] = Query(None),
+    category_id: Optional[str] = Query(None),
+    paid_by: Optional[str] = Query(None),
+    is_settled: Optional[bool] = Query(None),
+    user_id: str = Depends(get_current_user_id),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Get a page of a group's expenses, newest first"""
+    group = await _member_group(db, group_slug, user_id)
+
+    expenses, next_cursor = await get_group_expenses_page_async(
+        db, group.id, cursor=cursor, limit=limit, date_from=date_from, date_to=date_to,
+        category_id=category_id, paid_by=paid_by, is_settled=is_settled
+    )
+    return ExpensePage(items=expenses, next_cursor=next_cursor)
+
+
+@settlements_router.get("/groups/{group_slug}", response_model=SettlementPage)
+async def get_group_settlements_list(
+    group_slug: str,
+    cursor: Optional[str] = Query(None, description="Cursor returned with the previous page"),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    date_from: Optional[datetime] = Query(None),
+    date_to: Optional[datetime] = Query(None),
+    from_user_id: Optional[str] = Query(None),
+    to_user_id: Optional[str] = Query(None),
+    user_id: str = Depends(get_current_user_id),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Get a page of a group's settlements, newest first"""
+    group = await _member_group(db, group_slug, user_id)
+
+    settlements, next_cursor = await get_group_settlements_page_async(
+        db, group.id, cursor=cursor, limit=limit, date_from=date_from, date_to=date_to,
+        from_user_id=from_user_id, to_user_id=to_user_id
+    )
+    return SettlementPage(items=settlements, next_cursor=next_cursor)
+
+
+@settlements_router.get("/groups/{group_slug}/debts", response_model=List[DebtSummary])
+async def get_group_debt_summary(
+    group_slug: str,
+    user_id: str = Depends(get_current_user_id),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Get debt summary for all group members"""
+    group = await _member_group(db, group_slug, user_id)
+    return await get_debt_summary_async(db, group.id)
+
+
+@settlements_router.get("/groups/{group_slug}/optimize", response_model=List[OptimizedSettlement])
+async def get_optimized_settlements(
+    group_slug: str,
+    strategy: str = Query("greedy", pattern="^(greedy|optimal)$"),
+    user_id: str = Depends(get_current_user_id),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Get optimized settlement suggestions"""
+    group = await _member_group(db, group_slug, user_id)
+
+    debt_summary = await get_debt_summary_async(db, group.id)
+    # The optimal strategy can take a noticeable amount of CPU; keep it off the event loop
+    return await run_in_threadpool(optimize_settlements, debt_summary, strategy=strategy)
@@ -1,17 +1,19 @@
-from fastapi import APIRouter, Depends, HTTPException, Header
+from fastapi import APIRouter, Depends, HTTPException, Header, Query
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
+from datetime import datetime
 from app.db.database import get_db
 from app.services.auth.jwt_handler import get_current_user
 from app.services.expense_service import (
-    create_expense, get_expense, get_group_expenses, get_category_expenses,
+    create_expense, create_expenses_bulk, get_expense, get_group_expenses_page, get_category_expenses,
     update_expense, delete_expense, get_expense_shares, settle_expense_share
 )
-from app.services.group_service import get_group_by_slug
+from app.services.group_service import resolve_group_slug
 from app.schemas.expense_schema import (
-    ExpenseCreate, ExpenseUpdate, ExpenseOut, ExpenseWithShares,
-    ExpenseShareCreate, ExpenseShareOut
+    ExpenseCreate, ExpenseUpdate, ExpenseOut, ExpenseWithShares, ExpensePage,
+    ExpenseShareCreate, ExpenseShareOut, BulkExpenseCreate, BulkExpenseResult
 )
+from app.utils.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
 
 router = APIRouter(prefix="/expenses", tags=["expenses"])
 
@@ -34,21 +36,43 @@ def create_new_expense(
     db: Session = Depends(get_db)
 ):
     """Create a new expense with shares"""
-    group = get_group_by_slug(db, group_slug)
+    group = resolve_group_slug(db, group_slug)
     if not group:
         raise HTTPException(status_code=404, detail="Group not found")
 
     return create_expense(db, group.id, expense_data, user_id, shares_data)
 
 
-@router.get("/groups/{group_slug}", response_model=List[ExpenseWithShares])
+@router.post("/groups/{group_slug}/bulk", response_model=BulkExpenseResult)
+def create_expenses_in_bulk(
+    group_slug: str,
+    bulk_data: BulkExpenseCreate,
+    user_id: str = Depends(get_current_user_id),
+    db: Session = Depends(get_db)
+):
+    """Create many expenses with shares in one transaction, reporting per-item errors"""
+    group = resolve_group_slug(db, group_slug)
+    if not group:
+        raise HTTPException(status_code=404, detail="Group not found")
+
+    return create_expenses_bulk(db, group.id, bulk_data.expenses, user_id)
+
+
+@router.get("/groups/{group_slug}", response_model=ExpensePage)
 def get_group_expenses_list(
     group_slug: str,
+    cursor: Optional[str] = Query(None, description="Cursor returned with the previous page"),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    date_from: Optional[datetime] = Query(None),
+    date_to: Optional[datetime] = Query(None),
+    category_id: Optional[str] = Query(None),
+    paid_by: Optional[str] = Query(None),
+    is_settled: Optional[bool] = Query(None),
     user_id: str = Depends(get_current_user_id),
     db: Session = Depends(get_db)
 ):
-    """Get all expenses for a group"""
-    group = get_group_by_slug(db, group_slug)
+    """Get a page of a group's expenses, newest first"""
+    group = resolve_group_slug(db, group_slug)
     if not group:
         raise HTTPException(status_code=404, detail="Group not found")
 
@@ -56,32 +80,12 @@ def get_group_expenses_list(
     if not is_group_member(db, group.id, user_id):
         raise HTTPException(status_code=403, detail="You are not a member of this group")
 
-    expenses = get_group_expenses(db, group.id)
-    result = []
-
-    for expense in expenses:
-        shares = get_expense_shares(db, expense.id)
-        result.append(ExpenseWithShares(
-            id=expense.id,
-            group_id=expense.group_id,
-            group_category_id=expense.group_category_id,
-            title=expense.title,
-            amount=expense.amount,
-            paid_by=expense.paid_by,
-            description=expense.description,
-            receipt_url=expense.receipt_url,
-            date=expense.date,
-            created_at=expense.created_at,
-            shares=[ExpenseShareOut(
-                id=share.id,
-                expense_id=share.expense_id,
-                user_id=share.user_id,
-                share_amount=share.share_amount,
-                is_settled=share.is_settled
-            ) for share in shares]
-        ))
-
-    return result
+    # Shares are loaded for the page with one IN query and serialized from attributes
+    expenses, next_cursor = get_group_expenses_page(
+        db, group.id, cursor=cursor, limit=limit, date_from=date_from, date_to=date_to,
+        category_id=category_id, paid_by=paid_by, is_settled=is_settled
+    )
+    return ExpensePage(items=expenses, next_cursor=next_cursor)
 
 
 @router.get("/categories/{category_id}", response_model=List[ExpenseOut])
@@ -1,4 +1,6 @@
-from fastapi import APIRouter, Depends, HTTPException, Header
+import json
+from fastapi import APIRouter, Depends, HTTPException, Header, Query
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 from typing import List, Union
 from app.db.database import get_db
@@ -7,6 +9,7 @@ from app.services.group_service import (
     create_group,
     get_group,
     get_group_by_slug,
+    resolve_group_slug,
     get_user_groups,
     update_group,
     delete_group,
@@ -19,6 +22,7 @@ from app.services.group_service import (
     update_group_category,
     delete_group_category,
 )
+from app.services.export_service import EXPORT_FORMATS, stream_group_export
 from app.schemas.group_schema import (
     GroupCreate,
     GroupUpdate,
@@ -120,7 +124,7 @@ def update_existing_group(
     db: Session = Depends(get_db)
 ):
     """Update a group (admin only)"""
-    group = get_group_by_slug(db, group_slug)
+    group = resolve_group_slug(db, group_slug)
     if not group:
         raise HTTPException(status_code=404, detail="Group not found")
 
@@ -134,7 +138,7 @@ def delete_existing_group(
     db: Session = Depends(get_db)
 ):
     """Delete a group (admin only)"""
-    group = get_group_by_slug(db, group_slug)
+    group = resolve_group_slug(db, group_slug)
     if not group:
         raise HTTPException(status_code=404, detail="Group not found")
 
@@ -142,6 +146,29 @@ def delete_existing_group(
     return {"message": "Group deleted successfully"}
 
 
+@router.get("/{group_slug}/export")
+def export_group_ledger(
+    group_slug: str,
+    export_format: str = Query("ndjson", alias="format", pattern="^(ndjson|csv)$"),
+    user_id: str = Depends(get_current_user_id),
+    db: Session = Depends(get_db)
+):
+    """Stream every expense, share and settlement of a group as NDJSON or CSV"""
+    group = resolve_group_slug(db, group_slug)
+    if not group:
+        raise HTTPException(status_code=404, detail="Group not found")
+
+    from app.services.group_service import is_group_member
+    if not is_group_member(db, group.id, user_id):
+        raise HTTPException(status_code=403, detail="You are not a member of this group")
+
+    return StreamingResponse(
+        stream_group_export(group.id, export_format),
+        media_type=EXPORT_FORMATS[export_format],
+        headers={"Content-Disposition": f'attachment; filename="{group_slug}-ledger.{export_format}"'}
+    )
+
+
 @router.post("/{group_slug}/members", response_model=Union[GroupMemberOut, AsyncMemberRequestOut])
 def add_group_member(
     group_slug: str,
@@ -185,19 +212,17 @@ def add_group_member(
         raise HTTPException(status_code=400, detail=str(e))
 
 
-@router.get("/{group_slug}/members/pending/{request_id}", response_model=PendingRequestStatusOut)
-def get_pending_member_request_status(
-    group_slug: str,
-    request_id: str,
-    user_id: str = Depends(get_current_user_id),
-    db: Session = Depends(get_db)
-):
-    """Get the status of a pending member addition request"""
+# Longest a client may hold a long-poll or event stream open for one request
+PENDING_WAIT_MAX_SECONDS = 30
+
+
+def _pending_request_status(db: Session, group_slug: str, request_id: str, user_id: str) -> dict:
+    """Load a pending member request of a group for one of its admins"""
     from app.models.pending_requests import PendingMemberRequest
-    from app.services.group_service import get_group_by_slug, is_group_admin
+    from app.services.group_service import resolve_group_slug, is_group_admin
     
     # Get group by slug
-    group = get_group_by_slug(db, group_slug)
+    group = resolve_group_slug(db, group_slug)
     if not group:
         raise HTTPException(status_code=404, detail="Group not found")
     
@@ -224,6 +249,77 @@ def get_pending_member_request_status(
     }
 
 
+def _load_pending_request_status(group_slug: str, request_id: str, user_id: str) -> dict:
+    """Load a pending request status in a short-lived session of its own"""
+    from app.db.database import SessionLocal
+    
+    with SessionLocal() as db:
+        status = _pending_request_status(db, group_slug, request_id, user_id)
+    return PendingRequestStatusOut(**status).model_dump(mode="json")
+
+
+@router.get("/{group_slug}/members/pending/{request_id}", response_model=PendingRequestStatusOut)
+async def get_pending_member_request_status(
+    group_slug: str,
+    request_id: str,
+    wait: int = Query(0, ge=0, le=PENDING_WAIT_MAX_SECONDS, description="Long-poll: seconds to wait while still pending"),
+    user_id: str = Depends(get_current_user_id)
+):
+    """Get the status of a pending member addition request
+    
+    With wait > 0 a pending request is held open until the lookup response
+    is processed or the wait runs out, then the current status is returned.
+    No database connection or worker thread is held while waiting.
+    """
+    from starlette.concurrency import run_in_threadpool
+    from app.services.user_lookup_service import get_user_lookup_service
+    
+    status = await run_in_threadpool(_load_pending_request_status, group_slug, request_id, user_id)
+    if status["status"] == "pending" and wait:
+        if await get_user_lookup_service().wait_for_completion_async(request_id, timeout=wait):
+            status = await run_in_threadpool(_load_pending_request_status, group_slug, request_id, user_id)
+    return status
+
+
+@router.get("/{group_slug}/members/pending/{request_id}/events")
+async def stream_pending_member_request_status(
+    group_slug: str,
+    request_id: str,
+    user_id: str = Depends(get_current_user_id)
+):
+    """Server-sent events for a pending member addition request
+    
+    Sends the current status at once and, while it is pending, the final
+    status as soon as the lookup response is processed (or the current one
+    after PENDING_WAIT_MAX_SECONDS), then closes the stream.
+    """
+    from starlette.concurrency import run_in_threadpool
+    from app.services.user_lookup_service import get_user_lookup_service
+    
+    def load_status() -> dict:
+        return _load_pending_request_status(group_slug, request_id, user_id)
+    
+    def event(status: dict) -> str:
+        return f"event: status\ndata: {json.dumps(status)}\n\n"
+    
+    # Raises 403/404 before the stream starts
+    status = await run_in_threadpool(load_status)
+    
+    async def events():
+        yield event(status)
+        if status["status"] == "pending":
+            await get_user_lookup_service().wait_for_completion_async(
+                request_id, timeout=PENDING_WAIT_MAX_SECONDS
+            )
+            yield event(await run_in_threadpool(load_status))
+    
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
 @router.delete("/{group_slug}/members/{member_user_id}")
 def remove_group_member(
     group_slug: str,
@@ -232,7 +328,7 @@ def remove_group_member(
     db: Session = Depends(get_db)
 ):
     """Remove a member from group"""
-    group = get_group_by_slug(db, group_slug)
+    group = resolve_group_slug(db, group_slug)
     if not group:
         raise HTTPException(status_code=404, detail="Group not found")
 
@@ -248,7 +344,7 @@ def create_category(
     db: Session = Depends(get_db)
 ):
     """Create a category in group (admin only)"""
-    group = get_group_by_slug(db, group_slug)
+    group = resolve_group_slug(db, group_slug)
     if not group:
         raise HTTPException(status_code=404, detail="Group not found")
 
@@ -262,7 +358,7 @@ def get_categories(
     db: Session = Depends(get_db)
 ):
     """Get all categories for a group"""
-    group = get_group_by_slug(db, group_slug)
+    group = resolve_group_slug(db, group_slug)
     if not group:
         raise HTTPException(status_code=404, detail="Group not found")
 
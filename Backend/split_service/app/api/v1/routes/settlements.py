@@ -1,13 +1,15 @@
-from fastapi import APIRouter, Depends, HTTPException, Header
+from fastapi import APIRouter, Depends, HTTPException, Header, Query
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
+from datetime import datetime
 from app.db.database import get_db
 from app.services.auth.jwt_handler import get_current_user
-from app.services.settlement_service import create_settlement, get_group_settlements
+from app.services.settlement_service import create_settlement, get_group_settlements_page
 from app.services.expense_service import get_debt_summary, optimize_settlements
-from app.services.group_service import get_group_by_slug
-from app.schemas.settlement_schema import SettlementCreate, SettlementOut, OptimizedSettlement
+from app.services.group_service import resolve_group_slug
+from app.schemas.settlement_schema import SettlementCreate, SettlementOut, SettlementPage, OptimizedSettlement
 from app.schemas.expense_schema import DebtSummary
+from app.utils.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
 
 router = APIRouter(prefix="/settlements", tags=["settlements"])
 
@@ -29,21 +31,27 @@ def create_new_settlement(
     db: Session = Depends(get_db)
 ):
     """Create a manual settlement"""
-    group = get_group_by_slug(db, group_slug)
+    group = resolve_group_slug(db, group_slug)
     if not group:
         raise HTTPException(status_code=404, detail="Group not found")
 
     return create_settlement(db, group.id, settlement_data, user_id)
 
 
-@router.get("/groups/{group_slug}", response_model=List[SettlementOut])
+@router.get("/groups/{group_slug}", response_model=SettlementPage)
 def get_group_settlements_list(
     group_slug: str,
+    cursor: Optional[str] = Query(None, description="Cursor returned with the previous page"),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    date_from: Optional[datetime] = Query(None),
+    date_to: Optional[datetime] = Query(None),
+    from_user_id: Optional[str] = Query(None),
+    to_user_id: Optional[str] = Query(None),
     user_id: str = Depends(get_current_user_id),
     db: Session = Depends(get_db)
 ):
-    """Get all settlements for a group"""
-    group = get_group_by_slug(db, group_slug)
+    """Get a page of a group's settlements, newest first"""
+    group = resolve_group_slug(db, group_slug)
     if not group:
         raise HTTPException(status_code=404, detail="Group not found")
 
@@ -51,7 +59,11 @@ def get_group_settlements_list(
     if not is_group_member(db, group.id, user_id):
         raise HTTPException(status_code=403, detail="You are not a member of this group")
 
-    return get_group_settlements(db, group.id)
+    settlements, next_cursor = get_group_settlements_page(
+        db, group.id, cursor=cursor, limit=limit, date_from=date_from, date_to=date_to,
+        from_user_id=from_user_id, to_user_id=to_user_id
+    )
+    return SettlementPage(items=settlements, next_cursor=next_cursor)
 
 
 @router.get("/groups/{group_slug}/debts", response_model=List[DebtSummary])
@@ -61,7 +73,7 @@ def get_group_debt_summary(
     db: Session = Depends(get_db)
 ):
     """Get debt summary for all group members"""
-    group = get_group_by_slug(db, group_slug)
+    group = resolve_group_slug(db, group_slug)
     if not group:
         raise HTTPException(status_code=404, detail="Group not found")
 
@@ -75,11 +87,12 @@ def get_group_debt_summary(
 @router.get("/groups/{group_slug}/optimize", response_model=List[OptimizedSettlement])
 def get_optimized_settlements(
     group_slug: str,
+    strategy: str = Query("greedy", pattern="^(greedy|optimal)$"),
     user_id: str = Depends(get_current_user_id),
     db: Session = Depends(get_db)
 ):
     """Get optimized settlement suggestions"""
-    group = get_group_by_slug(db, group_slug)
+    group = resolve_group_slug(db, group_slug)
     if not group:
         raise HTTPException(status_code=404, detail="Group not found")
 
@@ -88,4 +101,4 @@ def get_optimized_settlements(
         raise HTTPException(status_code=403, detail="You are not a member of this group")
 
     debt_summary = get_debt_summary(db, group.id)
-    return optimize_settlements(debt_summary)
+    return optimize_settlements(debt_summary, strategy=strategy)
@@ -0,0 +1,222 @@
+"""
+Load test for the sync and async (DB_ASYNC_MODE) read routes.
+
+Builds one app from the sync expense and settlement routers and one from
+app.api.v1.routes.async_routes, points both at the same seeded database and
+fires concurrent requests at each through httpx's ASGI transport, reporting
+throughput and latency percentiles per concurrency level. Both apps must
+return the same bodies before any timing is reported.
+
+Sync handlers run in Starlette's threadpool with a pooled Session each,
+async handlers run on the event loop with an AsyncSession. SQLite answers
+from the page cache, so this mostly measures per-request overhead; set
+BENCH_DATABASE_URL to a Postgres URL (seeded from scratch) to include real
+network round trips.
+
+Run this module directly:
+    python -m app.benchmarks.async_load_benchmark
+"""
+
+import asyncio
+import os
+import random
+import statistics
+import tempfile
+import time
+from datetime import datetime, timedelta
+from decimal import Decimal
+from typing import List, Tuple
+
+import httpx
+from fastapi import FastAPI
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.api.v1.routes import async_routes, expenses, groups, settlements
+from app.cache.group_slug_cache import get_group_slug_cache
+from app.cache.membership_cache import get_membership_cache
+from app.db.async_database import get_async_db, to_async_url
+from app.db.database import Base, POOL_SETTINGS, get_db
+from app.models.expenses import Expense, ExpenseShare
+from app.models.groups import Group, GroupMember
+from app.models.settlements import Settlement
+from app.services.balance_service import reconcile_group_balances
+
+
+CONCURRENCY = [1, 10, 50]
+REQUESTS = 500
+MEMBERS = 20
+EXPENSES = 2000
+SETTLEMENTS = 200
+PATHS = [
+    "/expenses/groups/bench?limit=50",
+    "/settlements/groups/bench?limit=50",
+    "/settlements/groups/bench/debts",
+]
+
+
+def seed_group(db: Session, rng: random.Random) -> str:
+    """Create the "bench" group with members, equally split expenses and settlements."""
+    group = Group(name="Bench", slug="bench", created_by="user-0")
+    db.add(group)
+    db.flush()
+
+    users = [f"user-{i}" for i in range(MEMBERS)]
+    db.add_all(GroupMember(group_id=group.id, user_id=user_id, is_admin=user_id == "user-0") for user_id in users)
+
+    start = datetime(2026, 1, 1)
+    for i in range(EXPENSES):
+        participants = rng.sample(users, k=rng.randint(2, 6))
+        share = Decimal(rng.randint(100, 10000)) / 100
+        expense = Expense(
+            group_id=group.id,
+            group_category_id="bench",
+            title=f"Bench expense {i}",
+            amount=share * len(participants),
+            paid_by=rng.choice(users),
+            date=start + timedelta(minutes=i)
+        )
+        db.add(expense)
+        db.flush()
+        db.add_all(
+            ExpenseShare(expense_id=expense.id, user_id=participant, share_amount=share)
+            for participant in participants
+        )
+
+    for i in range(SETTLEMENTS):
+        from_user, to_user = rng.sample(users, k=2)
+        db.add(Settlement(
+            group_id=group.id,
+            from_user_id=from_user,
+            to_user_id=to_user,
+            amount=Decimal(rng.randint(100, 5000)) / 100,
+            settled_at=start + timedelta(hours=i)
+        ))
+
+    db.commit()
+    # Seeding bypasses the services, so materialize the ledger from history
+    reconcile_group_balances(db, group.id, repair=True)
+    return group.id
+
+
+def build_sync_app(session_factory: sessionmaker) -> FastAPI:
+    app = FastAPI()
+    app.include_router(expenses.router)
+    app.include_router(settlements.router)
+
+    def override_get_db():
+        db = session_factory()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[expenses.get_current_user_id] = lambda: "user-1"
+    app.dependency_overrides[settlements.get_current_user_id] = lambda: "user-1"
+    return app
+
+
+def build_async_app(session_factory: async_sessionmaker) -> FastAPI:
+    app = FastAPI()
+    app.include_router(async_routes.expenses_router)
+    app.include_router(async_routes.settlements_router)
+
+    async def override_get_async_db():
+        async with session_factory() as db:
+            yield db
+
+    app.dependency_overrides[get_async_db] = override_get_async_db
+    app.dependency_overrides[groups.get_current_user_id] = lambda: "user-1"
+    return app
+
+
+async def fetch_all(app: FastAPI) -> List[object]:
+    """Return the JSON body of every benchmarked path."""
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench") as client:
+        bodies = []
+        for path in PATHS:
+            response = await client.get(path)
+            assert response.status_code == 200, f"{path}: {response.status_code} {response.text}"
+            bodies.append(response.json())
+        return bodies
+
+
+async def load(app: FastAPI, concurrency: int) -> Tuple[float, float, float]:
+    """Fire REQUESTS requests with the given concurrency; return (req/s, p50 ms, p95 ms)."""
+    latencies: List[float] = []
+    queue = asyncio.Queue()
+    for i in range(REQUESTS):
+        queue.put_nowait(PATHS[i % len(PATHS)])
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench") as client:
+        async def worker():
+            while not queue.empty():
+                path = queue.get_nowait()
+                start = time.perf_counter()
+                response = await client.get(path)
+                latencies.append(time.perf_counter() - start)
+                assert response.status_code == 200
+
+        start = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    p95 = latencies[int(len(latencies) * 0.95) - 1]
+    return REQUESTS / elapsed, statistics.median(latencies) * 1000, p95 * 1000
+
+
+async def run_benchmark():
+    """Print throughput and latency of the sync and async apps per concurrency level."""
+    database_url = os.getenv("BENCH_DATABASE_URL")
+    with tempfile.TemporaryDirectory() as directory:
+        database_url = database_url or f"sqlite:///{directory}/bench.db"
+        if database_url.startswith("postgresql"):
+            engine = create_engine(database_url, **POOL_SETTINGS)
+            async_engine = create_async_engine(to_async_url(database_url), **POOL_SETTINGS)
+        else:
+            engine = create_engine(database_url, connect_args={"check_same_thread": False})
+            async_engine = create_async_engine(to_async_url(database_url))
+        Base.metadata.drop_all(bind=engine)
+        Base.metadata.create_all(bind=engine)
+        session_factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+        db = session_factory()
+        try:
+            seed_group(db, random.Random(42))
+        finally:
+            db.close()
+
+        sync_app = build_sync_app(session_factory)
+        async_app = build_async_app(async_sessionmaker(async_engine, expire_on_commit=False))
+
+        assert await fetch_all(sync_app) == await fetch_all(async_app), "async routes differ from the sync routes"
+
+        print("\n" + "=" * 84)
+        print(f"Read route load test: sync threadpool vs async engine ({REQUESTS} requests per run)")
+        print("=" * 84)
+        print(f"{'concurrency':>11} | {'sync req/s':>10} {'p50 ms':>8} {'p95 ms':>8} | "
+              f"{'async req/s':>11} {'p50 ms':>8} {'p95 ms':>8}")
+        print("-" * 84)
+
+        try:
+            for concurrency in CONCURRENCY:
+                results = []
+                for app in (sync_app, async_app):
+                    # Both apps start from warm caches filled by the parity check
+                    results.extend(await load(app, concurrency))
+                print(f"{concurrency:>11} | {results[0]:>10.1f} {results[1]:>8.2f} {results[2]:>8.2f} | "
+                      f"{results[3]:>11.1f} {results[4]:>8.2f} {results[5]:>8.2f}")
+        finally:
+            get_membership_cache().clear()
+            get_group_slug_cache().clear()
+            await async_engine.dispose()
+            engine.dispose()
+
+    print("=" * 84)
+
+
+if __name__ == "__main__":
+    asyncio.run(run_benchmark())
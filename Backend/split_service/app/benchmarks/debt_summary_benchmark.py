@@ -0,0 +1,213 @@
+"""
+Benchmark for the group debt summary.
+
+Compares the legacy per-member implementation (four aggregate queries per
+member) with the single-statement balance engine and the materialized
+ledger read in app.services.balance_service, reporting query count and
+latency as the member count grows.
+
+Run this module directly against an in-memory SQLite database:
+    python -m app.benchmarks.debt_summary_benchmark
+"""
+
+import random
+import time
+from datetime import datetime
+from decimal import Decimal
+from typing import Callable, List, Tuple
+
+from sqlalchemy import and_, create_engine, event, func
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.db.database import Base
+from app.models.expenses import Expense, ExpenseShare
+from app.models.groups import Group, GroupMember
+from app.models.settlements import Settlement
+from app.schemas.expense_schema import DebtSummary
+from app.services.balance_service import (
+    compute_group_balances,
+    read_group_balances,
+    reconcile_group_balances
+)
+
+
+MEMBER_COUNTS = [10, 50, 100, 200]
+EXPENSES_PER_MEMBER = 5
+REPEATS = 3
+
+
+def legacy_debt_summary(db: Session, group_id: str) -> List[DebtSummary]:
+    """Reference implementation issuing four aggregate queries per member."""
+    members = db.query(GroupMember).filter(GroupMember.group_id == group_id).all()
+    summary = []
+
+    for member in members:
+        user_id = member.user_id
+
+        total_owed = db.query(func.sum(ExpenseShare.share_amount))\
+            .select_from(ExpenseShare)\
+            .join(Expense, ExpenseShare.expense_id == Expense.id)\
+            .filter(
+                and_(
+                    Expense.group_id == group_id,
+                    Expense.paid_by == user_id,
+                    ExpenseShare.is_settled == False
+                )
+            ).scalar() or Decimal('0')
+
+        total_owes = db.query(func.sum(ExpenseShare.share_amount))\
+            .select_from(ExpenseShare)\
+            .join(Expense, ExpenseShare.expense_id == Expense.id)\
+            .filter(
+                and_(
+                    Expense.group_id == group_id,
+                    Expense.paid_by != user_id,
+                    ExpenseShare.user_id == user_id,
+                    ExpenseShare.is_settled == False
+                )
+            ).scalar() or Decimal('0')
+
+        settlements_received = db.query(func.sum(Settlement.amount))\
+            .filter(
+                and_(Settlement.group_id == group_id, Settlement.to_user_id == user_id)
+            ).scalar() or Decimal('0')
+
+        settlements_paid = db.query(func.sum(Settlement.amount))\
+            .filter(
+                and_(Settlement.group_id == group_id, Settlement.from_user_id == user_id)
+            ).scalar() or Decimal('0')
+
+        net_balance = (total_owed - settlements_received) - (total_owes - settlements_paid)
+
+        summary.append(DebtSummary(
+            user_id=user_id,
+            total_owed=total_owed,
+            total_owes=total_owes,
+            net_balance=net_balance
+        ))
+
+    return summary
+
+
+def seed_group(db: Session, member_count: int, rng: random.Random) -> str:
+    """Create a group with members, equally split expenses and a few settlements."""
+    group = Group(name=f"Bench {member_count}", slug=f"bench-{member_count}", created_by="user-0")
+    db.add(group)
+    db.flush()
+
+    users = [f"user-{i}" for i in range(member_count)]
+    db.add_all(GroupMember(group_id=group.id, user_id=user_id) for user_id in users)
+
+    for _ in range(member_count * EXPENSES_PER_MEMBER):
+        payer = rng.choice(users)
+        participants = rng.sample(users, k=min(len(users), rng.randint(2, 6)))
+        share = Decimal(rng.randint(100, 10000)) / 100
+        expense = Expense(
+            group_id=group.id,
+            group_category_id="bench",
+            title="Bench expense",
+            amount=share * len(participants),
+            paid_by=payer,
+            date=datetime.utcnow()
+        )
+        db.add(expense)
+        db.flush()
+        db.add_all(
+            ExpenseShare(
+                expense_id=expense.id,
+                user_id=participant,
+                share_amount=share,
+                is_settled=rng.random() < 0.1
+            )
+            for participant in participants
+        )
+
+    for _ in range(member_count):
+        from_user, to_user = rng.sample(users, k=2)
+        db.add(Settlement(
+            group_id=group.id,
+            from_user_id=from_user,
+            to_user_id=to_user,
+            amount=Decimal(rng.randint(100, 5000)) / 100
+        ))
+
+    db.commit()
+    return group.id
+
+
+def measure(
+    db: Session,
+    counter: List[int],
+    func_: Callable[[Session, str], List[DebtSummary]],
+    group_id: str
+) -> Tuple[List[DebtSummary], int, float]:
+    """Return (result, query count, best latency in ms) for one implementation."""
+    best = float("inf")
+    result: List[DebtSummary] = []
+    queries = 0
+    for _ in range(REPEATS):
+        db.expire_all()
+        counter[0] = 0
+        start = time.perf_counter()
+        result = func_(db, group_id)
+        best = min(best, time.perf_counter() - start)
+        queries = counter[0]
+    return result, queries, best * 1000
+
+
+def run_benchmark():
+    """Print query count and latency of each implementation per member count."""
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool
+    )
+    Base.metadata.create_all(bind=engine)
+    session_factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+    counter = [0]
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def count_query(conn, cursor, statement, parameters, context, executemany):
+        counter[0] += 1
+
+    rng = random.Random(42)
+
+    print("\n" + "=" * 92)
+    print("Debt summary benchmark: legacy per-member queries vs single statement vs ledger")
+    print("=" * 92)
+    print(f"{'members':>8} {'expenses':>9} | {'legacy q':>9} {'legacy ms':>10} | "
+          f"{'engine q':>9} {'engine ms':>10} | {'ledger q':>9} {'ledger ms':>10}")
+    print("-" * 92)
+
+    db = session_factory()
+    try:
+        for member_count in MEMBER_COUNTS:
+            group_id = seed_group(db, member_count, rng)
+
+            legacy, legacy_queries, legacy_ms = measure(db, counter, legacy_debt_summary, group_id)
+            engine_result, engine_queries, engine_ms = measure(db, counter, compute_group_balances, group_id)
+
+            # Seeding bypasses the services, so materialize the ledger from history first
+            reconcile_group_balances(db, group_id, repair=True)
+            ledger_result, ledger_queries, ledger_ms = measure(db, counter, read_group_balances, group_id)
+
+            legacy_map = {debt.user_id: debt for debt in legacy}
+            for debt in engine_result + ledger_result:
+                expected = legacy_map[debt.user_id]
+                assert debt.net_balance == expected.net_balance, \
+                    f"Mismatch for {debt.user_id}: {debt.net_balance} != {expected.net_balance}"
+
+            print(f"{member_count:>8} {member_count * EXPENSES_PER_MEMBER:>9} | "
+                  f"{legacy_queries:>9} {legacy_ms:>10.2f} | "
+                  f"{engine_queries:>9} {engine_ms:>10.2f} | "
+                  f"{ledger_queries:>9} {ledger_ms:>10.2f}")
+    finally:
+        db.close()
+
+    print("=" * 92)
+
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,167 @@
+"""
+Micro-benchmark for the integer-cents Min-Cash-Flow implementation.
+
+Compares calculate_balances() and min_cash_flow() from app.utils.min_cash_flow,
+which convert amounts to integer cents once and run on ints, with the
+previous Decimal implementations that quantize on every update. When NumPy
+is installed, calculate_balances(vectorized=True) is timed as well. The
+previous calculate_balances() rounded every share on its own and could lose
+or create cents, so it only serves as a timing reference; each run asserts
+the current balances sum to exactly zero, that both current implementations
+agree, and that settlements match the Decimal reference before reporting the
+speedup.
+
+Run this module directly:
+    python -m app.benchmarks.min_cash_flow_benchmark
+"""
+
+import random
+import time
+from decimal import Decimal
+from typing import Callable, Dict, List, Tuple
+
+from app.utils import min_cash_flow as min_cash_flow_module
+from app.utils.min_cash_flow import calculate_balances, min_cash_flow, round_decimal, validate_balance_sum
+
+
+SCENARIOS = [(10, 1000), (50, 10000), (200, 50000), (1000, 100000)]
+REPEATS = 3
+
+
+def legacy_calculate_balances(expenses: List[Dict], tolerance: Decimal = Decimal('0.01')) -> Dict[str, Decimal]:
+    """Previous Decimal implementation quantizing every share on its own (timing reference only)."""
+    balances: Dict[str, Decimal] = {}
+    for expense in expenses:
+        payer = expense["payer"]
+        amount = Decimal(str(expense["amount"]))
+        participants = expense["participants"]
+        weights = expense.get("weights")
+        if payer not in balances:
+            balances[payer] = Decimal('0')
+        if weights:
+            weight_sum = sum(Decimal(str(w)) for w in weights.values())
+            if abs(weight_sum - Decimal('1.0')) > tolerance:
+                raise ValueError(f"Weights must sum to 1.0, got {weight_sum}")
+            if set(weights.keys()) != set(participants):
+                raise ValueError("All participants must have weights")
+            for participant in participants:
+                if participant not in balances:
+                    balances[participant] = Decimal('0')
+                balances[participant] -= round_decimal(amount * Decimal(str(weights[participant])))
+        else:
+            share_per_person = round_decimal(amount / Decimal(str(len(participants))))
+            for participant in participants:
+                if participant not in balances:
+                    balances[participant] = Decimal('0')
+                balances[participant] -= share_per_person
+        balances[payer] = round_decimal(balances[payer] + amount)
+    return {user_id: round_decimal(balance) for user_id, balance in balances.items()}
+
+
+def legacy_min_cash_flow(balances: Dict[str, Decimal], tolerance: Decimal = Decimal('0.01')) -> List[Dict]:
+    """Reference Decimal greedy matching."""
+    validate_balance_sum(balances, tolerance)
+    creditors = sorted(
+        ((user_id, balance) for user_id, balance in balances.items() if balance > tolerance),
+        key=lambda x: x[1], reverse=True
+    )
+    debtors = sorted(
+        ((user_id, -balance) for user_id, balance in balances.items() if balance < -tolerance),
+        key=lambda x: x[1], reverse=True
+    )
+    settlements = []
+    i, j = 0, 0
+    while i < len(creditors) and j < len(debtors):
+        creditor_id, credit_amount = creditors[i]
+        debtor_id, debt_amount = debtors[j]
+        settlement_amount = min(credit_amount, debt_amount)
+        if settlement_amount > tolerance:
+            settlements.append({"from": debtor_id, "to": creditor_id, "amount": round_decimal(settlement_amount)})
+        credit_amount = round_decimal(credit_amount - settlement_amount)
+        debt_amount = round_decimal(debt_amount - settlement_amount)
+        creditors[i] = (creditor_id, credit_amount)
+        debtors[j] = (debtor_id, debt_amount)
+        if credit_amount <= tolerance:
+            i += 1
+        if debt_amount <= tolerance:
+            j += 1
+    return settlements
+
+
+def generate_expenses(member_count: int, expense_count: int, rng: random.Random) -> List[Dict]:
+    """Generate equal and weighted split expenses with amounts in whole cents."""
+    users = [f"user-{i}" for i in range(member_count)]
+    expenses = []
+    for _ in range(expense_count):
+        participants = rng.sample(users, k=min(member_count, rng.randint(2, 8)))
+        expense = {
+            "payer": rng.choice(users),
+            "amount": Decimal(rng.randint(100, 500000)) / 100,
+            "participants": participants,
+        }
+        if rng.random() < 0.2:
+            # Quarter weights sum to exactly 1.0
+            quarters = [1] * len(participants)
+            for _ in range(4 * len(participants) - len(participants)):
+                quarters[rng.randrange(len(participants))] += 1
+            total = sum(quarters)
+            expense["weights"] = {
+                participant: Decimal(quarter) / Decimal(total)
+                for participant, quarter in zip(participants, quarters)
+            }
+        expenses.append(expense)
+    return expenses
+
+
+def best_time(func: Callable, *args) -> Tuple[object, float]:
+    """Return (result, best latency in ms) over REPEATS runs."""
+    best = float("inf")
+    result = None
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        result = func(*args)
+        best = min(best, time.perf_counter() - start)
+    return result, best * 1000
+
+
+def run_benchmark():
+    """Print latency of the Decimal and integer-cents implementations per scenario."""
+    rng = random.Random(42)
+
+    numpy_available = min_cash_flow_module.np is not None
+
+    print("\n" + "=" * 110)
+    print("Min-Cash-Flow benchmark: Decimal reference vs integer cents")
+    print("=" * 110)
+    print(f"{'members':>8} {'expenses':>9} | {'balances dec':>12} {'balances int':>12} {'balances np':>11} "
+          f"{'speedup':>8} | {'settle dec':>10} {'settle int':>10} {'speedup':>8}")
+    print("-" * 110)
+
+    for member_count, expense_count in SCENARIOS:
+        expenses = generate_expenses(member_count, expense_count, rng)
+
+        _, legacy_balance_ms = best_time(legacy_calculate_balances, expenses)
+        balances, balance_ms = best_time(calculate_balances, expenses)
+        assert sum(balances.values()) == 0, "calculate_balances does not conserve cents"
+
+        numpy_column = f"{'-':>11}"
+        if numpy_available:
+            numpy_balances, numpy_ms = best_time(lambda e: calculate_balances(e, vectorized=True), expenses)
+            assert numpy_balances == balances, "vectorized calculate_balances differs from the pure Python path"
+            numpy_column = f"{numpy_ms:>11.2f}"
+        best_balance_ms = min(balance_ms, numpy_ms) if numpy_available else balance_ms
+
+        legacy_settlements, legacy_settle_ms = best_time(legacy_min_cash_flow, balances)
+        settlements, settle_ms = best_time(lambda b: min_cash_flow(b, max_iterations=10 * len(b)), balances)
+        assert settlements == legacy_settlements, "min_cash_flow differs from the Decimal reference"
+
+        print(f"{member_count:>8} {expense_count:>9} | "
+              f"{legacy_balance_ms:>12.2f} {balance_ms:>12.2f} {numpy_column} "
+              f"{legacy_balance_ms / best_balance_ms:>7.1f}x | "
+              f"{legacy_settle_ms:>10.2f} {settle_ms:>10.2f} {legacy_settle_ms / settle_ms:>7.1f}x")
+
+    print("=" * 110)
+
+
+if __name__ == "__main__":
+    run_benchmark()
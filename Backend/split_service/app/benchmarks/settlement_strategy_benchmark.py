@@ -0,0 +1,86 @@
+"""
+Benchmark for the Min-Cash-Flow settlement strategies.
+
+Compares the greedy and optimal strategies of app.utils.min_cash_flow on
+generated groups, reporting the average number of transactions and the
+average runtime as the number of members with a non-zero balance grows.
+
+Groups are built from a few independent sub-groups whose balances cancel
+out, which is where greedy matching spends extra transfers.
+
+Run this module directly:
+    python -m app.benchmarks.settlement_strategy_benchmark
+"""
+
+import random
+import time
+from decimal import Decimal
+from typing import Dict, List
+
+from app.utils.min_cash_flow import min_cash_flow
+
+
+MEMBER_COUNTS = [4, 8, 12, 16, 20]
+GROUPS_PER_SIZE = 10
+
+
+def generate_balances(member_count: int, rng: random.Random) -> Dict[str, Decimal]:
+    """Generate zero-sum balances made of several sub-groups that cancel exactly."""
+    balances: Dict[str, Decimal] = {}
+    user_index = 0
+    while user_index < member_count:
+        remaining = member_count - user_index
+        # Never leave a single member for the last sub-group
+        size = remaining if remaining <= 5 else rng.randint(2, min(5, remaining - 2))
+        values: List[Decimal] = [Decimal(rng.randint(100, 20000)) / 100 * rng.choice([1, -1]) for _ in range(size - 1)]
+        values.append(-sum(values))
+        for value in values:
+            balances[f"user-{user_index}"] = value
+            user_index += 1
+
+    # Shuffle so sub-groups are not contiguous in the input
+    items = list(balances.items())
+    rng.shuffle(items)
+    return {user_id: value for user_id, value in items if value != 0}
+
+
+def run_benchmark():
+    """Print average transaction count and runtime of each strategy per group size."""
+    rng = random.Random(42)
+
+    print("\n" + "=" * 78)
+    print("Settlement strategy benchmark: greedy vs optimal")
+    print("=" * 78)
+    print(f"{'members':>8} | {'greedy tx':>10} {'greedy ms':>10} | "
+          f"{'optimal tx':>11} {'optimal ms':>11} | {'saved':>6}")
+    print("-" * 78)
+
+    for member_count in MEMBER_COUNTS:
+        greedy_tx = optimal_tx = 0
+        greedy_time = optimal_time = 0.0
+
+        for _ in range(GROUPS_PER_SIZE):
+            balances = generate_balances(member_count, rng)
+
+            start = time.perf_counter()
+            greedy = min_cash_flow(balances, strategy="greedy")
+            greedy_time += time.perf_counter() - start
+
+            start = time.perf_counter()
+            optimal = min_cash_flow(balances, strategy="optimal")
+            optimal_time += time.perf_counter() - start
+
+            assert len(optimal) <= len(greedy), "Optimal strategy used more transactions than greedy"
+            greedy_tx += len(greedy)
+            optimal_tx += len(optimal)
+
+        print(f"{member_count:>8} | {greedy_tx / GROUPS_PER_SIZE:>10.1f} "
+              f"{greedy_time / GROUPS_PER_SIZE * 1000:>10.3f} | "
+              f"{optimal_tx / GROUPS_PER_SIZE:>11.1f} {optimal_time / GROUPS_PER_SIZE * 1000:>11.3f} | "
+              f"{(greedy_tx - optimal_tx) / GROUPS_PER_SIZE:>6.1f}")
+
+    print("=" * 78)
+
+
+if __name__ == "__main__":
+    run_benchmark()
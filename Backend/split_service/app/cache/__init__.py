@@ -0,0 +1 @@
+# Cache module for split service
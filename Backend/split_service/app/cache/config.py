@@ -0,0 +1,56 @@
+from typing import Optional
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+class RedisConfig(BaseSettings):
+    """Redis configuration settings; caching stays in-process when host is unset"""
+
+    host: Optional[str] = None
+    port: int = 6379
+    password: Optional[str] = None
+    db: int = 0
+    max_connections: int = 20
+    socket_timeout: float = 5
+    socket_connect_timeout: float = 5
+
+    # Seconds to wait before reconnecting after Redis becomes unreachable
+    retry_interval: float = 30
+
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        env_prefix="REDIS_",
+        case_sensitive=False,
+        extra="ignore",
+    )
+
+
+class CacheConfig(BaseSettings):
+    """Cache sizes and lifetimes (seconds)"""
+
+    # Group membership: Redis hash per group, in-process LRU in front
+    membership_ttl: int = 300
+    membership_local_ttl: float = 30
+    membership_local_size: int = 1024
+
+    # Group slug resolution: in-process LRU, unknown slugs cached for less time
+    group_slug_ttl: float = 60
+    group_slug_negative_ttl: float = 10
+    group_slug_size: int = 4096
+
+    # User info from user_service: Redis string per user, in-process LRU in front;
+    # user.updated events invalidate both layers
+    user_info_ttl: int = 3600
+    user_info_local_ttl: float = 300
+    user_info_local_size: int = 4096
+
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        env_prefix="CACHE_",
+        case_sensitive=False,
+        extra="ignore",
+    )
+
+
+# Global config instances
+redis_config = RedisConfig()
+cache_config = CacheConfig()
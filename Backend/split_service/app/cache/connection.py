@@ -0,0 +1,73 @@
+"""Redis connection management"""
+import logging
+import threading
+import time
+from app.cache.config import redis_config
+
+# Redis is optional; without the client library every cache stays in-process
+try:
+    import redis
+except ImportError:
+    redis = None
+
+logger = logging.getLogger(__name__)
+
+
+class RedisConnection:
+    """
+    Lazily connected Redis client shared by the caches.
+
+    The client is created on first use and reused afterwards. When Redis
+    cannot be reached, callers get None and no new connection is attempted
+    for redis_config.retry_interval seconds, so an outage costs one timeout
+    rather than one per request.
+    """
+
+    def __init__(self):
+        self.client = None
+        self._retry_at = 0.0
+        self._lock = threading.Lock()
+
+    def get_client(self):
+        """Return the Redis client, or None if Redis is disabled or unreachable"""
+        if self.client is not None:
+            return self.client
+        if redis is None or not redis_config.host or time.monotonic() < self._retry_at:
+            return None
+
+        with self._lock:
+            if self.client is None and time.monotonic() >= self._retry_at:
+                try:
+                    client = redis.Redis(
+                        host=redis_config.host,
+                        port=redis_config.port,
+                        password=redis_config.password,
+                        db=redis_config.db,
+                        max_connections=redis_config.max_connections,
+                        socket_timeout=redis_config.socket_timeout,
+                        socket_connect_timeout=redis_config.socket_connect_timeout,
+                        decode_responses=True
+                    )
+                    client.ping()
+                    self.client = client
+                    logger.info(f"Connected to Redis at {redis_config.host}:{redis_config.port}")
+                except Exception as e:
+                    logger.error(f"Failed to connect to Redis: {e}")
+                    self._retry_at = time.monotonic() + redis_config.retry_interval
+        return self.client
+
+    def mark_failed(self, error: Exception):
+        """Drop the client after a failed command and back off before reconnecting"""
+        logger.warning(f"Redis command failed, caching in-process only for now: {error}")
+        with self._lock:
+            self.client = None
+            self._retry_at = time.monotonic() + redis_config.retry_interval
+
+
+# Global connection instance
+_redis_connection = RedisConnection()
+
+
+def get_redis_connection() -> RedisConnection:
+    """Get the shared Redis connection"""
+    return _redis_connection
@@ -0,0 +1,106 @@
+"""
+Group slug resolution cache
+
+Every group route starts by resolving the slug in its URL. The cache maps
+slug -> GroupRef (id, rounding_option, created_by) in an in-process TTL+LRU
+cache. Unknown slugs are cached too, for a shorter time, so scanning random
+slugs does not turn into one query per request.
+
+create_group, update_group and delete_group invalidate the affected slugs
+after commit. Other processes may resolve a renamed or deleted slug for up
+to cache_config.group_slug_ttl seconds, or keep reporting a newly created
+slug as unknown for up to cache_config.group_slug_negative_ttl seconds.
+"""
+import threading
+from typing import Dict, NamedTuple, Optional
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from app.cache.config import cache_config
+from app.cache.lru import LRUCache, MISSING
+from app.models.groups import Group, RoundingOption
+
+
+def _ref_statement(slug: str):
+    return select(Group.id, Group.rounding_option, Group.created_by).where(Group.slug == slug)
+
+
+class GroupRef(NamedTuple):
+    """The group columns routes need after resolving a slug"""
+    id: str
+    rounding_option: RoundingOption
+    created_by: str
+
+
+class GroupSlugCache:
+    """TTL+LRU cache of slug -> GroupRef with negative caching"""
+
+    def __init__(self):
+        self.local = LRUCache(cache_config.group_slug_size, cache_config.group_slug_ttl)
+        self._counters = {"hits": 0, "negative_hits": 0, "misses": 0}
+        self._counter_lock = threading.Lock()
+
+    def _count(self, counter: str):
+        with self._counter_lock:
+            self._counters[counter] += 1
+
+    def get(self, db: Session, slug: str) -> Optional[GroupRef]:
+        """Return the group a slug points to, or None if there is none"""
+        ref = self._cached(slug)
+        if ref is MISSING:
+            ref = self._store(slug, db.execute(_ref_statement(slug)).first())
+        return ref
+
+    async def get_async(self, db: AsyncSession, slug: str) -> Optional[GroupRef]:
+        """Async counterpart of get()"""
+        ref = self._cached(slug)
+        if ref is MISSING:
+            ref = self._store(slug, (await db.execute(_ref_statement(slug))).first())
+        return ref
+
+    def _cached(self, slug: str):
+        """Return the cached GroupRef, None for a known unknown slug, or MISSING"""
+        ref = self.local.get(slug)
+        if ref is MISSING:
+            self._count("misses")
+        else:
+            self._count("hits" if ref is not None else "negative_hits")
+        return ref
+
+    def _store(self, slug: str, row) -> Optional[GroupRef]:
+        """Cache the result of a slug lookup, including a miss"""
+        if row is None:
+            self.local.set(slug, None, ttl=cache_config.group_slug_negative_ttl)
+            return None
+
+        ref = GroupRef(*row)
+        self.local.set(slug, ref)
+        return ref
+
+    def invalidate(self, *slugs: str):
+        """Forget slugs whose group was created, renamed, updated or deleted"""
+        for slug in slugs:
+            self.local.delete(slug)
+
+    def stats(self) -> Dict[str, int]:
+        """Return hit/miss counters since startup"""
+        with self._counter_lock:
+            stats = dict(self._counters)
+        stats["local_size"] = len(self.local)
+        return stats
+
+    def clear(self):
+        """Drop every entry and reset counters"""
+        self.local.clear()
+        with self._counter_lock:
+            for counter in self._counters:
+                self._counters[counter] = 0
+
+
+# Global cache instance
+_group_slug_cache = GroupSlugCache()
+
+
+def get_group_slug_cache() -> GroupSlugCache:
+    """Get the shared group slug cache"""
+    return _group_slug_cache
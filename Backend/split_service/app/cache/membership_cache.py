@@ -0,0 +1,214 @@
+"""
+Group membership cache
+
+Membership and admin checks run before nearly every group operation. The
+cache keeps each group's full roster (user_id -> is_admin) in two layers:
+
+1. An in-process LRU, answering repeated checks without any I/O
+2. A Redis hash per group (split:group:{group_id}:members), shared by all
+   workers and filled from one GroupMember query on a miss
+
+Membership changes call invalidate(), which clears both layers and bumps
+the group's generation. A reader notes the generation before querying the
+database and only stores the roster if it is unchanged, so a roster loaded
+just before a membership change is never written back after the
+invalidation. Other processes may keep serving their own LRU copy for up to
+cache_config.membership_local_ttl seconds, and every Redis hash expires
+after cache_config.membership_ttl seconds as a safety net.
+"""
+import asyncio
+import threading
+from typing import Dict, Optional, Tuple
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from app.cache.config import cache_config
+from app.cache.connection import get_redis_connection
+from app.cache.lru import LRUCache, MISSING
+from app.models.groups import GroupMember
+
+# Stored in every roster hash so a group without members is still a cache hit
+_LOADED_FIELD = ""
+
+
+# Replaces the roster hash only if the group's generation is unchanged
+# KEYS: roster hash, generation; ARGV: expected generation ("" if unset), ttl, field/value pairs
+_STORE_IF_CURRENT_SCRIPT = """
+if (redis.call('GET', KEYS[2]) or '') ~= ARGV[1] then
+    return 0
+end
+redis.call('DEL', KEYS[1])
+redis.call('HSET', KEYS[1], unpack(ARGV, 3))
+redis.call('EXPIRE', KEYS[1], ARGV[2])
+return 1
+"""
+
+
+def _members_key(group_id: str) -> str:
+    return f"split:group:{group_id}:members"
+
+
+def _generation_key(group_id: str) -> str:
+    return f"split:group:{group_id}:members:generation"
+
+
+def _roster_statement(group_id: str):
+    return select(GroupMember.user_id, GroupMember.is_admin).where(GroupMember.group_id == group_id)
+
+
+class MembershipCache:
+    """Two-level cache of group rosters with hit/miss counters"""
+
+    def __init__(self):
+        self.local = LRUCache(cache_config.membership_local_size, cache_config.membership_local_ttl)
+        self._counters = {"local_hits": 0, "redis_hits": 0, "misses": 0}
+        self._counter_lock = threading.Lock()
+        # Bumped by every invalidate() in this process
+        self._local_generation = 0
+
+    def _count(self, counter: str):
+        with self._counter_lock:
+            self._counters[counter] += 1
+
+    def get_members(self, db: Session, group_id: str) -> Dict[str, bool]:
+        """Return the roster of a group as user_id -> is_admin"""
+        members = self._cached(group_id)
+        if members is None:
+            generation = self._generation(group_id)
+            members = {user_id: bool(is_admin) for user_id, is_admin in db.execute(_roster_statement(group_id))}
+            self._store(group_id, members, generation)
+        return members
+
+    async def get_members_async(self, db: AsyncSession, group_id: str) -> Dict[str, bool]:
+        """
+        Async counterpart of get_members().
+
+        Local hits are answered inline. The blocking Redis calls run in a
+        worker thread, so a slow or unreachable Redis never stalls the event
+        loop.
+        """
+        members = self._cached_local(group_id)
+        if members is None:
+            members = await asyncio.to_thread(self._cached_remote, group_id)
+        if members is None:
+            generation = await asyncio.to_thread(self._generation, group_id)
+            result = await db.execute(_roster_statement(group_id))
+            members = {user_id: bool(is_admin) for user_id, is_admin in result}
+            await asyncio.to_thread(self._store, group_id, members, generation)
+        return members
+
+    def _cached(self, group_id: str) -> Optional[Dict[str, bool]]:
+        """Look the roster up in the local layer, then in Redis; None on a miss"""
+        members = self._cached_local(group_id)
+        if members is None:
+            members = self._cached_remote(group_id)
+        return members
+
+    def _cached_local(self, group_id: str) -> Optional[Dict[str, bool]]:
+        """Look the roster up in the in-process layer only"""
+        members = self.local.get(group_id)
+        if members is MISSING:
+            return None
+        self._count("local_hits")
+        return members
+
+    def _cached_remote(self, group_id: str) -> Optional[Dict[str, bool]]:
+        """Look the roster up in Redis (blocking); None on a miss"""
+        connection = get_redis_connection()
+        client = connection.get_client()
+        if client is not None:
+            try:
+                cached = client.hgetall(_members_key(group_id))
+            except Exception as e:
+                connection.mark_failed(e)
+                cached = None
+            if cached:
+                cached.pop(_LOADED_FIELD, None)
+                members = {user_id: flag == "1" for user_id, flag in cached.items()}
+                self.local.set(group_id, members)
+                self._count("redis_hits")
+                return members
+
+        self._count("misses")
+        return None
+
+    def _generation(self, group_id: str) -> Tuple[int, Optional[str]]:
+        """Note the group's generation before its roster is read from the database
+
+        Returns the local generation and the Redis one ("" if never
+        invalidated, None if Redis is unavailable).
+        """
+        local_generation = self._local_generation
+        connection = get_redis_connection()
+        client = connection.get_client()
+        if client is None:
+            return local_generation, None
+        try:
+            return local_generation, client.get(_generation_key(group_id)) or ""
+        except Exception as e:
+            connection.mark_failed(e)
+            return local_generation, None
+
+    def _store(self, group_id: str, members: Dict[str, bool], generation: Tuple[int, Optional[str]]):
+        """Fill both layers with a roster read from the database, unless it was invalidated meanwhile"""
+        local_generation, redis_generation = generation
+        if local_generation == self._local_generation:
+            self.local.set(group_id, members)
+
+        connection = get_redis_connection()
+        client = connection.get_client()
+        if client is None or redis_generation is None:
+            return
+        pairs = [_LOADED_FIELD, "1"]
+        for user_id, is_admin in members.items():
+            pairs.extend([user_id, "1" if is_admin else "0"])
+        try:
+            client.eval(
+                _STORE_IF_CURRENT_SCRIPT, 2, _members_key(group_id), _generation_key(group_id),
+                redis_generation, cache_config.membership_ttl, *pairs
+            )
+        except Exception as e:
+            connection.mark_failed(e)
+
+    def invalidate(self, group_id: str):
+        """Forget the roster of a group after its membership changed"""
+        with self._counter_lock:
+            self._local_generation += 1
+        self.local.delete(group_id)
+
+        connection = get_redis_connection()
+        client = connection.get_client()
+        if client is None:
+            return
+        try:
+            pipe = client.pipeline()
+            pipe.incr(_generation_key(group_id))
+            # Outlives any roster load in flight
+            pipe.expire(_generation_key(group_id), cache_config.membership_ttl)
+            pipe.delete(_members_key(group_id))
+            pipe.execute()
+        except Exception as e:
+            connection.mark_failed(e)
+
+    def stats(self) -> Dict[str, int]:
+        """Return hit/miss counters since startup"""
+        with self._counter_lock:
+            stats = dict(self._counters)
+        stats["local_size"] = len(self.local)
+        return stats
+
+    def clear(self):
+        """Drop the in-process layer and reset counters"""
+        self.local.clear()
+        with self._counter_lock:
+            for counter in self._counters:
+                self._counters[counter] = 0
+
+
+# Global cache instance
+_membership_cache = MembershipCache()
+
+
+def get_membership_cache() -> MembershipCache:
+    """Get the shared membership cache"""
+    return _membership_cache
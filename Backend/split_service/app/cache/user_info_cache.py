@@ -0,0 +1,188 @@
+"""
+User info cache
+
+Group detail views enrich every member with name, avatar and card details
+from user_service. The cache keeps each user's UserInfo in two layers:
+
+1. An in-process LRU, answering repeated views without any I/O
+2. A Redis string per user (split:user:{user_id}:info), shared by all workers
+   and read for a whole group with one MGET
+
+Only the ids missing from both layers are requested over RPC. user_service
+publishes a user.updated event when a profile changes; every split_service
+process consumes it (see app.rabbitmq.user_events) and calls invalidate(),
+which also bumps the user's generation. Callers note the generations before
+sending the RPC and set_many() skips every user invalidated since, so an
+answer that was in flight during the update never overwrites it.
+If an event is lost, entries still expire after cache_config.user_info_ttl
+seconds (cache_config.user_info_local_ttl in the LRU).
+"""
+import threading
+from typing import Dict, Iterable, List, Optional, Tuple
+from app.cache.config import cache_config
+from app.cache.connection import get_redis_connection
+from app.cache.lru import LRUCache, MISSING
+from app.schemas.group_schema import UserInfo
+
+
+# Sets each user's info only if their generation is unchanged
+# KEYS: generation/info key pairs; ARGV: ttl, then expected generation ("" if unset)/value pairs
+_SET_IF_CURRENT_SCRIPT = """
+local stored = 0
+for i = 1, #KEYS, 2 do
+    if (redis.call('GET', KEYS[i]) or '') == ARGV[i + 1] then
+        redis.call('SET', KEYS[i + 1], ARGV[i + 2], 'EX', ARGV[1])
+        stored = stored + 1
+    end
+end
+return stored
+"""
+
+
+def _user_key(user_id: str) -> str:
+    return f"split:user:{user_id}:info"
+
+
+def _generation_key(user_id: str) -> str:
+    return f"split:user:{user_id}:info:generation"
+
+
+class UserInfoCache:
+    """Two-level cache of user_id -> UserInfo with hit/miss counters"""
+
+    def __init__(self):
+        self.local = LRUCache(cache_config.user_info_local_size, cache_config.user_info_local_ttl)
+        self._counters = {"local_hits": 0, "redis_hits": 0, "misses": 0}
+        self._counter_lock = threading.Lock()
+        # Bumped by every invalidate() in this process
+        self._local_generation = 0
+
+    def _count(self, counter: str, amount: int = 1):
+        if amount:
+            with self._counter_lock:
+                self._counters[counter] += amount
+
+    def get_many(self, user_ids: Iterable[str]) -> Tuple[Dict[str, UserInfo], List[str]]:
+        """Return (cached user info by id, ids found in neither layer)"""
+        found: Dict[str, UserInfo] = {}
+        remote: List[str] = []
+        for user_id in user_ids:
+            info = self.local.get(user_id)
+            if info is MISSING:
+                remote.append(user_id)
+            else:
+                found[user_id] = info
+        self._count("local_hits", len(found))
+
+        missing = remote
+        connection = get_redis_connection()
+        client = connection.get_client()
+        if remote and client is not None:
+            try:
+                values = client.mget([_user_key(user_id) for user_id in remote])
+            except Exception as e:
+                connection.mark_failed(e)
+                values = [None] * len(remote)
+
+            missing = []
+            for user_id, value in zip(remote, values):
+                if value is None:
+                    missing.append(user_id)
+                    continue
+                info = UserInfo.model_validate_json(value)
+                self.local.set(user_id, info)
+                found[user_id] = info
+            self._count("redis_hits", len(remote) - len(missing))
+
+        self._count("misses", len(missing))
+        return found, missing
+
+    def generations(self, user_ids: List[str]) -> Tuple[int, Optional[Dict[str, str]]]:
+        """Note the users' generations before their info is requested
+
+        Returns the local generation and the Redis ones ("" if never
+        invalidated), or None for the latter while Redis is unavailable.
+        """
+        local_generation = self._local_generation
+        connection = get_redis_connection()
+        client = connection.get_client()
+        if client is None or not user_ids:
+            return local_generation, None
+        try:
+            values = client.mget([_generation_key(user_id) for user_id in user_ids])
+        except Exception as e:
+            connection.mark_failed(e)
+            return local_generation, None
+        return local_generation, {user_id: value or "" for user_id, value in zip(user_ids, values)}
+
+    def set_many(self, users: Dict[str, UserInfo], generations: Tuple[int, Optional[Dict[str, str]]]):
+        """Fill both layers with user info fetched from user_service
+
+        Users invalidated since generations() was called are left out.
+        """
+        if not users:
+            return
+        local_generation, redis_generations = generations
+        if local_generation == self._local_generation:
+            for user_id, info in users.items():
+                self.local.set(user_id, info)
+
+        connection = get_redis_connection()
+        client = connection.get_client()
+        if client is None or redis_generations is None:
+            return
+        keys, args = [], [cache_config.user_info_ttl]
+        for user_id, info in users.items():
+            if user_id not in redis_generations:
+                continue
+            keys.extend([_generation_key(user_id), _user_key(user_id)])
+            args.extend([redis_generations[user_id], info.model_dump_json()])
+        if not keys:
+            return
+        try:
+            client.eval(_SET_IF_CURRENT_SCRIPT, len(keys), *keys, *args)
+        except Exception as e:
+            connection.mark_failed(e)
+
+    def invalidate(self, user_id: str):
+        """Forget a user's info after their profile changed"""
+        with self._counter_lock:
+            self._local_generation += 1
+        self.local.delete(user_id)
+
+        connection = get_redis_connection()
+        client = connection.get_client()
+        if client is None:
+            return
+        try:
+            pipe = client.pipeline()
+            pipe.incr(_generation_key(user_id))
+            # Outlives any RPC in flight
+            pipe.expire(_generation_key(user_id), cache_config.user_info_ttl)
+            pipe.delete(_user_key(user_id))
+            pipe.execute()
+        except Exception as e:
+            connection.mark_failed(e)
+
+    def stats(self) -> Dict[str, int]:
+        """Return hit/miss counters since startup"""
+        with self._counter_lock:
+            stats = dict(self._counters)
+        stats["local_size"] = len(self.local)
+        return stats
+
+    def clear(self):
+        """Drop the in-process layer and reset counters"""
+        self.local.clear()
+        with self._counter_lock:
+            for counter in self._counters:
+                self._counters[counter] = 0
+
+
+# Global cache instance
+_user_info_cache = UserInfoCache()
+
+
+def get_user_info_cache() -> UserInfoCache:
+    """Get the shared user info cache"""
+    return _user_info_cache
@@ -0,0 +1,49 @@
+import os
+from typing import AsyncIterator, Optional
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+from app.db.database import DATABASE_URL, POOL_SETTINGS
+
+# Serve the read-heavy routes with async handlers on an async engine
+ASYNC_DB_ENABLED = os.getenv("DB_ASYNC_MODE", "false").lower() == "true"
+
+
+def to_async_url(url: str) -> str:
+    """Map a sync database URL to its async driver (asyncpg for Postgres, aiosqlite for SQLite)"""
+    scheme, separator, rest = url.partition("://")
+    if scheme.startswith("postgresql"):
+        return f"postgresql+asyncpg{separator}{rest}"
+    if scheme.startswith("sqlite"):
+        return f"sqlite+aiosqlite{separator}{rest}"
+    return url
+
+
+ASYNC_DATABASE_URL = os.getenv("ASYNC_DATABASE_URL") or to_async_url(DATABASE_URL)
+
+# Created on first use so the async drivers are only needed when async mode is on
+_async_engine: Optional[AsyncEngine] = None
+_async_session_factory: Optional[async_sessionmaker] = None
+
+
+def get_async_engine() -> AsyncEngine:
+    """Get or create the async engine, pooled like the sync engine"""
+    global _async_engine
+    if _async_engine is None:
+        if ASYNC_DATABASE_URL.startswith("postgresql"):
+            _async_engine = create_async_engine(ASYNC_DATABASE_URL, **POOL_SETTINGS)
+        else:
+            _async_engine = create_async_engine(ASYNC_DATABASE_URL)
+    return _async_engine
+
+
+def get_async_session_factory() -> async_sessionmaker:
+    """Get or create the AsyncSession factory"""
+    global _async_session_factory
+    if _async_session_factory is None:
+        # Rows are serialized after commit, so keep them loaded
+        _async_session_factory = async_sessionmaker(get_async_engine(), expire_on_commit=False)
+    return _async_session_factory
+
+
+async def get_async_db() -> AsyncIterator[AsyncSession]:
+    async with get_async_session_factory()() as db:
+        yield db
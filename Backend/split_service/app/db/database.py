@@ -5,9 +5,19 @@ from sqlalchemy.orm import sessionmaker, declarative_base
 # Get DATABASE_URL from environment, with fallback to SQLite for local development
 DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./app/db/split_service.db")
 
+# Connection pool sizing for Postgres; each worker process keeps its own pool,
+# so workers * (DB_POOL_SIZE + DB_MAX_OVERFLOW) must stay below max_connections
+POOL_SETTINGS = {
+    "pool_size": int(os.getenv("DB_POOL_SIZE", "10")),
+    "max_overflow": int(os.getenv("DB_MAX_OVERFLOW", "20")),
+    "pool_timeout": float(os.getenv("DB_POOL_TIMEOUT", "30")),
+    "pool_recycle": int(os.getenv("DB_POOL_RECYCLE", "1800")),
+    "pool_pre_ping": os.getenv("DB_POOL_PRE_PING", "true").lower() == "true",
+}
+
 # Create engine with appropriate connect_args based on database type
 if DATABASE_URL.startswith("postgresql"):
-    engine = create_engine(DATABASE_URL)
+    engine = create_engine(DATABASE_URL, **POOL_SETTINGS)
 else:
     # SQLite configuration
     engine = create_engine(DATABASE_URL, connect_args={"check_same_thread": False})
@@ -16,6 +26,19 @@ SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 Base = declarative_base()
 
+def create_missing_indexes(bind=None):
+    """
+    Create model indexes that are missing from existing tables.
+
+    create_all skips tables that already exist, so an index added to a model
+    later never reaches an existing database through it. Each index is
+    checked first and only created when absent.
+    """
+    bind = bind or engine
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=bind, checkfirst=True)
+
 def get_db():
     db = SessionLocal()
     try:
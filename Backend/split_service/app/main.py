@@ -1,13 +1,26 @@
 from fastapi import FastAPI
-from app.db.database import Base, engine
+import logging
+from app.db.database import Base, SessionLocal, create_missing_indexes, engine
+from app.db.async_database import ASYNC_DB_ENABLED
 from app.api.v1.routes.groups import router as groups_router
 from app.api.v1.routes.expenses import router as expenses_router
 from app.api.v1.routes.settlements import router as settlements_router
 from app.rabbitmq.setup import init_rabbitmq
-from app.rabbitmq.background_consumer import start_background_consumer
+from app.rabbitmq.background_consumer import start_background_consumer, start_async_consumers, stop_async_consumers
+from app.rabbitmq.config import rabbitmq_config
+from app.rabbitmq.rpc_client import close_rpc_client
+from app.rabbitmq.user_events import start_user_events_subscriber, stop_user_events_subscriber
 from app.services.pending_request_cleanup import start_pending_request_cleanup
+from app.cache.group_slug_cache import get_group_slug_cache
+from app.cache.membership_cache import get_membership_cache
+from app.cache.user_info_cache import get_user_info_cache
+from app.services.balance_service import backfill_group_balances
+
+logger = logging.getLogger(__name__)
 
 Base.metadata.create_all(bind=engine)
+# Indexes added to models after their tables were created (keyset pagination)
+create_missing_indexes()
 
 app = FastAPI(
     title="Split Service - Debt Management",
@@ -18,20 +31,61 @@ app = FastAPI(
 # Initialize RabbitMQ
 init_rabbitmq()
 
-# Start background consumer for async message processing
-start_background_consumer()
+if not rabbitmq_config.async_consumers:
+    # Start background consumer for async message processing
+    start_background_consumer()
+
+    # Invalidate cached user info when user_service reports profile changes
+    start_user_events_subscriber()
 
 # Start cleanup process for old pending requests
 start_pending_request_cleanup()
 
+if ASYNC_DB_ENABLED:
+    # Registered first so they take precedence over the matching sync routes
+    from app.api.v1.routes import async_routes
+    app.include_router(async_routes.groups_router)
+    app.include_router(async_routes.expenses_router)
+    app.include_router(async_routes.settlements_router)
+
 app.include_router(groups_router)
 app.include_router(expenses_router)
 app.include_router(settlements_router)
 
+@app.on_event("startup")
+def backfill_balances():
+    # Groups created before the balances ledger existed get their rows
+    # before this instance serves requests
+    with SessionLocal() as db:
+        backfilled = backfill_group_balances(db)
+    if backfilled:
+        logger.info(f"Backfilled group balances for {len(backfilled)} group(s)")
+
+@app.on_event("startup")
+async def startup():
+    if rabbitmq_config.async_consumers:
+        await start_async_consumers()
+
+@app.on_event("shutdown")
+async def shutdown():
+    if rabbitmq_config.async_consumers:
+        await stop_async_consumers()
+    else:
+        stop_user_events_subscriber()
+    close_rpc_client()
+
 @app.get("/")
 def read_root():
     return {"message": "Split Service API", "version": "1.0.0"}
 
 @app.get("/health")
 def health_check():
-    return {"status": "healthy"}
\ No newline at end of file
+    return {"status": "healthy"}
+
+@app.get("/health/cache")
+def cache_stats():
+    return {
+        "membership": get_membership_cache().stats(),
+        "group_slug": get_group_slug_cache().stats(),
+        "user_info": get_user_info_cache().stats(),
+    }
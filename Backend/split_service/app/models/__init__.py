@@ -1,3 +1,4 @@
 from .groups import Group, GroupMember, GroupCategory
 from .expenses import Expense, ExpenseShare
 from .settlements import Settlement
+from .balances import GroupBalance
@@ -0,0 +1,21 @@
+import uuid
+from sqlalchemy.sql import func
+from sqlalchemy import Column, String, DateTime, DECIMAL, Integer, ForeignKey, UniqueConstraint
+from app.db.database import Base
+
+
+class GroupBalance(Base):
+    """Running per-member balance of a group, maintained on every ledger write"""
+    __tablename__ = "group_balances"
+    __table_args__ = (
+        UniqueConstraint("group_id", "user_id", name="uq_group_balances_group_user"),
+    )
+
+    id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()), unique=True, nullable=False)
+    group_id = Column(String, ForeignKey("groups.id", ondelete="CASCADE"), nullable=False, index=True)
+    user_id = Column(String, nullable=False, index=True)  # Reference to user service
+    total_owed = Column(DECIMAL(12, 2), nullable=False, default=0)
+    total_owes = Column(DECIMAL(12, 2), nullable=False, default=0)
+    net_balance = Column(DECIMAL(12, 2), nullable=False, default=0)
+    version = Column(Integer, nullable=False, default=1)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
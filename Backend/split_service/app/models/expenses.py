@@ -1,11 +1,16 @@
 import uuid
 from sqlalchemy.sql import func
-from sqlalchemy import Column, String, DateTime, DECIMAL, Text, Boolean
+from sqlalchemy import Column, String, DateTime, DECIMAL, Text, Boolean, Index
+from sqlalchemy.orm import relationship
 from app.db.database import Base
 
 
 class Expense(Base):
     __tablename__ = "expenses"
+    __table_args__ = (
+        # Keyset pagination of a group's expenses by (created_at, id)
+        Index("ix_expenses_group_created_at_id", "group_id", "created_at", "id"),
+    )
 
     id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()), unique=True, nullable=False)
     group_id = Column(String, nullable=False, index=True)  # Reference to groups (no FK constraint)
@@ -18,9 +23,21 @@ class Expense(Base):
     date = Column(DateTime(timezone=True), nullable=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False, index=True)
 
+    # Read-only: there is no FK constraint, shares are written explicitly by expense_service
+    shares = relationship(
+        "ExpenseShare",
+        primaryjoin="Expense.id == foreign(ExpenseShare.expense_id)",
+        viewonly=True,
+        lazy="select",
+    )
+
 
 class ExpenseShare(Base):
     __tablename__ = "expense_shares"
+    __table_args__ = (
+        # Unsettled-share lookups per expense (settled filter, balances)
+        Index("ix_expense_shares_expense_id_is_settled", "expense_id", "is_settled"),
+    )
 
     id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()), unique=True, nullable=False)
     expense_id = Column(String, nullable=False, index=True)  # Reference to expenses
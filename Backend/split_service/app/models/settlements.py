@@ -1,11 +1,15 @@
 import uuid
 from sqlalchemy.sql import func
-from sqlalchemy import Column, String, DateTime, DECIMAL
+from sqlalchemy import Column, String, DateTime, DECIMAL, Index
 from app.db.database import Base
 
 
 class Settlement(Base):
     __tablename__ = "settlements"
+    __table_args__ = (
+        # Keyset pagination of a group's settlements by (settled_at, id)
+        Index("ix_settlements_group_settled_at_id", "group_id", "settled_at", "id"),
+    )
 
     id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()), unique=True, nullable=False)
     group_id = Column(String, nullable=False, index=True)  # Reference to groups
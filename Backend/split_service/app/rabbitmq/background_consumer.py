@@ -2,6 +2,8 @@ import asyncio
 import logging
 import threading
 from typing import Optional
+from app.rabbitmq.aio_consumer import AsyncRabbitMQConsumer
+from app.rabbitmq.config import rabbitmq_config
 from app.rabbitmq.consumer import get_rabbitmq_consumer
 
 logger = logging.getLogger(__name__)
@@ -104,3 +106,36 @@ def stop_background_consumer():
     """Stop the background consumer"""
     manager = get_background_consumer_manager()
     manager.stop_background_consumer()
+
+
+# Asyncio consumer used instead of the threads when RABBITMQ_ASYNC_CONSUMERS is set
+_async_consumer: Optional[AsyncRabbitMQConsumer] = None
+
+
+async def start_async_consumers():
+    """Consume user lookup responses and user events on the event loop"""
+    global _async_consumer
+    from app.rabbitmq.user_events import handle_user_event
+    from app.services.user_lookup_service import get_user_lookup_service
+
+    _async_consumer = AsyncRabbitMQConsumer()
+    _async_consumer.add_handler(
+        rabbitmq_config.user_lookup_response_queue,
+        get_user_lookup_service()._handle_user_lookup_response,
+    )
+    _async_consumer.add_handler(
+        "",
+        handle_user_event,
+        requeue_on_failure=False,
+        exchange=rabbitmq_config.user_events_exchange,
+        routing_key=rabbitmq_config.user_updated_routing_key,
+    )
+    await _async_consumer.start()
+
+
+async def stop_async_consumers():
+    """Stop the asyncio consumer, if it was started"""
+    global _async_consumer
+    if _async_consumer is not None:
+        await _async_consumer.stop()
+        _async_consumer = None
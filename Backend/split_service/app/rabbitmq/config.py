@@ -17,6 +17,11 @@ class RabbitMQConfig(BaseSettings):
     connection_attempts: int = int(os.getenv("RABBITMQ_CONNECTION_ATTEMPTS", "3"))
     retry_delay: float = float(os.getenv("RABBITMQ_RETRY_DELAY", "2.0"))
     heartbeat: int = int(os.getenv("RABBITMQ_HEARTBEAT", "600"))
+
+    # Asyncio consumers (aio-pika) on the event loop instead of consumer threads
+    async_consumers: bool = os.getenv("RABBITMQ_ASYNC_CONSUMERS", "false").lower() == "true"
+    prefetch_count: int = int(os.getenv("RABBITMQ_PREFETCH_COUNT", "10"))
+    consumer_concurrency: int = int(os.getenv("RABBITMQ_CONSUMER_CONCURRENCY", "10"))
     
     # Exchange settings
     user_lookup_exchange: str = "user.lookup.exchange"
@@ -25,6 +30,10 @@ class RabbitMQConfig(BaseSettings):
     # User info RPC (direct exchange)
     user_info_exchange: str = os.getenv("RABBITMQ_USER_INFO_EXCHANGE", "user_info_exchange")
     user_info_exchange_type: str = "direct"
+
+    # User events published by user_service (topic exchange)
+    user_events_exchange: str = os.getenv("RABBITMQ_USER_EVENTS_EXCHANGE", "user.events.exchange")
+    user_updated_routing_key: str = "user.updated"
     
     # Queue settings
     user_lookup_queue: str = "user.lookup.request.queue"
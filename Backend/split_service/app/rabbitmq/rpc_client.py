@@ -1,7 +1,9 @@
 import json
 import logging
+import threading
 import time
-from typing import Any, Dict, Optional
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from typing import Any, Callable, Dict, Optional
 from uuid import uuid4
 
 import pika
@@ -12,32 +14,100 @@ from .setup import RabbitMQSetup
 
 logger = logging.getLogger(__name__)
 
+# RabbitMQ pseudo-queue delivering replies straight to the consuming channel
+DIRECT_REPLY_TO = "amq.rabbitmq.reply-to"
 
-class RabbitMQRPCClient:
-    """Generic RabbitMQ RPC client using per-request exclusive reply queues."""
 
-    def __init__(self) -> None:
+class RabbitMQRPCClient:
+    """Long-lived RabbitMQ RPC client using direct reply-to.
+
+    One connection is owned by a background I/O thread, which consumes replies
+    from amq.rabbitmq.reply-to and performs every publish (a BlockingConnection
+    must only be used from the thread that drives it). Request threads hand
+    their publish over with add_callback_threadsafe() and wait on a Future
+    keyed by correlation id, so any number of concurrent calls share the
+    connection. If the connection drops, pending calls return None and the
+    next call reconnects.
+    """
+
+    def __init__(self, connection_factory: Optional[Callable[[], pika.BlockingConnection]] = None) -> None:
+        self._connection_factory = connection_factory or RabbitMQSetup().create_connection
         self.connection: Optional[pika.BlockingConnection] = None
         self.channel: Optional[pika.channel.Channel] = None
-        self._setup = RabbitMQSetup()
-        self._response: Optional[Dict[str, Any]] = None
-        self._corr_id: Optional[str] = None
+        self._pending: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._ready = threading.Event()
+        self._closing = False
+        self._retry_at = 0.0
+
+    def _ensure_started(self) -> bool:
+        """Start the I/O thread if it is not running; False while the broker is unreachable"""
+        with self._lock:
+            if self._thread and self._thread.is_alive() and self._ready.is_set():
+                return True
+            if time.monotonic() < self._retry_at:
+                return False
+
+            self._ready.clear()
+            self._closing = False
+            try:
+                self._connect()
+            except Exception as e:
+                logger.error(f"Failed to open RPC connection: {e}")
+                self._retry_at = time.monotonic() + rabbitmq_config.retry_delay
+                return False
+
+            self._thread = threading.Thread(target=self._run, daemon=True, name="RabbitMQ-RPC")
+            self._thread.start()
+            self._ready.set()
+            return True
 
     def _connect(self) -> None:
-        if self.connection and not self.connection.is_closed:
-            return
-        self.connection = self._setup.create_connection()
+        self.connection = self._connection_factory()
         self.channel = self.connection.channel()
+        # Direct reply-to requires auto_ack and publishing on this same channel
+        self.channel.basic_consume(
+            queue=DIRECT_REPLY_TO, on_message_callback=self._on_response, auto_ack=True
+        )
 
-    def _disconnect(self) -> None:
+    def _run(self) -> None:
+        """Drive the connection until close() or a connection error"""
+        connection = self.connection
         try:
-            if self.channel and not self.channel.is_closed:
-                self.channel.close()
+            while not self._closing:
+                connection.process_data_events(time_limit=0.2)
+        except Exception as e:
+            if not self._closing:
+                logger.error(f"RPC connection lost: {e}")
         finally:
-            if self.connection and not self.connection.is_closed:
-                self.connection.close()
-        self.connection = None
-        self.channel = None
+            self._ready.clear()
+            self._fail_pending()
+            try:
+                if not connection.is_closed:
+                    connection.close()
+            except Exception:
+                # Best-effort cleanup
+                pass
+
+    def _on_response(self, ch, method, props, body) -> None:
+        with self._lock:
+            future = self._pending.pop(props.correlation_id, None)
+        if future is None:
+            # Reply to a call that already timed out
+            logger.debug("Dropping RPC response for unknown correlation_id=%s", props.correlation_id)
+            return
+        try:
+            future.set_result(json.loads(body.decode("utf-8")))
+        except json.JSONDecodeError as e:
+            logger.error(f"Failed to decode RPC response JSON: {e}")
+            future.set_result(None)
+
+    def _fail_pending(self) -> None:
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        for future in pending.values():
+            future.set_result(None)
 
     def call(
         self,
@@ -48,97 +118,92 @@ class RabbitMQRPCClient:
     ) -> Optional[Dict[str, Any]]:
         """Perform an RPC call and wait synchronously for the response.
 
-        Returns the decoded JSON response dict, or None on timeout / failure.
+        Safe to call from several threads at once. Returns the decoded JSON
+        response dict, or None on timeout / failure.
         """
-        self._connect()
-        assert self.channel is not None
+        if not self._ensure_started():
+            return None
 
         timeout = timeout or rabbitmq_config.user_info_rpc_timeout
-        self._response = None
-        self._corr_id = str(uuid4())
-
-        # Declare a temporary exclusive, auto-delete queue for the reply
-        result = self.channel.queue_declare(queue="", exclusive=True, auto_delete=True)
-        callback_queue = result.method.queue
-
-        def on_response(ch, method, props, body):
-            try:
-                if props.correlation_id != self._corr_id:
-                    # Not our response; requeue for whoever is waiting
-                    ch.basic_nack(delivery_tag=method.delivery_tag, requeue=True)
-                    return
-                data = json.loads(body.decode("utf-8"))
-                self._response = data
-                ch.basic_ack(delivery_tag=method.delivery_tag)
-            except json.JSONDecodeError as e:
-                logger.error(f"Failed to decode RPC response JSON: {e}")
-                ch.basic_nack(delivery_tag=method.delivery_tag, requeue=False)
-            except Exception as e:
-                logger.error(f"Error handling RPC response: {e}", exc_info=True)
-                ch.basic_nack(delivery_tag=method.delivery_tag, requeue=True)
-
-        self.channel.basic_consume(
-            queue=callback_queue, on_message_callback=on_response, auto_ack=False
-        )
+        corr_id = str(uuid4())
+        future: Future = Future()
+        with self._lock:
+            self._pending[corr_id] = future
 
         body = json.dumps(payload)
         properties = pika.BasicProperties(
-            reply_to=callback_queue,
-            correlation_id=self._corr_id,
-            delivery_mode=2,
+            reply_to=DIRECT_REPLY_TO,
+            correlation_id=corr_id,
             content_type="application/json",
         )
 
+        def publish():
+            try:
+                self.channel.basic_publish(
+                    exchange=exchange,
+                    routing_key=routing_key,
+                    body=body,
+                    properties=properties,
+                )
+            except Exception as e:
+                logger.error(f"Failed to publish RPC request: {e}", exc_info=True)
+                with self._lock:
+                    self._pending.pop(corr_id, None)
+                future.set_result(None)
+
         logger.info(
             "Publishing RPC request to exchange=%s routing_key=%s correlation_id=%s",
             exchange,
             routing_key,
-            self._corr_id,
+            corr_id,
         )
 
         try:
-            self.channel.basic_publish(
-                exchange=exchange,
-                routing_key=routing_key,
-                body=body,
-                properties=properties,
-            )
+            self.connection.add_callback_threadsafe(publish)
+            return future.result(timeout=timeout)
+        except FutureTimeoutError:
+            logger.warning("RPC call timed out after %.2f seconds (corr_id=%s)", timeout, corr_id)
+            return None
         except Exception as e:
-            logger.error(f"Failed to publish RPC request: {e}", exc_info=True)
-            # Cleanup consumer before returning
-            self.channel.basic_cancel(consumer_tag=self.channel.consumer_tags[-1])
+            logger.error("RPC call failed (corr_id=%s): %s", corr_id, e)
             return None
-
-        start = time.time()
-        try:
-            while self._response is None:
-                elapsed = time.time() - start
-                if elapsed >= timeout:
-                    logger.warning(
-                        "RPC call timed out after %.2f seconds (corr_id=%s)",
-                        elapsed,
-                        self._corr_id,
-                    )
-                    break
-                # Process incoming data events for a short time slice
-                self.connection.process_data_events(time_limit=0.2)
         finally:
-            try:
-                # Cancel the consumer; queue is auto-deleted
-                # Use consumer_tags list if available, otherwise cancel all
-                if getattr(self.channel, "consumer_tags", None):
-                    for tag in list(self.channel.consumer_tags):
-                        self.channel.basic_cancel(consumer_tag=tag)
-            except Exception:
-                # Best-effort cleanup
-                pass
-            self._disconnect()
+            with self._lock:
+                self._pending.pop(corr_id, None)
 
-        return self._response
+    def pending_count(self) -> int:
+        """Number of calls waiting for a reply"""
+        with self._lock:
+            return len(self._pending)
 
+    def close(self) -> None:
+        """Stop the I/O thread and close the connection"""
+        self._closing = True
+        thread = self._thread
+        if thread and thread.is_alive() and thread is not threading.current_thread():
+            thread.join(timeout=5)
+        self._thread = None
 
-def get_rpc_client() -> RabbitMQRPCClient:
-    """Convenience accessor for creating a new RPC client instance."""
-    return RabbitMQRPCClient()
 
+# Global RPC client instance
+_rpc_client: Optional[RabbitMQRPCClient] = None
+_rpc_client_lock = threading.Lock()
 
+
+def get_rpc_client() -> RabbitMQRPCClient:
+    """Get the shared RPC client, creating it on first use."""
+    global _rpc_client
+    if _rpc_client is None:
+        with _rpc_client_lock:
+            if _rpc_client is None:
+                _rpc_client = RabbitMQRPCClient()
+    return _rpc_client
+
+
+def close_rpc_client() -> None:
+    """Close the shared RPC client, if one was created."""
+    global _rpc_client
+    with _rpc_client_lock:
+        if _rpc_client is not None:
+            _rpc_client.close()
+            _rpc_client = None
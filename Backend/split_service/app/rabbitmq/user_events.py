@@ -0,0 +1,128 @@
+import json
+import logging
+import threading
+import time
+from typing import Any, Dict, Optional
+
+import pika
+
+from app.cache.user_info_cache import get_user_info_cache
+from .config import rabbitmq_config
+from .setup import RabbitMQSetup
+
+logger = logging.getLogger(__name__)
+
+
+def handle_user_event(event: Dict[str, Any]) -> bool:
+    """Invalidate cached user info named by a user.updated event"""
+    user_id = event.get("user_id")
+    if not user_id:
+        logger.warning(f"Ignoring user event without user_id: {event}")
+        return False
+    get_user_info_cache().invalidate(user_id)
+    logger.info(f"Invalidated cached user info for {user_id} (fields={event.get('fields')})")
+    return True
+
+
+class UserEventsSubscriber:
+    """Consumes user.updated events to keep the user info cache fresh.
+
+    Every process binds its own exclusive, server-named queue to the user
+    events exchange, so each one clears its in-process cache layer.
+    """
+
+    def __init__(self):
+        self.connection: Optional[pika.BlockingConnection] = None
+        self.channel: Optional[pika.channel.Channel] = None
+        self.thread: Optional[threading.Thread] = None
+        self.is_running = False
+        self.setup = RabbitMQSetup()
+
+    def _on_message(self, ch, method, properties, body):
+        try:
+            handle_user_event(json.loads(body.decode("utf-8")))
+        except json.JSONDecodeError as e:
+            logger.error(f"Failed to parse user event JSON: {e}")
+        except Exception as e:
+            logger.error(f"Error handling user event: {e}")
+
+    def _consume(self) -> None:
+        self.connection = self.setup.create_connection()
+        self.channel = self.connection.channel()
+        self.channel.exchange_declare(
+            exchange=rabbitmq_config.user_events_exchange,
+            exchange_type=rabbitmq_config.exchange_type,
+            durable=True,
+            auto_delete=False,
+        )
+        result = self.channel.queue_declare(queue="", exclusive=True, auto_delete=True)
+        queue_name = result.method.queue
+        self.channel.queue_bind(
+            exchange=rabbitmq_config.user_events_exchange,
+            queue=queue_name,
+            routing_key=rabbitmq_config.user_updated_routing_key,
+        )
+        # Invalidation is idempotent and cheap, so losing one on a crash is fine
+        self.channel.basic_consume(queue=queue_name, on_message_callback=self._on_message, auto_ack=True)
+        logger.info(f"Subscribed to {rabbitmq_config.user_updated_routing_key} events on {queue_name}")
+
+        while self.is_running:
+            self.connection.process_data_events(time_limit=1)
+
+    def _run(self) -> None:
+        while self.is_running:
+            try:
+                self._consume()
+            except Exception as e:
+                if self.is_running:
+                    logger.error(f"User events subscriber error: {e}")
+                    # Entries expire by TTL while disconnected; retry later
+                    time.sleep(5)
+            finally:
+                self._disconnect()
+
+    def _disconnect(self) -> None:
+        try:
+            if self.connection and not self.connection.is_closed:
+                self.connection.close()
+        except Exception:
+            # Best-effort cleanup
+            pass
+        self.connection = None
+        self.channel = None
+
+    def start(self) -> None:
+        """Start consuming in a background thread"""
+        if self.is_running:
+            return
+        self.is_running = True
+        self.thread = threading.Thread(target=self._run, daemon=True, name="RabbitMQ-UserEvents")
+        self.thread.start()
+
+    def stop(self) -> None:
+        """Stop the background thread"""
+        self.is_running = False
+        if self.thread and self.thread.is_alive():
+            self.thread.join(timeout=5)
+
+
+# Global subscriber instance
+_user_events_subscriber: Optional[UserEventsSubscriber] = None
+
+
+def get_user_events_subscriber() -> UserEventsSubscriber:
+    """Get or create the user events subscriber"""
+    global _user_events_subscriber
+    if _user_events_subscriber is None:
+        _user_events_subscriber = UserEventsSubscriber()
+    return _user_events_subscriber
+
+
+def start_user_events_subscriber() -> None:
+    """Start invalidating cached user info on user.updated events"""
+    get_user_events_subscriber().start()
+
+
+def stop_user_events_subscriber() -> None:
+    """Stop the user events subscriber"""
+    get_user_events_subscriber().stop()
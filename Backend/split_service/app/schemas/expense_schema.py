@@ -39,8 +39,12 @@ class ExpenseShareBase(BaseModel):
     share_amount: Decimal = Field(..., ge=0)
 
 
-class ExpenseShareCreate(ExpenseShareBase):
-    pass
+class ExpenseShareCreate(BaseModel):
+    user_id: str
+    # Leave out share_amount on every share to split the expense amount by
+    # weight (equally by default) using the group's rounding option
+    share_amount: Optional[Decimal] = Field(None, ge=0)
+    weight: Optional[Decimal] = Field(None, gt=0)
 
 
 class ExpenseShareOut(ExpenseShareBase):
@@ -55,6 +59,29 @@ class ExpenseWithShares(ExpenseOut):
     shares: List[ExpenseShareOut] = []
 
 
+class ExpensePage(BaseModel):
+    items: List[ExpenseWithShares] = []
+    next_cursor: Optional[str] = None
+
+
+class BulkExpenseItem(ExpenseCreate):
+    shares: List[ExpenseShareCreate]
+
+
+class BulkExpenseCreate(BaseModel):
+    expenses: List[BulkExpenseItem] = Field(..., min_length=1, max_length=1000)
+
+
+class BulkExpenseError(BaseModel):
+    index: int
+    detail: str
+
+
+class BulkExpenseResult(BaseModel):
+    created: List[ExpenseOut] = []
+    errors: List[BulkExpenseError] = []
+
+
 class DebtSummary(BaseModel):
     user_id: str
     total_owed: Decimal
@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field, ConfigDict
-from typing import Optional
+from typing import Optional, List
 from datetime import datetime
 from decimal import Decimal
 
@@ -22,6 +22,11 @@ class SettlementOut(SettlementBase):
     settled_at: datetime
 
 
+class SettlementPage(BaseModel):
+    items: List[SettlementOut] = []
+    next_cursor: Optional[str] = None
+
+
 class OptimizedSettlement(BaseModel):
     from_user_id: str
     to_user_id: str
@@ -0,0 +1,374 @@
+from decimal import Decimal
+from typing import Dict, Iterable, List, Optional, Tuple
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from sqlalchemy import DECIMAL, and_, exists, func, literal, or_, select, union_all
+from sqlalchemy.dialects import postgresql, sqlite
+from app.models.balances import GroupBalance
+from app.models.expenses import Expense, ExpenseShare
+from app.models.groups import Group, GroupMember
+from app.models.settlements import Settlement
+from app.schemas.expense_schema import DebtSummary
+
+BALANCE_FIELDS = ("total_owed", "total_owes", "net_balance")
+
+BalanceDeltas = Dict[str, Dict[str, Decimal]]
+
+
+def _zero():
+    """Typed zero literal so every branch of the ledger union shares one column type"""
+    return literal(Decimal('0'), type_=DECIMAL(10, 2))
+
+
+def _group_ledger(group_id: str):
+    """
+    Build the per-user ledger of a group as a single UNION ALL subquery.
+
+    Every row carries one movement for one user in one of four columns:
+    - owed: unsettled shares on expenses the user paid for
+    - owes: unsettled shares the user holds on expenses paid by someone else
+    - received: settlements paid to the user
+    - paid: settlements paid by the user
+    """
+    owed = select(
+        Expense.paid_by.label("user_id"),
+        ExpenseShare.share_amount.label("owed"),
+        _zero().label("owes"),
+        _zero().label("received"),
+        _zero().label("paid"),
+    ).select_from(ExpenseShare).join(
+        Expense, ExpenseShare.expense_id == Expense.id
+    ).where(
+        and_(Expense.group_id == group_id, ExpenseShare.is_settled == False)
+    )
+
+    owes = select(
+        ExpenseShare.user_id.label("user_id"),
+        _zero().label("owed"),
+        ExpenseShare.share_amount.label("owes"),
+        _zero().label("received"),
+        _zero().label("paid"),
+    ).select_from(ExpenseShare).join(
+        Expense, ExpenseShare.expense_id == Expense.id
+    ).where(
+        and_(
+            Expense.group_id == group_id,
+            Expense.paid_by != ExpenseShare.user_id,
+            ExpenseShare.is_settled == False
+        )
+    )
+
+    received = select(
+        Settlement.to_user_id.label("user_id"),
+        _zero().label("owed"),
+        _zero().label("owes"),
+        Settlement.amount.label("received"),
+        _zero().label("paid"),
+    ).where(Settlement.group_id == group_id)
+
+    paid = select(
+        Settlement.from_user_id.label("user_id"),
+        _zero().label("owed"),
+        _zero().label("owes"),
+        _zero().label("received"),
+        Settlement.amount.label("paid"),
+    ).where(Settlement.group_id == group_id)
+
+    return union_all(owed, owes, received, paid).subquery("ledger")
+
+
+def _total(column):
+    """Sum column defaulting to zero, typed so drivers return Decimal"""
+    return func.coalesce(column, 0, type_=DECIMAL(12, 2))
+
+
+def _ledger_totals(group_id: str):
+    """Aggregate the group ledger into one row of sums per user"""
+    ledger = _group_ledger(group_id)
+    return select(
+        ledger.c.user_id,
+        func.sum(ledger.c.owed).label("owed"),
+        func.sum(ledger.c.owes).label("owes"),
+        func.sum(ledger.c.received).label("received"),
+        func.sum(ledger.c.paid).label("paid"),
+    ).group_by(ledger.c.user_id).subquery("totals")
+
+
+def compute_group_balances(db: Session, group_id: str) -> List[DebtSummary]:
+    """
+    Compute the debt summary of every group member in one SQL statement.
+
+    The ledger union is aggregated per user and left-joined onto the group's
+    members, so the number of round trips stays constant regardless of how
+    many members or expenses the group has.
+
+    Args:
+        db: Database session
+        group_id: Group ID to summarize
+
+    Returns:
+        List of DebtSummary objects, one per group member
+    """
+    totals = _ledger_totals(group_id)
+
+    statement = select(
+        GroupMember.user_id,
+        _total(totals.c.owed),
+        _total(totals.c.owes),
+        _total(totals.c.received),
+        _total(totals.c.paid),
+    ).outerjoin(
+        totals, totals.c.user_id == GroupMember.user_id
+    ).where(GroupMember.group_id == group_id)
+
+    summary = []
+    for user_id, total_owed, total_owes, settlements_received, settlements_paid in db.execute(statement):
+        net_balance = (total_owed - settlements_received) - (total_owes - settlements_paid)
+        summary.append(DebtSummary(
+            user_id=user_id,
+            total_owed=total_owed,
+            total_owes=total_owes,
+            net_balance=net_balance
+        ))
+
+    return summary
+
+
+def compute_history_balances(db: Session, group_id: str) -> BalanceDeltas:
+    """
+    Recompute the balance of every user appearing in the group history.
+
+    Unlike compute_group_balances(), users who are no longer members are
+    included, which matches what the materialized ledger accumulates.
+
+    Returns:
+        Dictionary mapping user_id -> {"total_owed", "total_owes", "net_balance"}
+    """
+    totals = _ledger_totals(group_id)
+    statement = select(
+        totals.c.user_id,
+        _total(totals.c.owed),
+        _total(totals.c.owes),
+        _total(totals.c.received),
+        _total(totals.c.paid),
+    )
+
+    balances: BalanceDeltas = {}
+    for user_id, owed, owes, received, paid in db.execute(statement):
+        balances[user_id] = {
+            "total_owed": owed,
+            "total_owes": owes,
+            "net_balance": (owed - received) - (owes - paid),
+        }
+    return balances
+
+
+def _add_delta(deltas: BalanceDeltas, user_id: str, **changes: Decimal) -> None:
+    """Accumulate balance changes for one user"""
+    entry = deltas.setdefault(user_id, {field: Decimal('0') for field in BALANCE_FIELDS})
+    for field, value in changes.items():
+        entry[field] += value
+
+
+def expense_share_deltas(
+    paid_by: str,
+    shares: Iterable[Tuple[str, Decimal]],
+    sign: int = 1,
+    deltas: Optional[BalanceDeltas] = None
+) -> BalanceDeltas:
+    """
+    Balance changes caused by adding (sign=1) or removing (sign=-1) unsettled shares.
+
+    Mirrors the debt summary definition: the payer is owed every unsettled
+    share of their expense (including their own), while each other
+    participant owes their share.
+
+    Args:
+        paid_by: User who paid the expense
+        shares: Iterable of (user_id, share_amount) for unsettled shares only
+        sign: 1 when shares become unsettled debt, -1 when they stop being
+        deltas: Optional accumulator to extend
+    """
+    deltas = {} if deltas is None else deltas
+    for user_id, share_amount in shares:
+        amount = Decimal(sign) * share_amount
+        _add_delta(deltas, paid_by, total_owed=amount, net_balance=amount)
+        if user_id != paid_by:
+            _add_delta(deltas, user_id, total_owes=amount, net_balance=-amount)
+    return deltas
+
+
+def settlement_deltas(from_user_id: str, to_user_id: str, amount: Decimal, sign: int = 1) -> BalanceDeltas:
+    """Balance changes caused by recording (sign=1) or removing (sign=-1) a settlement"""
+    amount = Decimal(sign) * amount
+    deltas: BalanceDeltas = {}
+    _add_delta(deltas, to_user_id, net_balance=-amount)
+    _add_delta(deltas, from_user_id, net_balance=amount)
+    return deltas
+
+
+_UPSERT_DIALECTS = {"postgresql": postgresql.insert, "sqlite": sqlite.insert}
+
+
+def _lock_group_ledger(db: Session, group_id: str) -> None:
+    """
+    Serialize writes and repairs of one group's ledger until the transaction ends.
+
+    Uses a transaction-level advisory lock on PostgreSQL; SQLite already
+    serializes writers.
+    """
+    if db.get_bind().dialect.name == "postgresql":
+        db.execute(select(func.pg_advisory_xact_lock(func.hashtext(f"group_balances:{group_id}"))))
+
+
+def _upsert_balance(db: Session, group_id: str, user_id: str, values: Dict[str, Decimal], increment: bool) -> None:
+    """Insert a ledger row, or on conflict add the values to it (increment) or overwrite it"""
+    statement = _UPSERT_DIALECTS[db.get_bind().dialect.name](GroupBalance).values(
+        group_id=group_id, user_id=user_id, version=1, **values
+    )
+    if increment:
+        updates = {field: getattr(GroupBalance, field) + statement.excluded[field] for field in BALANCE_FIELDS}
+    else:
+        updates = {field: statement.excluded[field] for field in BALANCE_FIELDS}
+    db.execute(statement.on_conflict_do_update(
+        index_elements=[GroupBalance.group_id, GroupBalance.user_id],
+        set_={**updates, "version": GroupBalance.version + 1, "updated_at": func.now()},
+    ))
+
+
+def apply_balance_deltas(db: Session, group_id: str, deltas: BalanceDeltas) -> None:
+    """
+    Apply balance changes to the materialized ledger without committing.
+
+    Each row is written with one upsert (INSERT ... ON CONFLICT (group_id,
+    user_id) DO UPDATE) that increments the stored values in place, so
+    concurrent writers never lose each other's changes and two writers
+    creating the same member's first row cannot collide. The group's ledger
+    lock is held until the caller commits together with the write that
+    caused the change, keeping the ledger transactionally consistent with
+    history even while reconcile_group_balances() repairs it.
+    """
+    changes = {user_id: delta for user_id, delta in deltas.items() if any(delta.values())}
+    if not changes:
+        return
+
+    _lock_group_ledger(db, group_id)
+    for user_id, delta in changes.items():
+        _upsert_balance(db, group_id, user_id, delta, increment=True)
+
+
+def _group_balances_statement(group_id: str):
+    """Debt summary columns of every group member, zero for members without a ledger row"""
+    return select(
+        GroupMember.user_id,
+        _total(GroupBalance.total_owed),
+        _total(GroupBalance.total_owes),
+        _total(GroupBalance.net_balance),
+    ).outerjoin(
+        GroupBalance,
+        and_(GroupBalance.group_id == GroupMember.group_id, GroupBalance.user_id == GroupMember.user_id)
+    ).where(GroupMember.group_id == group_id)
+
+
+def _debt_summaries(rows) -> List[DebtSummary]:
+    return [
+        DebtSummary(user_id=user_id, total_owed=total_owed, total_owes=total_owes, net_balance=net_balance)
+        for user_id, total_owed, total_owes, net_balance in rows
+    ]
+
+
+def read_group_balances(db: Session, group_id: str) -> List[DebtSummary]:
+    """
+    Read the debt summary of every group member from the materialized ledger.
+
+    This is an indexed O(members) lookup; members without a ledger row have
+    a zero balance.
+    """
+    return _debt_summaries(db.execute(_group_balances_statement(group_id)))
+
+
+async def read_group_balances_async(db: AsyncSession, group_id: str) -> List[DebtSummary]:
+    """Async counterpart of read_group_balances()"""
+    return _debt_summaries(await db.execute(_group_balances_statement(group_id)))
+
+
+def reconcile_group_balances(db: Session, group_id: str, repair: bool = False) -> List[Dict]:
+    """
+    Compare the materialized ledger of a group with its recomputed history.
+
+    A repair holds the group's ledger lock while it reads and writes, so
+    concurrent balance changes wait for it instead of being overwritten, and
+    writes through the same upsert as apply_balance_deltas(), so concurrent
+    repairs of one group never collide on a new row.
+
+    Args:
+        db: Database session
+        group_id: Group ID to verify
+        repair: When True, overwrite drifted rows with the recomputed values and commit
+
+    Returns:
+        List of drift entries, each with format:
+        {"user_id": str, "field": str, "stored": Decimal, "expected": Decimal}
+    """
+    if repair:
+        _lock_group_ledger(db, group_id)
+    expected = compute_history_balances(db, group_id)
+    stored = {
+        row.user_id: row
+        for row in db.query(GroupBalance).filter(GroupBalance.group_id == group_id).all()
+    }
+
+    drift = []
+    zero = {field: Decimal('0') for field in BALANCE_FIELDS}
+    for user_id in sorted(set(expected) | set(stored)):
+        row = stored.get(user_id)
+        values = expected.get(user_id, zero)
+        for field in BALANCE_FIELDS:
+            current = getattr(row, field) if row is not None else Decimal('0')
+            if current != values[field]:
+                drift.append({"user_id": user_id, "field": field, "stored": current, "expected": values[field]})
+
+        if repair and any(entry["user_id"] == user_id for entry in drift):
+            _upsert_balance(db, group_id, user_id, values, increment=False)
+
+    if repair:
+        db.commit()
+
+    return drift
+
+
+def backfill_group_balances(db: Session) -> List[str]:
+    """
+    Build the ledger of every group that has history but no ledger rows yet.
+
+    Run by a startup hook, before the instance serves requests, so groups
+    created before the ledger existed get their balances without a manual
+    rebuild, and no balance change from this code reaches a group before
+    its backfill. Replicas starting together repair each group one after
+    the other under its ledger lock, and the later ones find no drift.
+    History written by older instances during a rolling deploy is not in
+    the ledger; run `python -m app.utils.rebuild_balances rebuild` after
+    such a deploy.
+
+    Returns:
+        IDs of the groups that were backfilled
+    """
+    has_history = or_(
+        exists().where(Expense.group_id == Group.id),
+        exists().where(Settlement.group_id == Group.id),
+    )
+    has_ledger = exists().where(GroupBalance.group_id == Group.id)
+    group_ids = [group_id for (group_id,) in db.query(Group.id).filter(has_history, ~has_ledger).all()]
+    for group_id in group_ids:
+        reconcile_group_balances(db, group_id, repair=True)
+    return group_ids
+
+
+def reconcile_all_balances(db: Session, repair: bool = False) -> Dict[str, List[Dict]]:
+    """Reconcile every group's ledger; returns group_id -> drift entries for drifted groups"""
+    report = {}
+    for (group_id,) in db.query(Group.id).all():
+        drift = reconcile_group_balances(db, group_id, repair=repair)
+        if drift:
+            report[group_id] = drift
+    return report
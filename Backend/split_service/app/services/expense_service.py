@@ -1,15 +1,76 @@
-from sqlalchemy.orm import Session
-from sqlalchemy import and_, func
+import uuid
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, selectinload
 from fastapi import HTTPException
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Set, Tuple
+from datetime import datetime, timezone
 from decimal import Decimal
 from app.models.expenses import Expense, ExpenseShare
-from app.models.groups import GroupMember
+from app.models.groups import Group, GroupMember
 from app.schemas.expense_schema import (
     ExpenseCreate, ExpenseUpdate, ExpenseOut, ExpenseShareCreate,
-    ExpenseShareOut, DebtSummary
+    ExpenseShareOut, DebtSummary, BulkExpenseItem, BulkExpenseError, BulkExpenseResult
 )
 from app.schemas.settlement_schema import OptimizedSettlement
+from app.services.balance_service import (
+    apply_balance_deltas, expense_share_deltas, read_group_balances, read_group_balances_async
+)
+from app.utils.min_cash_flow import from_minor_units, to_minor_units
+from app.utils.pagination import DEFAULT_PAGE_SIZE, paginate_keyset, paginate_keyset_async
+from app.utils.share_allocation import allocate_shares, integer_weights
+
+
+def _group_rounding(db: Session, group_id: str) -> str:
+    """Return the rounding option of a group as used by allocate_shares"""
+    rounding_option = db.query(Group.rounding_option).filter(Group.id == group_id).scalar()
+    return rounding_option.value if rounding_option else "none"
+
+
+def _resolve_shares(
+    amount: Decimal,
+    shares_data: List[ExpenseShareCreate],
+    paid_by: str,
+    rounding: str
+) -> Tuple[List[ExpenseShareCreate], Optional[str]]:
+    """
+    Fill in share amounts when none were given, splitting the expense amount by weight.
+
+    Shares are allocated in whole cents with allocate_shares(), so they always
+    add up to the expense amount. Returns the shares and an error message,
+    which is None when the shares could be resolved.
+    """
+    if all(share.share_amount is not None for share in shares_data):
+        return shares_data, None
+    if any(share.share_amount is not None for share in shares_data):
+        return shares_data, "Either every share or no share must have an amount"
+
+    participants = [share.user_id for share in shares_data]
+    cents = allocate_shares(
+        to_minor_units(amount),
+        integer_weights([share.weight or 1 for share in shares_data]),
+        rounding,
+        participants.index(paid_by) if paid_by in participants else None
+    )
+    return [
+        ExpenseShareCreate(user_id=share.user_id, share_amount=from_minor_units(share_cents))
+        for share, share_cents in zip(shares_data, cents)
+    ], None
+
+
+def _validate_shares(amount: Decimal, shares_data: List[ExpenseShareCreate], group_members: Set[str]) -> Optional[str]:
+    """Return why the shares are invalid for an expense, or None if they are valid"""
+    # Validate total shares equal expense amount
+    total_shares = sum(share.share_amount for share in shares_data)
+    if total_shares != amount:
+        return "Total shares must equal expense amount"
+
+    # Validate all share recipients are group members
+    for share in shares_data:
+        if share.user_id not in group_members:
+            return f"User {share.user_id} is not a member of this group"
+
+    return None
 
 
 def create_expense(db: Session, group_id: str, expense_data: ExpenseCreate, paid_by: str, shares_data: List[ExpenseShareCreate]) -> Expense:
@@ -20,16 +81,12 @@ def create_expense(db: Session, group_id: str, expense_data: ExpenseCreate, paid
     if not is_group_member(db, group_id, paid_by):
         raise HTTPException(status_code=403, detail="Only group members can create expenses")
 
-    # Validate total shares equal expense amount
-    total_shares = sum(share.share_amount for share in shares_data)
-    if total_shares != expense_data.amount:
-        raise HTTPException(status_code=400, detail="Total shares must equal expense amount")
-
-    # Validate all share recipients are group members
+    # Validate shares against the expense amount and group membership
     group_members = {member.user_id for member in get_group_members(db, group_id)}
-    for share in shares_data:
-        if share.user_id not in group_members:
-            raise HTTPException(status_code=400, detail=f"User {share.user_id} is not a member of this group")
+    shares_data, error = _resolve_shares(expense_data.amount, shares_data, paid_by, _group_rounding(db, group_id))
+    error = error or _validate_shares(expense_data.amount, shares_data, group_members)
+    if error:
+        raise HTTPException(status_code=400, detail=error)
 
     # Create expense
     expense = Expense(
@@ -43,8 +100,7 @@ def create_expense(db: Session, group_id: str, expense_data: ExpenseCreate, paid
         date=expense_data.date
     )
     db.add(expense)
-    db.commit()
-    db.refresh(expense)
+    db.flush()
 
     # Create expense shares
     for share_data in shares_data:
@@ -55,18 +111,177 @@ def create_expense(db: Session, group_id: str, expense_data: ExpenseCreate, paid
         )
         db.add(share)
 
+    # Update the running balances in the same transaction
+    apply_balance_deltas(db, group_id, expense_share_deltas(
+        paid_by, ((share.user_id, share.share_amount) for share in shares_data)
+    ))
+
     db.commit()
+    db.refresh(expense)
     return expense
 
 
+def create_expenses_bulk(db: Session, group_id: str, items: List[BulkExpenseItem], paid_by: str) -> BulkExpenseResult:
+    """
+    Create many expenses with their shares in a single transaction.
+
+    Membership is loaded once and every item is validated against it; invalid
+    items are reported by index and skipped. IDs and timestamps are assigned
+    here so all valid expenses and shares can be written with two batched
+    INSERTs and one commit, together with a single running balance update.
+    """
+    from .group_service import get_group_members
+
+    group_members = {member.user_id for member in get_group_members(db, group_id)}
+    if paid_by not in group_members:
+        raise HTTPException(status_code=403, detail="Only group members can create expenses")
+
+    rounding = _group_rounding(db, group_id)
+    created_at = datetime.now(timezone.utc)
+    expense_rows = []
+    share_rows = []
+    errors = []
+    deltas = {}
+
+    for index, item in enumerate(items):
+        shares, error = _resolve_shares(item.amount, item.shares, paid_by, rounding)
+        error = error or _validate_shares(item.amount, shares, group_members)
+        if error:
+            errors.append(BulkExpenseError(index=index, detail=error))
+            continue
+
+        expense_id = str(uuid.uuid4())
+        expense_rows.append({
+            "id": expense_id,
+            "group_id": group_id,
+            "group_category_id": item.group_category_id,
+            "title": item.title,
+            "amount": item.amount,
+            "paid_by": paid_by,
+            "description": item.description,
+            "receipt_url": item.receipt_url,
+            "date": item.date,
+            "created_at": created_at,
+        })
+        share_rows.extend(
+            {
+                "id": str(uuid.uuid4()),
+                "expense_id": expense_id,
+                "user_id": share.user_id,
+                "share_amount": share.share_amount,
+                "is_settled": False,
+            }
+            for share in shares
+        )
+        expense_share_deltas(
+            paid_by, ((share.user_id, share.share_amount) for share in shares), deltas=deltas
+        )
+
+    if expense_rows:
+        db.bulk_insert_mappings(Expense, expense_rows)
+        db.bulk_insert_mappings(ExpenseShare, share_rows)
+        apply_balance_deltas(db, group_id, deltas)
+        db.commit()
+
+    return BulkExpenseResult(
+        created=[ExpenseOut(**row) for row in expense_rows],
+        errors=errors
+    )
+
+
 def get_expense(db: Session, expense_id: str) -> Optional[Expense]:
     """Get an expense by ID"""
     return db.query(Expense).filter(Expense.id == expense_id).first()
 
 
-def get_group_expenses(db: Session, group_id: str) -> List[Expense]:
-    """Get all expenses for a group"""
-    return db.query(Expense).filter(Expense.group_id == group_id).all()
+def get_group_expenses(db: Session, group_id: str, include_shares: bool = False) -> List[Expense]:
+    """Get all expenses for a group, optionally loading every expense's shares in one extra query"""
+    query = db.query(Expense).filter(Expense.group_id == group_id)
+    if include_shares:
+        query = query.options(selectinload(Expense.shares))
+    return query.all()
+
+
+def get_group_expenses_page(
+    db: Session,
+    group_id: str,
+    cursor: Optional[str] = None,
+    limit: int = DEFAULT_PAGE_SIZE,
+    date_from: Optional[datetime] = None,
+    date_to: Optional[datetime] = None,
+    category_id: Optional[str] = None,
+    paid_by: Optional[str] = None,
+    is_settled: Optional[bool] = None
+) -> Tuple[List[Expense], Optional[str]]:
+    """
+    Get one page of a group's expenses, newest first, with their shares loaded.
+
+    Args:
+        db: Database session
+        group_id: Group ID
+        cursor: Cursor returned with the previous page
+        limit: Page size
+        date_from: Only expenses dated at or after this moment
+        date_to: Only expenses dated at or before this moment
+        category_id: Only expenses in this group category
+        paid_by: Only expenses paid by this user
+        is_settled: True for fully settled expenses, False for expenses with unsettled shares
+
+    Returns:
+        Tuple of (expenses, next_cursor)
+    """
+    query = db.query(Expense).filter(*_expense_page_filters(
+        group_id, date_from, date_to, category_id, paid_by, is_settled
+    ))
+    query = query.options(selectinload(Expense.shares))
+    return paginate_keyset(query, Expense.created_at, Expense.id, cursor, limit)
+
+
+async def get_group_expenses_page_async(
+    db: AsyncSession,
+    group_id: str,
+    cursor: Optional[str] = None,
+    limit: int = DEFAULT_PAGE_SIZE,
+    date_from: Optional[datetime] = None,
+    date_to: Optional[datetime] = None,
+    category_id: Optional[str] = None,
+    paid_by: Optional[str] = None,
+    is_settled: Optional[bool] = None
+) -> Tuple[List[Expense], Optional[str]]:
+    """Async counterpart of get_group_expenses_page()"""
+    statement = select(Expense).where(*_expense_page_filters(
+        group_id, date_from, date_to, category_id, paid_by, is_settled
+    )).options(selectinload(Expense.shares))
+    return await paginate_keyset_async(db, statement, Expense.created_at, Expense.id, cursor, limit)
+
+
+def _expense_page_filters(
+    group_id: str,
+    date_from: Optional[datetime],
+    date_to: Optional[datetime],
+    category_id: Optional[str],
+    paid_by: Optional[str],
+    is_settled: Optional[bool]
+) -> List:
+    """Conditions shared by the sync and async expense listings"""
+    conditions = [Expense.group_id == group_id]
+
+    if date_from is not None:
+        conditions.append(Expense.date >= date_from)
+    if date_to is not None:
+        conditions.append(Expense.date <= date_to)
+    if category_id is not None:
+        conditions.append(Expense.group_category_id == category_id)
+    if paid_by is not None:
+        conditions.append(Expense.paid_by == paid_by)
+    if is_settled is not None:
+        has_unsettled = select(ExpenseShare.id).where(
+            ExpenseShare.expense_id == Expense.id,
+            ExpenseShare.is_settled == False
+        ).exists()
+        conditions.append(~has_unsettled if is_settled else has_unsettled)
+
+    return conditions
 
 
 def get_category_expenses(db: Session, category_id: str) -> List[Expense]:
@@ -87,6 +302,8 @@ def update_expense(db: Session, expense_id: str, update_data: ExpenseUpdate, use
     if expense.paid_by != user_id and not is_admin:
         raise HTTPException(status_code=403, detail="Only expense creator or group admin can update expense")
 
+    # Balances are derived from shares and the payer, neither of which
+    # can change here, so the running balances need no update
     for field, value in update_data.dict(exclude_unset=True).items():
         setattr(expense, field, value)
 
@@ -108,6 +325,13 @@ def delete_expense(db: Session, expense_id: str, user_id: str):
     if expense.paid_by != user_id and not is_admin:
         raise HTTPException(status_code=403, detail="Only expense creator or group admin can delete expense")
 
+    # Remove the expense's unsettled shares from the running balances
+    unsettled = db.query(ExpenseShare.user_id, ExpenseShare.share_amount).filter(
+        ExpenseShare.expense_id == expense.id,
+        ExpenseShare.is_settled == False
+    ).all()
+    apply_balance_deltas(db, expense.group_id, expense_share_deltas(expense.paid_by, unsettled, sign=-1))
+
     db.delete(expense)
     db.commit()
 
@@ -127,74 +351,30 @@ def settle_expense_share(db: Session, share_id: str, user_id: str):
     if share.user_id != user_id:
         raise HTTPException(status_code=403, detail="You can only settle your own shares")
 
+    if not share.is_settled:
+        expense = get_expense(db, share.expense_id)
+        if expense:
+            apply_balance_deltas(db, expense.group_id, expense_share_deltas(
+                expense.paid_by, [(share.user_id, share.share_amount)], sign=-1
+            ))
+
     share.is_settled = True
     db.commit()
     db.refresh(share)
     return share
 
 
+def get_debt_summary(db: Session, group_id: str) -> List[DebtSummary]:
+    """Calculate debt summary for all group members from the running balances"""
+    return read_group_balances(db, group_id)
 
 
-def get_debt_summary(db: Session, group_id: str) -> List[DebtSummary]:
-    """Calculate debt summary for all group members"""
-    from .group_service import get_group_members
-    from app.models.settlements import Settlement
-
-    members = get_group_members(db, group_id)
-    summary = []
-
-    for member in members:
-        user_id = member.user_id
-
-        # Calculate total owed (what others owe this user)
-        total_owed = db.query(func.sum(ExpenseShare.share_amount))\
-            .select_from(ExpenseShare)\
-            .join(Expense, ExpenseShare.expense_id == Expense.id)\
-            .filter(
-                and_(
-                    Expense.group_id == group_id,
-                    Expense.paid_by == user_id,
-                    ExpenseShare.is_settled == False
-                )
-            ).scalar() or Decimal('0')
-
-        # Calculate total owes (what this user owes to others)
-        total_owes = db.query(func.sum(ExpenseShare.share_amount))\
-            .select_from(ExpenseShare)\
-            .join(Expense, ExpenseShare.expense_id == Expense.id)\
-            .filter(
-                and_(
-                    Expense.group_id == group_id,
-                    Expense.paid_by != user_id,
-                    ExpenseShare.user_id == user_id,
-                    ExpenseShare.is_settled == False
-                )
-            ).scalar() or Decimal('0')
-
-        # Subtract settlements
-        settlements_received = db.query(func.sum(Settlement.amount))\
-            .filter(
-                and_(Settlement.group_id == group_id, Settlement.to_user_id == user_id)
-            ).scalar() or Decimal('0')
-
-        settlements_paid = db.query(func.sum(Settlement.amount))\
-            .filter(
-                and_(Settlement.group_id == group_id, Settlement.from_user_id == user_id)
-            ).scalar() or Decimal('0')
-
-        net_balance = (total_owed - settlements_received) - (total_owes - settlements_paid)
-
-        summary.append(DebtSummary(
-            user_id=user_id,
-            total_owed=total_owed,
-            total_owes=total_owes,
-            net_balance=net_balance
-        ))
-
-    return summary
-
-
-def optimize_settlements(debt_summary: List[DebtSummary]) -> List[OptimizedSettlement]:
+async def get_debt_summary_async(db: AsyncSession, group_id: str) -> List[DebtSummary]:
+    """Async counterpart of get_debt_summary()"""
+    return await read_group_balances_async(db, group_id)
+
+
+def optimize_settlements(debt_summary: List[DebtSummary], strategy: str = "greedy") -> List[OptimizedSettlement]:
     """
     Optimize settlements using Min-Cash-Flow algorithm.
     
@@ -204,6 +384,7 @@ def optimize_settlements(debt_summary: List[DebtSummary]) -> List[OptimizedSettl
     
     Args:
         debt_summary: List of DebtSummary objects containing user balances
+        strategy: Min-Cash-Flow strategy, "greedy" or "optimal"
     
     Returns:
         List of OptimizedSettlement objects representing minimal transactions
@@ -232,7 +413,7 @@ def optimize_settlements(debt_summary: List[DebtSummary]) -> List[OptimizedSettl
     
     # Apply Min-Cash-Flow algorithm
     # Returns list of dicts: [{"from": str, "to": str, "amount": Decimal}, ...]
-    settlements_dict = min_cash_flow(active_balances)
+    settlements_dict = min_cash_flow(active_balances, strategy=strategy)
     
     # Convert to OptimizedSettlement objects
     settlements = [
@@ -267,7 +448,7 @@ def calculate_balances_from_expenses(db: Session, group_id: str) -> Dict[str, De
         any settlements that may have been recorded. Use get_debt_summary()
         if you need balances that account for settlements.
     """
-    expenses = get_group_expenses(db, group_id)
+    expenses = get_group_expenses(db, group_id, include_shares=True)
     balances: Dict[str, Decimal] = {}
     
     for expense in expenses:
@@ -279,11 +460,8 @@ def calculate_balances_from_expenses(db: Session, group_id: str) -> Dict[str, De
             balances[payer_id] = Decimal('0')
         balances[payer_id] += expense_amount
         
-        # Get shares for this expense
-        shares = get_expense_shares(db, expense.id)
-        
         # Subtract each share from respective user's balance
-        for share in shares:
+        for share in expense.shares:
             user_id = share.user_id
             share_amount = share.share_amount
             
@@ -0,0 +1,148 @@
+import csv
+import io
+import json
+from datetime import datetime
+from decimal import Decimal
+from typing import Callable, Dict, Iterator, List
+from fastapi import HTTPException
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+from app.db.database import SessionLocal
+from app.models.expenses import Expense, ExpenseShare
+from app.models.settlements import Settlement
+
+EXPORT_FORMATS = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+
+# Union of the columns of every record type; CSV rows leave unused columns empty
+EXPORT_FIELDS = [
+    "record_type", "id", "expense_id", "group_category_id", "title", "description",
+    "amount", "paid_by", "user_id", "from_user_id", "to_user_id", "is_settled",
+    "date", "created_at", "settled_at",
+]
+
+EXPORT_BATCH_SIZE = 1000
+
+
+def _rows(db: Session, statement, record_type: str, batch_size: int) -> Iterator[Dict]:
+    """Stream a column statement through a server-side cursor as export records"""
+    result = db.execute(statement.execution_options(yield_per=batch_size))
+    for row in result.mappings():
+        record = {"record_type": record_type}
+        record.update(row)
+        yield record
+
+
+def iter_group_ledger(db: Session, group_id: str, batch_size: int = EXPORT_BATCH_SIZE) -> Iterator[Dict]:
+    """
+    Yield every expense, expense share and settlement of a group as flat records.
+
+    Plain columns are selected instead of ORM entities so rows are never added
+    to the session identity map, and each statement is fetched in batches of
+    batch_size, keeping memory flat however large the group is.
+
+    Args:
+        db: Database session
+        group_id: Group ID to export
+        batch_size: Number of rows fetched from the cursor at a time
+
+    Returns:
+        Iterator of dictionaries keyed by a subset of EXPORT_FIELDS
+    """
+    expenses = select(
+        Expense.id, Expense.group_category_id, Expense.title, Expense.description,
+        Expense.amount, Expense.paid_by, Expense.date, Expense.created_at
+    ).where(Expense.group_id == group_id).order_by(Expense.created_at, Expense.id)
+    yield from _rows(db, expenses, "expense", batch_size)
+
+    shares = select(
+        ExpenseShare.id, ExpenseShare.expense_id, ExpenseShare.user_id,
+        ExpenseShare.share_amount.label("amount"), ExpenseShare.is_settled
+    ).join(
+        Expense, ExpenseShare.expense_id == Expense.id
+    ).where(Expense.group_id == group_id).order_by(ExpenseShare.expense_id, ExpenseShare.id)
+    yield from _rows(db, shares, "expense_share", batch_size)
+
+    settlements = select(
+        Settlement.id, Settlement.from_user_id, Settlement.to_user_id,
+        Settlement.amount, Settlement.settled_at
+    ).where(Settlement.group_id == group_id).order_by(Settlement.settled_at, Settlement.id)
+    yield from _rows(db, settlements, "settlement", batch_size)
+
+
+def _export_value(value):
+    """Convert a column value to its text representation in an export"""
+    if isinstance(value, Decimal):
+        return str(value)
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+def _batched(records: Iterator[Dict], batch_size: int) -> Iterator[List[Dict]]:
+    """Group records into lists so each response chunk carries many rows"""
+    batch = []
+    for record in records:
+        batch.append(record)
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def iter_ndjson(records: Iterator[Dict], batch_size: int = EXPORT_BATCH_SIZE) -> Iterator[str]:
+    """Encode records as newline-delimited JSON, one chunk per batch"""
+    for batch in _batched(records, batch_size):
+        yield "".join(
+            json.dumps({key: _export_value(value) for key, value in record.items()}) + "\n"
+            for record in batch
+        )
+
+
+def iter_csv(records: Iterator[Dict], batch_size: int = EXPORT_BATCH_SIZE) -> Iterator[str]:
+    """Encode records as CSV with a header row, one chunk per batch"""
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=EXPORT_FIELDS)
+    writer.writeheader()
+    yield buffer.getvalue()
+
+    for batch in _batched(records, batch_size):
+        buffer.seek(0)
+        buffer.truncate()
+        writer.writerows(
+            {key: _export_value(value) for key, value in record.items()}
+            for record in batch
+        )
+        yield buffer.getvalue()
+
+
+def stream_group_export(
+    group_id: str,
+    export_format: str,
+    session_factory: Callable[[], Session] = SessionLocal
+) -> Iterator[str]:
+    """
+    Stream a group's full ledger in the requested format.
+
+    The export owns its own session because the response body is produced
+    after the request's dependencies have been torn down.
+
+    Raises:
+        HTTPException: 400 if the format is not supported
+    """
+    if export_format not in EXPORT_FORMATS:
+        raise HTTPException(status_code=400, detail=f"Unsupported export format: {export_format}")
+
+    encode = iter_ndjson if export_format == "ndjson" else iter_csv
+
+    def generate() -> Iterator[str]:
+        db = session_factory()
+        try:
+            yield from encode(iter_group_ledger(db, group_id))
+        finally:
+            db.close()
+
+    return generate()
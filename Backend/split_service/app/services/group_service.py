@@ -1,7 +1,10 @@
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from sqlalchemy import and_
+from sqlalchemy import and_, select
 from fastapi import HTTPException
 from typing import List, Optional
+from app.cache.group_slug_cache import GroupRef, get_group_slug_cache
+from app.cache.membership_cache import get_membership_cache
 from app.models.groups import Group, GroupMember, GroupCategory
 from app.schemas.group_schema import (
     GroupCreate, GroupUpdate, GroupOut, GroupMemberCreate,
@@ -26,6 +29,8 @@ def create_group(db: Session, group_data: GroupCreate, created_by: str) -> Group
     db.add(group)
     db.commit()
     db.refresh(group)
+    # The new slug may have been cached as unknown
+    get_group_slug_cache().invalidate(slug)
 
     # Add creator as admin member
     add_member_to_group(db, group.id, created_by, is_admin=True)
@@ -42,11 +47,27 @@ def get_group_by_slug(db: Session, slug: str) -> Optional[Group]:
     return db.query(Group).filter(Group.slug == slug).first()
 
 
+def resolve_group_slug(db: Session, slug: str) -> Optional[GroupRef]:
+    """Get the id, rounding option and creator of a group by slug (served from the slug cache)"""
+    return get_group_slug_cache().get(db, slug)
+
+
+async def resolve_group_slug_async(db: AsyncSession, slug: str) -> Optional[GroupRef]:
+    """Async counterpart of resolve_group_slug()"""
+    return await get_group_slug_cache().get_async(db, slug)
+
+
 def get_user_groups(db: Session, user_id: str) -> List[Group]:
     """Get all groups for a user"""
     return db.query(Group).join(GroupMember).filter(GroupMember.user_id == user_id).all()
 
 
+async def get_user_groups_async(db: AsyncSession, user_id: str) -> List[Group]:
+    """Async counterpart of get_user_groups()"""
+    statement = select(Group).join(GroupMember).where(GroupMember.user_id == user_id)
+    return list((await db.scalars(statement)).all())
+
+
 def update_group(db: Session, group_id: str, update_data: GroupUpdate, user_id: str) -> Group:
     """Update a group (admin only)"""
     group = get_group(db, group_id)
@@ -57,6 +78,8 @@ def update_group(db: Session, group_id: str, update_data: GroupUpdate, user_id:
     if not is_group_admin(db, group_id, user_id):
         raise HTTPException(status_code=403, detail="Only group admins can update group")
 
+    old_slug = group.slug
+
     # If name is being updated, regenerate slug from new name
     if update_data.name and update_data.name != group.name:
         new_slug = create_group_slug(update_data.name, db, group_id)
@@ -69,6 +92,7 @@ def update_group(db: Session, group_id: str, update_data: GroupUpdate, user_id:
 
     db.commit()
     db.refresh(group)
+    get_group_slug_cache().invalidate(old_slug, group.slug)
     return group
 
 
@@ -81,8 +105,11 @@ def delete_group(db: Session, group_id: str, user_id: str):
     if not is_group_admin(db, group_id, user_id):
         raise HTTPException(status_code=403, detail="Only group admins can delete group")
 
+    slug = group.slug
     db.delete(group)
     db.commit()
+    get_membership_cache().invalidate(group_id)
+    get_group_slug_cache().invalidate(slug)
 
 
 def add_member_to_group(db: Session, group_id: str, user_id: str, is_admin: bool = False):
@@ -103,6 +130,7 @@ def add_member_to_group(db: Session, group_id: str, user_id: str, is_admin: bool
     db.add(member)
     db.commit()
     db.refresh(member)
+    get_membership_cache().invalidate(group_id)
     return member
 
 
@@ -120,7 +148,7 @@ def add_member_to_group_enhanced(db: Session, group_slug: str, member_data: Grou
         GroupMemberOut: The added member (for direct user_id) or request info (for async lookup)
     """
     # Get group by slug
-    group = get_group_by_slug(db, group_slug)
+    group = resolve_group_slug(db, group_slug)
     if not group:
         raise HTTPException(status_code=404, detail="Group not found")
     
@@ -178,22 +206,27 @@ def remove_member_from_group(db: Session, group_id: str, user_id: str, remover_i
 
     db.delete(member)
     db.commit()
+    get_membership_cache().invalidate(group_id)
 
 
 def is_group_admin(db: Session, group_id: str, user_id: str) -> bool:
-    """Check if user is admin of the group"""
-    member = db.query(GroupMember).filter(
-        and_(GroupMember.group_id == group_id, GroupMember.user_id == user_id)
-    ).first()
-    return member and member.is_admin
+    """Check if user is admin of the group (served from the membership cache)"""
+    return get_membership_cache().get_members(db, group_id).get(user_id, False)
 
 
 def is_group_member(db: Session, group_id: str, user_id: str) -> bool:
-    """Check if user is member of the group"""
-    member = db.query(GroupMember).filter(
-        and_(GroupMember.group_id == group_id, GroupMember.user_id == user_id)
-    ).first()
-    return member is not None
+    """Check if user is member of the group (served from the membership cache)"""
+    return user_id in get_membership_cache().get_members(db, group_id)
+
+
+async def is_group_admin_async(db: AsyncSession, group_id: str, user_id: str) -> bool:
+    """Async counterpart of is_group_admin()"""
+    return (await get_membership_cache().get_members_async(db, group_id)).get(user_id, False)
+
+
+async def is_group_member_async(db: AsyncSession, group_id: str, user_id: str) -> bool:
+    """Async counterpart of is_group_member()"""
+    return user_id in await get_membership_cache().get_members_async(db, group_id)
 
 
 def get_group_members(db: Session, group_id: str) -> List[GroupMember]:
@@ -2,16 +2,25 @@ import logging
 from typing import Dict, List
 from uuid import uuid4
 
+from app.cache.user_info_cache import get_user_info_cache
 from app.rabbitmq.config import rabbitmq_config
 from app.rabbitmq.rpc_client import get_rpc_client
 from app.schemas.group_schema import UserInfo
+from app.utils.single_flight import SingleFlight
 
 
 logger = logging.getLogger(__name__)
 
 
+# Concurrent page loads asking for the same users share one RPC
+_user_info_flights = SingleFlight()
+
+
 def fetch_group_users(user_ids: List[str], group_id: str) -> Dict[str, UserInfo]:
-    """Fetch user info for a batch of user IDs via RabbitMQ RPC.
+    """Fetch user info for a batch of user IDs, via RabbitMQ RPC for uncached users.
+
+    Concurrent calls missing the same set of users share a single in-flight
+    RPC instead of each sending an identical request.
 
     Returns a mapping of user_id -> UserInfo.
     """
@@ -20,7 +29,28 @@ def fetch_group_users(user_ids: List[str], group_id: str) -> Dict[str, UserInfo]
     if not unique_ids:
         return {}
 
+    cache = get_user_info_cache()
+    cached, unique_ids = cache.get_many(unique_ids)
+    if not unique_ids:
+        return cached
+
+    key = tuple(sorted(unique_ids))
+    fetched, shared = _user_info_flights.do(key, lambda: _fetch_remote_users(list(key), group_id))
+    if shared:
+        logger.info(
+            "Reused in-flight user info RPC for group_id=%s user_count=%d", group_id, len(key)
+        )
+
+    result = dict(fetched)
+    result.update(cached)
+    return result
+
+
+def _fetch_remote_users(unique_ids: List[str], group_id: str) -> Dict[str, UserInfo]:
+    """Request user info from user_service and cache what comes back."""
     request_id = str(uuid4())
+    # Taken before the request so updates arriving meanwhile are not overwritten
+    generations = get_user_info_cache().generations(unique_ids)
 
     payload = {
         "request_id": request_id,
@@ -82,6 +112,7 @@ def fetch_group_users(user_ids: List[str], group_id: str) -> Dict[str, UserInfo]
         len(result),
     )
 
+    get_user_info_cache().set_many(result, generations)
     return result
 
 
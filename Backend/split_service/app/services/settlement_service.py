@@ -1,9 +1,13 @@
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from sqlalchemy import and_
+from sqlalchemy import and_, select
 from fastapi import HTTPException
-from typing import List
+from typing import List, Optional, Tuple
+from datetime import datetime
 from app.models.settlements import Settlement
 from app.schemas.settlement_schema import SettlementCreate, SettlementOut, OptimizedSettlement
+from app.services.balance_service import apply_balance_deltas, settlement_deltas
+from app.utils.pagination import DEFAULT_PAGE_SIZE, paginate_keyset, paginate_keyset_async
 
 
 def create_settlement(db: Session, group_id: str, settlement_data: SettlementCreate, user_id: str) -> Settlement:
@@ -28,6 +32,9 @@ def create_settlement(db: Session, group_id: str, settlement_data: SettlementCre
         amount=settlement_data.amount
     )
     db.add(settlement)
+    apply_balance_deltas(db, group_id, settlement_deltas(
+        settlement_data.from_user_id, settlement_data.to_user_id, settlement_data.amount
+    ))
     db.commit()
     db.refresh(settlement)
     return settlement
@@ -38,6 +45,62 @@ def get_group_settlements(db: Session, group_id: str) -> List[Settlement]:
     return db.query(Settlement).filter(Settlement.group_id == group_id).all()
 
 
+def get_group_settlements_page(
+    db: Session,
+    group_id: str,
+    cursor: Optional[str] = None,
+    limit: int = DEFAULT_PAGE_SIZE,
+    date_from: Optional[datetime] = None,
+    date_to: Optional[datetime] = None,
+    from_user_id: Optional[str] = None,
+    to_user_id: Optional[str] = None
+) -> Tuple[List[Settlement], Optional[str]]:
+    """Get one page of a group's settlements, newest first, with optional filters"""
+    query = db.query(Settlement).filter(*_settlement_page_filters(
+        group_id, date_from, date_to, from_user_id, to_user_id
+    ))
+    return paginate_keyset(query, Settlement.settled_at, Settlement.id, cursor, limit)
+
+
+async def get_group_settlements_page_async(
+    db: AsyncSession,
+    group_id: str,
+    cursor: Optional[str] = None,
+    limit: int = DEFAULT_PAGE_SIZE,
+    date_from: Optional[datetime] = None,
+    date_to: Optional[datetime] = None,
+    from_user_id: Optional[str] = None,
+    to_user_id: Optional[str] = None
+) -> Tuple[List[Settlement], Optional[str]]:
+    """Async counterpart of get_group_settlements_page()"""
+    statement = select(Settlement).where(*_settlement_page_filters(
+        group_id, date_from, date_to, from_user_id, to_user_id
+    ))
+    return await paginate_keyset_async(db, statement, Settlement.settled_at, Settlement.id, cursor, limit)
+
+
+def _settlement_page_filters(
+    group_id: str,
+    date_from: Optional[datetime],
+    date_to: Optional[datetime],
+    from_user_id: Optional[str],
+    to_user_id: Optional[str]
+) -> List:
+    """Conditions shared by the sync and async settlement listings"""
+    conditions = [Settlement.group_id == group_id]
+
+    if date_from is not None:
+        conditions.append(Settlement.settled_at >= date_from)
+    if date_to is not None:
+        conditions.append(Settlement.settled_at <= date_to)
+    if from_user_id is not None:
+        conditions.append(Settlement.from_user_id == from_user_id)
+    if to_user_id is not None:
+        conditions.append(Settlement.to_user_id == to_user_id)
+
+    return conditions
+
+
 def get_settlement(db: Session, settlement_id: str) -> Settlement:
     """Get a settlement by ID"""
     return db.query(Settlement).filter(Settlement.id == settlement_id).first()
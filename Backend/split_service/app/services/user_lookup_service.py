@@ -1,24 +1,80 @@
+import asyncio
 import logging
+import threading
+import time
 import uuid
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Tuple
+from app.rabbitmq.config import rabbitmq_config
 from app.rabbitmq.producer import get_rabbitmq_producer
 from app.rabbitmq.consumer import get_rabbitmq_consumer, create_user_lookup_response_callback
 
 logger = logging.getLogger(__name__)
 
 
+def _resolve(future: asyncio.Future) -> None:
+    if not future.done():
+        future.set_result(True)
+
+
+class LookupWaiter:
+    """Completion signal for one user lookup request.
+
+    Set from the consumer thread (or the asyncio consumer's worker thread)
+    when the response has been processed. Sync callers block on the event,
+    async callers await a future resolved on their own loop, so waiting
+    costs no CPU and wakes up as soon as the response is handled.
+    """
+
+    def __init__(self, phone_or_email: str, group_slug: str):
+        self.phone_or_email = phone_or_email
+        self.group_slug = group_slug
+        self.created_at = time.time()
+        self.response: Optional[Dict[str, Any]] = None
+        self.event = threading.Event()
+        self._futures: List[Tuple[asyncio.AbstractEventLoop, asyncio.Future]] = []
+        self._lock = threading.Lock()
+
+    def complete(self, response: Dict[str, Any]) -> None:
+        """Record the response and wake every waiter"""
+        with self._lock:
+            self.response = response
+            self.event.set()
+            futures, self._futures = self._futures, []
+        for loop, future in futures:
+            loop.call_soon_threadsafe(_resolve, future)
+
+    async def wait_async(self, timeout: float) -> bool:
+        """Wait on the running loop until completed; False on timeout"""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        with self._lock:
+            if self.event.is_set():
+                return True
+            self._futures.append((loop, future))
+        try:
+            await asyncio.wait_for(future, timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+        finally:
+            with self._lock:
+                if (loop, future) in self._futures:
+                    self._futures.remove((loop, future))
+
+
 class UserLookupService:
     """Service to handle user lookup requests via RabbitMQ"""
     
     def __init__(self):
-        self.pending_requests: Dict[str, Dict[str, Any]] = {}
+        self.pending_requests: Dict[str, LookupWaiter] = {}
         self.producer = get_rabbitmq_producer()
         self.consumer = get_rabbitmq_consumer()
         self._consumer_setup_completed = False
     
     def _setup_response_consumer(self):
         """Setup consumer for user lookup responses"""
-        if self._consumer_setup_completed:
+        if self._consumer_setup_completed or rabbitmq_config.async_consumers:
+            # The asyncio consumer already handles the response queue
             return
             
         try:
@@ -43,6 +99,11 @@ class UserLookupService:
             # Process the response asynchronously
             self._process_user_lookup_response(request_id, message_data)
             
+            # Wake anyone waiting on this request (in this process)
+            waiter = self.pending_requests.get(request_id)
+            if waiter:
+                waiter.complete(message_data)
+            
             return True
             
         except Exception as e:
@@ -144,13 +205,11 @@ class UserLookupService:
         
         request_id = str(uuid.uuid4())
         
+        # Drop waiters nobody collected
+        self.cleanup_old_requests()
+        
         # Store pending request
-        self.pending_requests[request_id] = {
-            "phone_or_email": phone_or_email,
-            "group_slug": group_slug,
-            "completed": False,
-            "response": None
-        }
+        self.pending_requests[request_id] = LookupWaiter(phone_or_email, group_slug)
         
         # Publish lookup request
         success = self.producer.publish_user_lookup_request(
@@ -178,49 +237,44 @@ class UserLookupService:
         Returns:
             Dict containing user data if found, None otherwise
         """
-        import time
+        waiter = self.pending_requests.get(request_id)
+        if waiter is None:
+            logger.warning(f"Request {request_id} not found")
+            return None
         
-        start_time = time.time()
+        completed = waiter.event.wait(timeout)
+        # Clean up the request either way
+        self.pending_requests.pop(request_id, None)
         
-        while time.time() - start_time < timeout:
-            if request_id in self.pending_requests:
-                request_data = self.pending_requests[request_id]
-                
-                if request_data["completed"]:
-                    response = request_data["response"]
-                    # Clean up completed request
-                    del self.pending_requests[request_id]
-                    
-                    if response and response.get("success"):
-                        return response.get("user_data")
-                    else:
-                        return None
-                
-                time.sleep(0.1)  # Small delay to avoid busy waiting
-            else:
-                logger.warning(f"Request {request_id} not found")
-                return None
+        if not completed:
+            logger.warning(f"User lookup request {request_id} timed out")
+            return None
         
-        # Timeout reached
-        logger.warning(f"User lookup request {request_id} timed out")
-        if request_id in self.pending_requests:
-            del self.pending_requests[request_id]
+        response = waiter.response
+        if response and response.get("success"):
+            return response.get("user_data")
         return None
     
+    def wait_for_completion(self, request_id: str, timeout: float) -> bool:
+        """Block until the lookup response was processed; False on timeout or unknown request"""
+        waiter = self.pending_requests.get(request_id)
+        return waiter is not None and waiter.event.wait(timeout)
+    
+    async def wait_for_completion_async(self, request_id: str, timeout: float) -> bool:
+        """Await the lookup response without blocking the event loop"""
+        waiter = self.pending_requests.get(request_id)
+        return waiter is not None and await waiter.wait_async(timeout)
+    
     def cleanup_old_requests(self, max_age_seconds: int = 300):
         """Clean up old pending requests"""
-        import time
-        
         current_time = time.time()
-        to_remove = []
-        
-        for request_id, request_data in self.pending_requests.items():
-            # Assuming requests older than max_age_seconds should be cleaned up
-            if current_time - request_data.get("timestamp", current_time) > max_age_seconds:
-                to_remove.append(request_id)
+        to_remove = [
+            request_id for request_id, waiter in list(self.pending_requests.items())
+            if current_time - waiter.created_at > max_age_seconds
+        ]
         
         for request_id in to_remove:
-            del self.pending_requests[request_id]
+            self.pending_requests.pop(request_id, None)
             logger.info(f"Cleaned up old request: {request_id}")
 
 
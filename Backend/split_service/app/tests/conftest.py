@@ -6,10 +6,14 @@ from decimal import Decimal
 from datetime import datetime
 from typing import Dict, List
 from unittest.mock import Mock, MagicMock
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
 
 from app.utils.min_cash_flow import calculate_balances, min_cash_flow
 from app.schemas.expense_schema import DebtSummary
 from app.schemas.settlement_schema import OptimizedSettlement
+from app.db.database import Base
 
 
 @pytest.fixture
@@ -76,6 +80,52 @@ def mock_db_session():
     return session
 
 
+@pytest.fixture
+def db_session():
+    """In-memory SQLite session with all tables created."""
+    import app.models  # noqa: F401  register models on Base.metadata
+
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool
+    )
+    Base.metadata.create_all(bind=engine)
+    session = sessionmaker(autocommit=False, autoflush=False, bind=engine)()
+    try:
+        yield session
+    finally:
+        session.close()
+        engine.dispose()
+
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    """Start every test with empty in-process caches."""
+    from app.cache.group_slug_cache import get_group_slug_cache
+    from app.cache.membership_cache import get_membership_cache
+    from app.cache.user_info_cache import get_user_info_cache
+
+    get_membership_cache().clear()
+    get_group_slug_cache().clear()
+    get_user_info_cache().clear()
+    yield
+
+
+@pytest.fixture
+def group(db_session):
+    """Group with members A (admin), B, C and D."""
+    from app.models.groups import Group, GroupMember
+
+    group = Group(name="Trip", slug="trip", created_by="A")
+    db_session.add(group)
+    db_session.flush()
+    for user_id in ["A", "B", "C", "D"]:
+        db_session.add(GroupMember(group_id=group.id, user_id=user_id, is_admin=user_id == "A"))
+    db_session.commit()
+    return group
+
+
 def verify_settlements_settle_debts(balances: Dict[str, Decimal], settlements: List[Dict]) -> None:
     """
     Helper to verify settlements settle all debts.
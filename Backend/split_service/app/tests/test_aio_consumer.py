@@ -0,0 +1,143 @@
+"""
+Tests for the asyncio RabbitMQ consumer dispatch.
+"""
+import asyncio
+import json
+import threading
+
+import pytest
+
+from app.rabbitmq.aio_consumer import AsyncRabbitMQConsumer, QueueHandler
+
+
+class FakeMessage:
+    def __init__(self, body, reply_to=None):
+        self.body = body if isinstance(body, bytes) else json.dumps(body).encode()
+        self.reply_to = reply_to
+        self.outcome = None
+
+    async def ack(self):
+        self.outcome = "ack"
+
+    async def nack(self, requeue=True):
+        self.outcome = f"nack(requeue={requeue})"
+
+    async def reject(self, requeue=False):
+        self.outcome = f"reject(requeue={requeue})"
+
+
+class FakeQueue:
+    def __init__(self, name):
+        self.name = name
+        self.callback = None
+
+    async def bind(self, exchange, routing_key):
+        self.bound = (exchange, routing_key)
+
+    async def consume(self, callback, no_ack):
+        assert not no_ack
+        self.callback = callback
+
+
+class FakeChannel:
+    def __init__(self):
+        self.queues = {}
+
+    async def declare_queue(self, name="", **kwargs):
+        queue = FakeQueue(name or "amq.gen-1")
+        self.queues[queue.name] = queue
+        return queue
+
+    async def declare_exchange(self, name, exchange_type, durable):
+        return name
+
+
+def consumer(concurrency=4):
+    consumer = AsyncRabbitMQConsumer(prefetch_count=8, concurrency=concurrency)
+    consumer._semaphore = asyncio.Semaphore(concurrency)
+    return consumer
+
+
+@pytest.mark.asyncio
+async def test_ack_and_nack_follow_handler_result():
+    handler = QueueHandler("q", lambda data: data["ok"])
+    fail_fast = QueueHandler("q", lambda data: data["ok"], requeue_on_failure=False)
+    messages = [FakeMessage({"ok": True}), FakeMessage({"ok": False}), FakeMessage({"ok": False})]
+
+    await consumer().dispatch(handler, messages[0])
+    await consumer().dispatch(handler, messages[1])
+    await consumer().dispatch(fail_fast, messages[2])
+
+    assert [message.outcome for message in messages] == ["ack", "nack(requeue=True)", "nack(requeue=False)"]
+
+
+@pytest.mark.asyncio
+async def test_bad_json_and_handler_errors():
+    def explode(data):
+        raise ValueError("boom")
+
+    bad_json = FakeMessage(b"{not json")
+    error = FakeMessage({"x": 1})
+    await consumer().dispatch(QueueHandler("q", explode), bad_json)
+    await consumer().dispatch(QueueHandler("q", explode), error)
+
+    assert bad_json.outcome == "reject(requeue=False)"
+    assert error.outcome == "nack(requeue=True)"
+
+
+@pytest.mark.asyncio
+async def test_handlers_receive_properties_and_coroutines_are_awaited():
+    seen = []
+
+    async def handler(data, properties):
+        seen.append((data["n"], properties.reply_to))
+        return True
+
+    message = FakeMessage({"n": 1}, reply_to="amq.rabbitmq.reply-to.abc")
+    await consumer().dispatch(QueueHandler("q", handler, with_properties=True), message)
+
+    assert seen == [(1, "amq.rabbitmq.reply-to.abc")]
+    assert message.outcome == "ack"
+
+
+@pytest.mark.asyncio
+async def test_sync_handlers_run_concurrently_up_to_the_limit():
+    running = 0
+    peak = 0
+    lock = threading.Lock()
+    release = threading.Event()
+
+    def handler(data):
+        nonlocal running, peak
+        with lock:
+            running += 1
+            peak = max(peak, running)
+        release.wait(timeout=5)
+        with lock:
+            running -= 1
+        return True
+
+    instance = consumer(concurrency=3)
+    channel = FakeChannel()
+    await instance._consume(channel, QueueHandler("work", handler))
+    messages = [FakeMessage({"n": n}) for n in range(8)]
+    for message in messages:
+        await channel.queues["work"].callback(message)
+
+    await asyncio.sleep(0.2)
+    assert peak == 3
+    release.set()
+    await asyncio.gather(*instance._tasks)
+
+    assert all(message.outcome == "ack" for message in messages)
+    assert instance.stats()["in_flight"] == 0
+
+
+@pytest.mark.asyncio
+async def test_server_named_queue_is_bound_to_exchange():
+    channel = FakeChannel()
+    await consumer()._consume(
+        channel, QueueHandler("", lambda data: True, exchange="user.events.exchange", routing_key="user.updated")
+    )
+
+    assert channel.queues["amq.gen-1"].bound == ("user.events.exchange", "user.updated")
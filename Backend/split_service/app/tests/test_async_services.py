@@ -0,0 +1,157 @@
+"""
+Tests for the async service functions and routes used in DB_ASYNC_MODE.
+"""
+import pytest
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+pytest.importorskip("aiosqlite")
+
+import httpx
+import pytest_asyncio
+from fastapi import FastAPI
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+from app.api.v1.routes import async_routes
+from app.api.v1.routes.groups import get_current_user_id
+from app.db.async_database import get_async_db, to_async_url
+from app.db.database import Base
+from app.models.groups import Group, GroupMember
+from app.models.settlements import Settlement
+from app.schemas.expense_schema import BulkExpenseItem, ExpenseShareCreate
+from app.services.expense_service import (
+    create_expenses_bulk, get_debt_summary, get_debt_summary_async,
+    get_group_expenses_page, get_group_expenses_page_async, optimize_settlements
+)
+from app.services.group_service import (
+    get_user_groups_async, is_group_admin_async, is_group_member_async, resolve_group_slug_async
+)
+from app.services.settlement_service import get_group_settlements_page, get_group_settlements_page_async
+
+
+def seed(db):
+    """Group "trip" with members A (admin), B, C, 7 expenses paid by A and 5 settlements."""
+    group = Group(name="Trip", slug="trip", created_by="A")
+    db.add(group)
+    db.flush()
+    for user_id in ["A", "B", "C"]:
+        db.add(GroupMember(group_id=group.id, user_id=user_id, is_admin=user_id == "A"))
+    db.commit()
+
+    create_expenses_bulk(db, group.id, [
+        BulkExpenseItem(
+            group_category_id="cat",
+            title=f"Expense {i}",
+            amount=Decimal("30"),
+            date=datetime(2026, 1, 1) + timedelta(days=i),
+            shares=[ExpenseShareCreate(user_id=user_id, share_amount=Decimal("15")) for user_id in ["B", "C"]]
+        )
+        for i in range(7)
+    ], "A")
+    start = datetime(2026, 2, 1)
+    db.add_all(
+        Settlement(group_id=group.id, from_user_id="B", to_user_id="A", amount=Decimal("1"),
+                   settled_at=start + timedelta(hours=i))
+        for i in range(5)
+    )
+    db.commit()
+    return group.id
+
+
+@pytest_asyncio.fixture
+async def async_db():
+    engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+    async with engine.begin() as connection:
+        import app.models  # noqa: F401  register models on Base.metadata
+        await connection.run_sync(Base.metadata.create_all)
+    async with async_sessionmaker(engine, expire_on_commit=False)() as session:
+        yield session
+    await engine.dispose()
+
+
+@pytest_asyncio.fixture
+async def group_id(async_db):
+    return await async_db.run_sync(seed)
+
+
+def test_to_async_url():
+    assert to_async_url("postgresql://u:p@db:5432/split") == "postgresql+asyncpg://u:p@db:5432/split"
+    assert to_async_url("postgresql+psycopg2://u:p@db/split") == "postgresql+asyncpg://u:p@db/split"
+    assert to_async_url("sqlite:///./app/db/split_service.db") == "sqlite+aiosqlite:///./app/db/split_service.db"
+
+
+@pytest.mark.asyncio
+class TestAsyncServices:
+    """Async service functions return what their sync counterparts return."""
+
+    async def test_group_lookups(self, async_db, group_id):
+        assert (await resolve_group_slug_async(async_db, "trip")).id == group_id
+        assert await resolve_group_slug_async(async_db, "nope") is None
+        assert await is_group_member_async(async_db, group_id, "B")
+        assert not await is_group_member_async(async_db, group_id, "Z")
+        assert await is_group_admin_async(async_db, group_id, "A")
+        assert [group.slug for group in await get_user_groups_async(async_db, "C")] == ["trip"]
+
+    async def test_expense_pages_match_sync(self, async_db, group_id):
+        expected, expected_cursor = await async_db.run_sync(
+            lambda db: get_group_expenses_page(db, group_id, limit=3)
+        )
+        expenses, cursor = await get_group_expenses_page_async(async_db, group_id, limit=3)
+        assert [expense.id for expense in expenses] == [expense.id for expense in expected]
+        assert cursor == expected_cursor
+        assert all(len(expense.shares) == 2 for expense in expenses)
+
+        rest, cursor = await get_group_expenses_page_async(async_db, group_id, cursor=cursor, limit=10)
+        assert len(rest) == 4 and cursor is None
+
+        filtered, _ = await get_group_expenses_page_async(async_db, group_id, date_from=datetime(2026, 1, 6))
+        assert sorted(expense.title for expense in filtered) == ["Expense 5", "Expense 6"]
+
+    async def test_settlement_pages_match_sync(self, async_db, group_id):
+        expected, _ = await async_db.run_sync(lambda db: get_group_settlements_page(db, group_id, limit=2))
+        settlements, cursor = await get_group_settlements_page_async(async_db, group_id, limit=2)
+        assert [settlement.id for settlement in settlements] == [settlement.id for settlement in expected]
+
+        remaining = []
+        while cursor:
+            page, cursor = await get_group_settlements_page_async(async_db, group_id, cursor=cursor, limit=2)
+            remaining.extend(page)
+        assert len(remaining) == 3
+
+    async def test_debt_summary_matches_sync(self, async_db, group_id):
+        expected = await async_db.run_sync(lambda db: get_debt_summary(db, group_id))
+        assert await get_debt_summary_async(async_db, group_id) == expected
+
+
+@pytest.mark.asyncio
+class TestAsyncRoutes:
+    """Async routers serve the same paths as the sync ones."""
+
+    @pytest_asyncio.fixture
+    async def client(self, async_db, group_id):
+        app = FastAPI()
+        app.include_router(async_routes.groups_router)
+        app.include_router(async_routes.expenses_router)
+        app.include_router(async_routes.settlements_router)
+        app.dependency_overrides[get_async_db] = lambda: async_db
+        app.dependency_overrides[get_current_user_id] = lambda: "B"
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+            yield client
+
+    async def test_expense_listing(self, client):
+        response = await client.get("/expenses/groups/trip", params={"limit": 5})
+        assert response.status_code == 200
+        body = response.json()
+        assert len(body["items"]) == 5
+        assert body["next_cursor"]
+
+    async def test_unknown_group(self, client):
+        response = await client.get("/settlements/groups/nope/debts")
+        assert response.status_code == 404
+
+    async def test_optimize(self, client, async_db, group_id):
+        expected = optimize_settlements(await get_debt_summary_async(async_db, group_id), strategy="optimal")
+        response = await client.get("/settlements/groups/trip/optimize", params={"strategy": "optimal"})
+        assert response.status_code == 200
+        assert response.json() == [settlement.model_dump(mode="json") for settlement in expected]
@@ -0,0 +1,211 @@
+"""
+Tests for the balance engine and the materialized group balances ledger.
+"""
+import pytest
+from datetime import datetime
+from decimal import Decimal
+from sqlalchemy import event
+
+from app.models.expenses import Expense, ExpenseShare
+from app.models.groups import Group, GroupMember
+from app.models.settlements import Settlement
+from app.models.balances import GroupBalance
+from app.schemas.expense_schema import ExpenseCreate, ExpenseShareCreate
+from app.schemas.settlement_schema import SettlementCreate
+from app.services.balance_service import (
+    backfill_group_balances,
+    compute_group_balances,
+    read_group_balances,
+    reconcile_group_balances
+)
+from app.services.expense_service import (
+    create_expense, delete_expense, get_debt_summary, settle_expense_share
+)
+from app.services.settlement_service import create_settlement
+
+
+def add_expense(db, group_id, paid_by, shares, settled=()):
+    """Create an expense with the given {user_id: amount} shares."""
+    expense = Expense(
+        group_id=group_id,
+        group_category_id="cat",
+        title="Expense",
+        amount=sum(shares.values()),
+        paid_by=paid_by,
+        date=datetime.utcnow()
+    )
+    db.add(expense)
+    db.flush()
+    for user_id, amount in shares.items():
+        db.add(ExpenseShare(
+            expense_id=expense.id,
+            user_id=user_id,
+            share_amount=amount,
+            is_settled=user_id in settled
+        ))
+    db.commit()
+    return expense
+
+
+@pytest.mark.unit
+class TestComputeGroupBalances:
+    """Test compute_group_balances() against hand-computed sums."""
+
+    def test_members_without_activity_have_zero_balances(self, db_session, group):
+        summary = compute_group_balances(db_session, group.id)
+
+        assert sorted(debt.user_id for debt in summary) == ["A", "B", "C", "D"]
+        for debt in summary:
+            assert debt.total_owed == Decimal("0")
+            assert debt.total_owes == Decimal("0")
+            assert debt.net_balance == Decimal("0")
+
+    def test_expenses_and_settlements(self, db_session, group):
+        add_expense(db_session, group.id, "A", {"A": Decimal("40"), "B": Decimal("40"), "C": Decimal("40")})
+        add_expense(db_session, group.id, "B", {"B": Decimal("30"), "C": Decimal("30")}, settled={"C"})
+        db_session.add(Settlement(group_id=group.id, from_user_id="C", to_user_id="A", amount=Decimal("15")))
+        db_session.commit()
+
+        summary = {debt.user_id: debt for debt in compute_group_balances(db_session, group.id)}
+
+        # A paid 120 (all unsettled), received 15
+        assert summary["A"].total_owed == Decimal("120")
+        assert summary["A"].total_owes == Decimal("0")
+        assert summary["A"].net_balance == Decimal("105")
+        # B paid 60 (only its own 30 share unsettled) and owes 40 to A
+        assert summary["B"].total_owed == Decimal("30")
+        assert summary["B"].total_owes == Decimal("40")
+        assert summary["B"].net_balance == Decimal("-10")
+        # C owes 40 to A (settled share to B is ignored) and paid 15
+        assert summary["C"].total_owed == Decimal("0")
+        assert summary["C"].total_owes == Decimal("40")
+        assert summary["C"].net_balance == Decimal("-25")
+        assert summary["D"].net_balance == Decimal("0")
+
+    def test_other_groups_are_ignored(self, db_session, group):
+        other = Group(name="Other", slug="other", created_by="A")
+        db_session.add(other)
+        db_session.commit()
+        add_expense(db_session, other.id, "A", {"B": Decimal("50")})
+        db_session.add(Settlement(group_id=other.id, from_user_id="B", to_user_id="A", amount=Decimal("50")))
+        db_session.commit()
+
+        for debt in compute_group_balances(db_session, group.id):
+            assert debt.net_balance == Decimal("0")
+
+    def test_single_query_regardless_of_member_count(self, db_session, group):
+        for i in range(20):
+            db_session.add(GroupMember(group_id=group.id, user_id=f"extra-{i}"))
+        add_expense(db_session, group.id, "A", {"A": Decimal("10"), "extra-0": Decimal("10")})
+        group_id = group.id
+
+        statements = []
+        engine = db_session.get_bind()
+        listener = lambda *args: statements.append(args[2])
+        event.listen(engine, "before_cursor_execute", listener)
+        try:
+            summary = compute_group_balances(db_session, group_id)
+        finally:
+            event.remove(engine, "before_cursor_execute", listener)
+
+        assert len(summary) == 24
+        assert len(statements) == 1
+
+
+def create_via_service(db, group_id, paid_by, shares):
+    """Create an expense through expense_service so the ledger is maintained."""
+    expense_data = ExpenseCreate(
+        group_category_id="cat",
+        title="Expense",
+        amount=sum(shares.values()),
+        date=datetime.utcnow()
+    )
+    shares_data = [ExpenseShareCreate(user_id=user_id, share_amount=amount) for user_id, amount in shares.items()]
+    return create_expense(db, group_id, expense_data, paid_by, shares_data)
+
+
+def assert_ledger_matches_history(db, group_id):
+    ledger = {debt.user_id: debt for debt in read_group_balances(db, group_id)}
+    history = {debt.user_id: debt for debt in compute_group_balances(db, group_id)}
+    assert ledger == history
+    assert reconcile_group_balances(db, group_id) == []
+
+
+@pytest.mark.unit
+class TestGroupBalanceLedger:
+    """Test that the service write paths keep group_balances in sync with history."""
+
+    def test_create_expense_updates_ledger(self, db_session, group):
+        create_via_service(db_session, group.id, "A", {"A": Decimal("10"), "B": Decimal("20"), "C": Decimal("30")})
+
+        summary = {debt.user_id: debt for debt in get_debt_summary(db_session, group.id)}
+        assert summary["A"].net_balance == Decimal("60")
+        assert summary["B"].net_balance == Decimal("-20")
+        assert summary["C"].net_balance == Decimal("-30")
+        assert_ledger_matches_history(db_session, group.id)
+
+    def test_settle_delete_and_settlement_keep_ledger_in_sync(self, db_session, group):
+        first = create_via_service(db_session, group.id, "A", {"B": Decimal("25"), "C": Decimal("25")})
+        second = create_via_service(db_session, group.id, "B", {"A": Decimal("12.50"), "D": Decimal("12.50")})
+        assert_ledger_matches_history(db_session, group.id)
+
+        share = db_session.query(ExpenseShare).filter(
+            ExpenseShare.expense_id == first.id, ExpenseShare.user_id == "C"
+        ).first()
+        settle_expense_share(db_session, share.id, "C")
+        # Settling twice must not subtract the share again
+        settle_expense_share(db_session, share.id, "C")
+        assert_ledger_matches_history(db_session, group.id)
+
+        create_settlement(db_session, group.id, SettlementCreate(
+            from_user_id="D", to_user_id="B", amount=Decimal("5")
+        ), "D")
+        assert_ledger_matches_history(db_session, group.id)
+
+        delete_expense(db_session, second.id, "B")
+        assert_ledger_matches_history(db_session, group.id)
+
+    def test_reconcile_reports_and_repairs_drift(self, db_session, group):
+        create_via_service(db_session, group.id, "A", {"B": Decimal("40")})
+        row = db_session.query(GroupBalance).filter(
+            GroupBalance.group_id == group.id, GroupBalance.user_id == "B"
+        ).first()
+        row.net_balance = Decimal("-1")
+        db_session.commit()
+
+        drift = reconcile_group_balances(db_session, group.id)
+        assert drift == [{
+            "user_id": "B", "field": "net_balance", "stored": Decimal("-1"), "expected": Decimal("-40")
+        }]
+
+        reconcile_group_balances(db_session, group.id, repair=True)
+        assert_ledger_matches_history(db_session, group.id)
+
+    def test_repair_upserts_rows_created_concurrently(self, db_session, group, monkeypatch):
+        from sqlalchemy.orm import Query
+
+        add_expense(db_session, group.id, "A", {"B": Decimal("15"), "C": Decimal("5")})
+        # Another replica's repair wrote B's row after this one read the ledger
+        db_session.add(GroupBalance(group_id=group.id, user_id="B", version=1))
+        db_session.commit()
+        original_all = Query.all
+        calls = []
+
+        def all_missing_once(self):
+            calls.append(self)
+            return [] if len(calls) == 1 else original_all(self)
+
+        monkeypatch.setattr(Query, "all", all_missing_once)
+        reconcile_group_balances(db_session, group.id, repair=True)
+        monkeypatch.setattr(Query, "all", original_all)
+
+        assert_ledger_matches_history(db_session, group.id)
+
+    def test_backfill_builds_ledger_for_groups_with_history(self, db_session, group):
+        # Written directly, as before the ledger existed
+        add_expense(db_session, group.id, "A", {"B": Decimal("15"), "C": Decimal("5")})
+        assert db_session.query(GroupBalance).count() == 0
+
+        assert backfill_group_balances(db_session) == [group.id]
+        assert_ledger_matches_history(db_session, group.id)
+        assert backfill_group_balances(db_session) == []
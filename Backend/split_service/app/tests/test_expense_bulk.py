@@ -0,0 +1,145 @@
+"""
+Tests for bulk expense creation.
+"""
+import pytest
+from datetime import datetime
+from decimal import Decimal
+from fastapi import HTTPException
+from sqlalchemy import event
+
+from app.models.expenses import Expense, ExpenseShare
+from app.models.groups import RoundingOption
+from app.schemas.expense_schema import BulkExpenseItem, ExpenseCreate, ExpenseShareCreate
+from app.services.balance_service import reconcile_group_balances
+from app.services.expense_service import create_expense, create_expenses_bulk, get_debt_summary
+
+
+def item(amount, shares):
+    return BulkExpenseItem(
+        group_category_id="cat",
+        title="Receipt",
+        amount=Decimal(amount),
+        date=datetime.utcnow(),
+        shares=[ExpenseShareCreate(user_id=user_id, share_amount=Decimal(value)) for user_id, value in shares.items()]
+    )
+
+
+@pytest.mark.unit
+class TestCreateExpensesBulk:
+    """Test create_expenses_bulk()."""
+
+    def test_creates_valid_items_and_reports_invalid_ones(self, db_session, group):
+        items = [
+            item("30", {"A": "10", "B": "10", "C": "10"}),
+            item("20", {"A": "10", "B": "5"}),    # shares do not add up
+            item("10", {"A": "5", "Z": "5"}),     # Z is not a member
+            item("8", {"D": "8"}),
+        ]
+
+        result = create_expenses_bulk(db_session, group.id, items, "A")
+
+        assert [error.index for error in result.errors] == [1, 2]
+        assert result.errors[0].detail == "Total shares must equal expense amount"
+        assert result.errors[1].detail == "User Z is not a member of this group"
+        assert len(result.created) == 2
+        assert db_session.query(Expense).count() == 2
+        assert db_session.query(ExpenseShare).count() == 4
+
+        stored = {expense.id for expense in db_session.query(Expense).all()}
+        assert stored == {expense.id for expense in result.created}
+
+        summary = {debt.user_id: debt.net_balance for debt in get_debt_summary(db_session, group.id)}
+        assert summary == {"A": Decimal("38"), "B": Decimal("-10"), "C": Decimal("-10"), "D": Decimal("-8")}
+        assert reconcile_group_balances(db_session, group.id) == []
+
+    def test_rejects_non_member_payer(self, db_session, group):
+        with pytest.raises(HTTPException) as exc:
+            create_expenses_bulk(db_session, group.id, [item("5", {"A": "5"})], "Z")
+        assert exc.value.status_code == 403
+
+    def test_statement_count_does_not_grow_with_batch_size(self, db_session, group):
+        group_id = group.id
+        # Warm up so the running balance rows already exist for both measured calls
+        create_expenses_bulk(db_session, group_id, [item("10", {"B": "10"})], "A")
+
+        statements = []
+        engine = db_session.get_bind()
+        listener = lambda *args: statements.append(args[2])
+        event.listen(engine, "before_cursor_execute", listener)
+        try:
+            create_expenses_bulk(db_session, group_id, [item("10", {"B": "10"})] * 5, "A")
+            small = len(statements)
+            statements.clear()
+            create_expenses_bulk(db_session, group_id, [item("10", {"B": "10"})] * 200, "A")
+        finally:
+            event.remove(engine, "before_cursor_execute", listener)
+
+        assert len(statements) == small
+        assert db_session.query(Expense).count() == 206
+
+
+def split_item(amount, user_ids, weights=None):
+    """Bulk item whose shares leave the amounts to the allocator"""
+    return BulkExpenseItem(
+        group_category_id="cat",
+        title="Split",
+        amount=Decimal(amount),
+        date=datetime.utcnow(),
+        shares=[
+            ExpenseShareCreate(user_id=user_id, weight=weights[user_id] if weights else None)
+            for user_id in user_ids
+        ]
+    )
+
+
+def stored_shares(db_session, expense_id):
+    shares = db_session.query(ExpenseShare).filter(ExpenseShare.expense_id == expense_id).all()
+    return {share.user_id: share.share_amount for share in shares}
+
+
+@pytest.mark.unit
+class TestAllocatedShares:
+    """Test expenses whose share amounts are allocated from the expense amount."""
+
+    def test_equal_split_conserves_cents(self, db_session, group):
+        expense = create_expense(
+            db_session, group.id,
+            ExpenseCreate(group_category_id="cat", title="Taxi", amount=Decimal("100"), date=datetime.utcnow()),
+            "B", [ExpenseShareCreate(user_id=user_id) for user_id in ["A", "B", "C"]]
+        )
+
+        shares = stored_shares(db_session, expense.id)
+        assert shares == {"A": Decimal("33.34"), "B": Decimal("33.33"), "C": Decimal("33.33")}
+        assert sum(shares.values()) == Decimal("100")
+        assert reconcile_group_balances(db_session, group.id) == []
+
+    @pytest.mark.parametrize("rounding, payer_share", [
+        (RoundingOption.up, Decimal("33.32")),
+        (RoundingOption.down, Decimal("33.34")),
+    ])
+    def test_group_rounding_option(self, db_session, group, rounding, payer_share):
+        group.rounding_option = rounding
+        db_session.commit()
+
+        result = create_expenses_bulk(db_session, group.id, [split_item("100", ["A", "B", "C"])], "B")
+
+        shares = stored_shares(db_session, result.created[0].id)
+        assert shares["B"] == payer_share
+        assert sum(shares.values()) == Decimal("100")
+
+    def test_weighted_split(self, db_session, group):
+        weights = {"A": Decimal("1"), "B": Decimal("2"), "C": Decimal("3")}
+        result = create_expenses_bulk(db_session, group.id, [split_item("1", ["A", "B", "C"], weights)], "A")
+
+        assert stored_shares(db_session, result.created[0].id) == {
+            "A": Decimal("0.17"), "B": Decimal("0.33"), "C": Decimal("0.50")
+        }
+
+    def test_mixed_amounts_rejected(self, db_session, group):
+        mixed = split_item("10", ["A", "B"])
+        mixed.shares[0].share_amount = Decimal("5")
+
+        result = create_expenses_bulk(db_session, group.id, [mixed], "A")
+
+        assert result.created == []
+        assert result.errors[0].detail == "Either every share or no share must have an amount"
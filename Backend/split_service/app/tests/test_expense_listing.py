@@ -0,0 +1,71 @@
+"""
+Regression tests for the group expense listing query count.
+"""
+import pytest
+from datetime import datetime
+from decimal import Decimal
+from sqlalchemy import event
+
+from app.schemas.expense_schema import BulkExpenseItem, ExpenseShareCreate, ExpenseWithShares
+from app.services.expense_service import create_expenses_bulk, get_group_expenses
+
+
+def seed_expenses(db, group_id, count):
+    items = [
+        BulkExpenseItem(
+            group_category_id="cat",
+            title=f"Expense {i}",
+            amount=Decimal("30"),
+            date=datetime.utcnow(),
+            shares=[
+                ExpenseShareCreate(user_id=user_id, share_amount=Decimal("10"))
+                for user_id in ["A", "B", "C"]
+            ]
+        )
+        for i in range(count)
+    ]
+    create_expenses_bulk(db, group_id, items, "A")
+
+
+def list_with_shares(db, group_id):
+    """Return (serialized listing, executed statement count)."""
+    db.expire_all()
+    statements = []
+    engine = db.get_bind()
+    listener = lambda *args: statements.append(args[2])
+    event.listen(engine, "before_cursor_execute", listener)
+    try:
+        listing = [
+            ExpenseWithShares.model_validate(expense)
+            for expense in get_group_expenses(db, group_id, include_shares=True)
+        ]
+    finally:
+        event.remove(engine, "before_cursor_execute", listener)
+    return listing, len(statements)
+
+
+@pytest.mark.unit
+class TestGroupExpenseListing:
+    """Test that listing expenses with shares avoids N+1 queries."""
+
+    def test_listing_includes_shares(self, db_session, group):
+        group_id = group.id
+        seed_expenses(db_session, group_id, 3)
+
+        listing, _ = list_with_shares(db_session, group_id)
+
+        assert len(listing) == 3
+        for expense in listing:
+            assert sorted(share.user_id for share in expense.shares) == ["A", "B", "C"]
+            assert all(share.expense_id == expense.id for share in expense.shares)
+
+    def test_query_count_is_constant(self, db_session, group):
+        group_id = group.id
+        seed_expenses(db_session, group_id, 5)
+        _, small = list_with_shares(db_session, group_id)
+
+        seed_expenses(db_session, group_id, 200)
+        listing, large = list_with_shares(db_session, group_id)
+
+        assert len(listing) == 205
+        assert small == large == 2
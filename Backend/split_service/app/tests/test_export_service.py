@@ -0,0 +1,81 @@
+"""
+Tests for the streaming group ledger export.
+"""
+import csv
+import io
+import json
+import pytest
+from datetime import datetime
+from decimal import Decimal
+from fastapi import HTTPException
+from sqlalchemy.orm import sessionmaker
+
+from app.schemas.expense_schema import BulkExpenseItem, ExpenseShareCreate
+from app.schemas.settlement_schema import SettlementCreate
+from app.services.expense_service import create_expenses_bulk
+from app.services.export_service import EXPORT_FIELDS, iter_group_ledger, stream_group_export
+from app.services.settlement_service import create_settlement
+
+
+@pytest.fixture
+def ledger_group(db_session, group):
+    """Group with two expenses (three shares each) and one settlement."""
+    group_id = group.id
+    create_expenses_bulk(db_session, group_id, [
+        BulkExpenseItem(
+            group_category_id="food",
+            title=f"Meal {i}",
+            amount=Decimal("30.00"),
+            date=datetime(2026, 3, 1),
+            shares=[ExpenseShareCreate(user_id=user_id, share_amount=Decimal("10.00")) for user_id in ["A", "B", "C"]]
+        )
+        for i in range(2)
+    ], "A")
+    create_settlement(db_session, group_id, SettlementCreate(from_user_id="B", to_user_id="A", amount=Decimal("10.00")), "B")
+    return group_id
+
+
+def session_factory_for(db_session):
+    return sessionmaker(autocommit=False, autoflush=False, bind=db_session.get_bind())
+
+
+@pytest.mark.unit
+class TestGroupExport:
+    """Test exporting a group's ledger."""
+
+    def test_ledger_contains_every_record(self, db_session, ledger_group):
+        records = list(iter_group_ledger(db_session, ledger_group, batch_size=2))
+
+        counts = {}
+        for record in records:
+            counts[record["record_type"]] = counts.get(record["record_type"], 0) + 1
+        assert counts == {"expense": 2, "expense_share": 6, "settlement": 1}
+        assert all(set(record) <= set(EXPORT_FIELDS) for record in records)
+
+    def test_ndjson_export(self, db_session, ledger_group):
+        body = "".join(stream_group_export(ledger_group, "ndjson", session_factory_for(db_session)))
+
+        lines = [json.loads(line) for line in body.splitlines()]
+        assert len(lines) == 9
+        settlement = next(line for line in lines if line["record_type"] == "settlement")
+        assert settlement["amount"] == "10.00"
+        assert settlement["from_user_id"] == "B"
+
+    def test_csv_export(self, db_session, ledger_group):
+        body = "".join(stream_group_export(ledger_group, "csv", session_factory_for(db_session)))
+
+        rows = list(csv.DictReader(io.StringIO(body)))
+        assert len(rows) == 9
+        assert list(rows[0]) == EXPORT_FIELDS
+        assert sorted(row["title"] for row in rows if row["record_type"] == "expense") == ["Meal 0", "Meal 1"]
+        assert all(row["amount"] == "10.00" for row in rows if row["record_type"] == "expense_share")
+
+    def test_empty_group_csv_has_header_only(self, db_session, group):
+        body = "".join(stream_group_export(group.id, "csv", session_factory_for(db_session)))
+
+        assert body.strip().split(",") == EXPORT_FIELDS
+
+    def test_unsupported_format(self, group):
+        with pytest.raises(HTTPException) as exc:
+            stream_group_export(group.id, "xml")
+        assert exc.value.status_code == 400
@@ -0,0 +1,69 @@
+"""
+Tests for the group slug resolution cache.
+"""
+import pytest
+from sqlalchemy import event
+
+from app.cache.group_slug_cache import get_group_slug_cache
+from app.models.groups import RoundingOption
+from app.schemas.group_schema import GroupCreate, GroupUpdate
+from app.services.group_service import create_group, delete_group, resolve_group_slug, update_group
+
+
+def count_queries(db_session):
+    statements = []
+    event.listen(db_session.get_bind(), "before_cursor_execute", lambda *args: statements.append(args[2]))
+    return statements
+
+
+@pytest.mark.unit
+class TestGroupSlugCache:
+    """Test cached slug resolution."""
+
+    def test_resolves_and_caches(self, db_session, group):
+        group_id = group.id
+        statements = count_queries(db_session)
+
+        for _ in range(3):
+            ref = resolve_group_slug(db_session, "trip")
+            assert ref.id == group_id
+            assert ref.rounding_option == RoundingOption.none
+            assert ref.created_by == "A"
+
+        assert len(statements) == 1
+        assert get_group_slug_cache().stats()["hits"] == 2
+
+    def test_unknown_slug_is_cached(self, db_session, group):
+        statements = count_queries(db_session)
+
+        assert resolve_group_slug(db_session, "nope") is None
+        assert resolve_group_slug(db_session, "nope") is None
+
+        assert len(statements) == 1
+        assert get_group_slug_cache().stats()["negative_hits"] == 1
+
+    def test_create_group_clears_negative_entry(self, db_session):
+        assert resolve_group_slug(db_session, "road-trip") is None
+
+        group = create_group(db_session, GroupCreate(name="Road Trip"), "A")
+
+        assert resolve_group_slug(db_session, "road-trip").id == group.id
+
+    def test_update_group_moves_slug(self, db_session, group):
+        group_id = group.id
+        assert resolve_group_slug(db_session, "trip").id == group_id
+        assert resolve_group_slug(db_session, "holiday") is None
+
+        update_group(db_session, group_id, GroupUpdate(name="Holiday", rounding_option=RoundingOption.up), "A")
+
+        assert resolve_group_slug(db_session, "trip") is None
+        ref = resolve_group_slug(db_session, "holiday")
+        assert ref.id == group_id
+        assert ref.rounding_option == RoundingOption.up
+
+    def test_delete_group_clears_slug(self, db_session, group):
+        assert resolve_group_slug(db_session, "trip") is not None
+
+        delete_group(db_session, group.id, "A")
+
+        assert resolve_group_slug(db_session, "trip") is None
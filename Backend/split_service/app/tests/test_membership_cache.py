@@ -0,0 +1,200 @@
+"""
+Tests for the group membership cache.
+"""
+import threading
+
+import pytest
+from sqlalchemy import event
+
+from app.cache import connection as connection_module
+from app.cache.lru import LRUCache, MISSING
+from app.cache.membership_cache import get_membership_cache
+from app.services.group_service import (
+    add_member_to_group, delete_group, is_group_admin, is_group_member, remove_member_from_group
+)
+
+
+class FakeRedis:
+    """Minimal in-memory stand-in for the hash commands the cache uses"""
+
+    def __init__(self):
+        self.hashes = {}
+        self.values = {}
+
+    def hgetall(self, key):
+        self.last_thread = threading.current_thread()
+        return dict(self.hashes.get(key, {}))
+
+    def get(self, key):
+        return self.values.get(key)
+
+    def incr(self, key):
+        self.values[key] = str(int(self.values.get(key, 0)) + 1)
+
+    def delete(self, key):
+        self.hashes.pop(key, None)
+
+    def eval(self, script, numkeys, members_key, generation_key, expected, ttl, *pairs):
+        # Python equivalent of the conditional store script
+        if (self.values.get(generation_key) or "") != expected:
+            return 0
+        self.hashes[members_key] = dict(zip(pairs[::2], pairs[1::2]))
+        return 1
+
+    def pipeline(self):
+        return FakePipeline(self)
+
+
+class FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.commands = []
+
+    def incr(self, key):
+        self.commands.append(lambda: self.redis.incr(key))
+
+    def delete(self, key):
+        self.commands.append(lambda: self.redis.delete(key))
+
+    def expire(self, key, seconds):
+        pass
+
+    def execute(self):
+        for command in self.commands:
+            command()
+
+
+@pytest.fixture
+def fake_redis(monkeypatch):
+    redis = FakeRedis()
+    monkeypatch.setattr(connection_module.get_redis_connection(), "client", redis)
+    return redis
+
+
+def count_queries(db_session):
+    statements = []
+    event.listen(db_session.get_bind(), "before_cursor_execute", lambda *args: statements.append(args[2]))
+    return statements
+
+
+@pytest.mark.unit
+class TestLRUCache:
+    """Test the in-process LRU."""
+
+    def test_evicts_least_recently_used(self):
+        cache = LRUCache(maxsize=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+        assert cache.get("b") is MISSING
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+
+    def test_expired_entries_are_missing(self):
+        cache = LRUCache(maxsize=2, ttl=0)
+        cache.set("a", 1)
+        assert cache.get("a") is MISSING
+
+    def test_none_is_a_value(self):
+        cache = LRUCache(maxsize=2)
+        cache.set("a", None)
+        assert cache.get("a") is None
+
+
+@pytest.mark.unit
+class TestMembershipCache:
+    """Test cached membership and admin checks."""
+
+    def test_checks_share_one_query(self, db_session, group):
+        group_id = group.id
+        statements = count_queries(db_session)
+
+        assert is_group_member(db_session, group_id, "B")
+        assert is_group_admin(db_session, group_id, "A")
+        assert not is_group_admin(db_session, group_id, "B")
+        assert not is_group_member(db_session, group_id, "Z")
+
+        assert len(statements) == 1
+        assert get_membership_cache().stats()["misses"] == 1
+        assert get_membership_cache().stats()["local_hits"] == 3
+
+    def test_add_member_invalidates(self, db_session, group):
+        assert not is_group_member(db_session, group.id, "E")
+        add_member_to_group(db_session, group.id, "E")
+        assert is_group_member(db_session, group.id, "E")
+
+    def test_remove_member_invalidates(self, db_session, group):
+        assert is_group_member(db_session, group.id, "B")
+        remove_member_from_group(db_session, group.id, "B", "A")
+        assert not is_group_member(db_session, group.id, "B")
+
+    def test_delete_group_invalidates(self, db_session, group):
+        group_id = group.id
+        assert is_group_member(db_session, group_id, "B")
+        delete_group(db_session, group_id, "A")
+        assert get_membership_cache().local.get(group_id) is MISSING
+
+    def test_redis_layer_shared_between_processes(self, db_session, group, fake_redis):
+        cache = get_membership_cache()
+        assert is_group_admin(db_session, group.id, "A")
+        assert fake_redis.hgetall(f"split:group:{group.id}:members") == {"": "1", "A": "1", "B": "0", "C": "0", "D": "0"}
+
+        # Another worker starts with an empty local layer
+        cache.local.clear()
+        statements = count_queries(db_session)
+        assert is_group_member(db_session, group.id, "C")
+        assert statements == []
+        assert cache.stats()["redis_hits"] == 1
+
+        remove_member_from_group(db_session, group.id, "C", "A")
+        assert f"split:group:{group.id}:members" not in fake_redis.hashes
+        assert not is_group_member(db_session, group.id, "C")
+
+    def test_roster_loaded_before_a_change_is_not_stored(self, db_session, group, fake_redis):
+        cache = get_membership_cache()
+        group_id = group.id
+
+        changes = [group_id]
+
+        def change_during_load(*args):
+            # Another request removes C while this roster query is running
+            if changes:
+                cache.invalidate(changes.pop())
+
+        event.listen(db_session.get_bind(), "before_cursor_execute", change_during_load)
+        assert is_group_member(db_session, group_id, "C")
+
+        assert cache.local.get(group_id) is MISSING
+        assert f"split:group:{group_id}:members" not in fake_redis.hashes
+
+        # The next reader stores normally
+        assert is_group_member(db_session, group_id, "C")
+        assert f"split:group:{group_id}:members" in fake_redis.hashes
+
+    def test_redis_failure_falls_back_to_database(self, db_session, group, monkeypatch):
+        class BrokenRedis:
+            def hgetall(self, key):
+                raise ConnectionError("down")
+
+        connection = connection_module.get_redis_connection()
+        monkeypatch.setattr(connection, "client", BrokenRedis())
+        monkeypatch.setattr(connection, "_retry_at", 0.0)
+
+        assert is_group_member(db_session, group.id, "B")
+        assert connection.client is None
+        assert connection.get_client() is None
+
+
+@pytest.mark.asyncio
+async def test_async_lookup_reads_redis_off_the_event_loop(fake_redis):
+    cache = get_membership_cache()
+    cache.clear()
+    fake_redis.hashes["split:group:g-async:members"] = {"": "1", "u1": "1", "u2": "0"}
+
+    # A Redis hit needs no database session
+    members = await cache.get_members_async(None, "g-async")
+
+    assert members == {"u1": True, "u2": False}
+    assert fake_redis.last_thread is not threading.current_thread()
+    assert cache.stats()["redis_hits"] == 1
@@ -9,17 +9,113 @@ Tests cover:
 - Rounding tolerance
 """
 
+import itertools
+import random
 import pytest
 from decimal import Decimal
+from app.utils import min_cash_flow as min_cash_flow_module
 from app.utils.min_cash_flow import (
     calculate_balances,
+    from_minor_units,
     min_cash_flow,
     min_cash_flow_detailed,
     round_decimal,
+    to_minor_units,
     validate_balance_sum
 )
 
 
+class TestMinorUnits:
+    """Test conversion between Decimal amounts and integer cents."""
+    
+    def test_round_trip(self):
+        """Amounts survive conversion to cents and back."""
+        for amount in ["0", "0.01", "-10.50", "43.33", "99999999.99"]:
+            assert from_minor_units(to_minor_units(Decimal(amount))) == Decimal(amount)
+    
+    def test_rounds_half_even_like_round_decimal(self):
+        """Sub-cent amounts round exactly as round_decimal does."""
+        for amount in ["100.005", "100.015", "43.333333", "-0.005", "-0.015"]:
+            assert from_minor_units(to_minor_units(Decimal(amount))) == round_decimal(Decimal(amount))
+    
+    def test_non_decimal_input(self):
+        """Ints, floats and strings are accepted."""
+        assert to_minor_units(12) == 1200
+        assert to_minor_units("12.34") == 1234
+        assert to_minor_units(0.1) == 10
+    
+    def test_weighted_shares_conserve_cents(self):
+        """Weighted shares whose products both end in half a cent still add up to the amount."""
+        weight = Decimal(5) / Decimal(12)
+        expenses = [{
+            "payer": "A",
+            "amount": Decimal("2717.34"),
+            "participants": ["B", "C"],
+            "weights": {"B": weight, "C": Decimal(1) - weight},
+        }]
+        balances = calculate_balances(expenses)
+        assert balances == {"A": Decimal("2717.34"), "B": Decimal("-1132.23"), "C": Decimal("-1585.11")}
+
+
+def random_expenses(rng, count):
+    """Equal and weighted split expenses over a handful of users."""
+    users = [f"U{i}" for i in range(12)]
+    expenses = []
+    for _ in range(count):
+        participants = rng.sample(users, k=rng.randint(1, 6))
+        expense = {
+            "payer": rng.choice(users),
+            "amount": Decimal(rng.randint(1, 1000000)) / 100,
+            "participants": participants,
+        }
+        if rng.random() < 0.25:
+            weight = Decimal(1) / Decimal(len(participants))
+            expense["weights"] = {participant: weight for participant in participants}
+        expenses.append(expense)
+    return expenses
+
+
+class TestVectorizedBalances:
+    """Test calculate_balances(vectorized=True)."""
+    
+    @pytest.mark.parametrize("rounding", ["none", "up", "down"])
+    def test_matches_pure_python(self, rounding):
+        """Vectorized balances equal the pure Python ones, in the same key order."""
+        rng = random.Random(3)
+        expenses = random_expenses(rng, 500)
+        expenses.append({"payer": "Z", "amount": Decimal("100.015"), "participants": ["U1", "Z"]})
+        expenses.append({"payer": "Y", "amount": Decimal("5"), "participants": []})
+        # Rounding up would leave the payer with a negative share here
+        expenses.append({"payer": "U1", "amount": Decimal("0.02"), "participants": ["U1", "U2", "U3", "U4"]})
+        
+        expected = calculate_balances(expenses, rounding=rounding)
+        result = calculate_balances(expenses, vectorized=True, rounding=rounding)
+        
+        assert result == expected
+        assert list(result) == list(expected)
+        assert sum(result.values()) == 0
+    
+    def test_invalid_weights_rejected(self):
+        """Weight validation still applies."""
+        expenses = [{
+            "payer": "A",
+            "amount": Decimal("100"),
+            "participants": ["A", "B"],
+            "weights": {"A": Decimal("0.5"), "B": Decimal("0.3")},
+        }]
+        with pytest.raises(ValueError, match="Weights must sum to 1.0"):
+            calculate_balances(expenses, vectorized=True)
+    
+    def test_falls_back_without_numpy(self, monkeypatch):
+        """Without NumPy the pure Python path is used."""
+        monkeypatch.setattr(min_cash_flow_module, "np", None)
+        expenses = [{"payer": "A", "amount": Decimal("100"), "participants": ["A", "B", "C"]}]
+        
+        assert calculate_balances(expenses, vectorized=True) == {
+            "A": Decimal("66.66"), "B": Decimal("-33.33"), "C": Decimal("-33.33")
+        }
+
+
 class TestRoundDecimal:
     """Test the round_decimal utility function."""
     
@@ -85,6 +181,26 @@ class TestCalculateBalances:
         assert balances["A"] == Decimal("40.00")  # Paid 100, owes 60
         assert balances["B"] == Decimal("-40.00")  # Owed 40
     
+    def test_equal_split_conserves_cents(self):
+        """Leftover cents go to the first participants, so balances sum to exactly zero."""
+        expenses = [
+            {"payer": "A", "amount": Decimal("100"), "participants": ["A", "B", "C"]},
+            {"payer": "B", "amount": Decimal("0.05"), "participants": ["A", "B", "C"]},
+        ]
+        balances = calculate_balances(expenses)
+        assert balances == {"A": Decimal("66.64"), "B": Decimal("-33.30"), "C": Decimal("-33.34")}
+        assert sum(balances.values()) == 0
+    
+    @pytest.mark.parametrize("rounding, expected", [
+        ("none", {"A": Decimal("66.66"), "B": Decimal("-33.33"), "C": Decimal("-33.33")}),
+        ("down", {"A": Decimal("66.66"), "B": Decimal("-33.33"), "C": Decimal("-33.33")}),
+        ("up", {"A": Decimal("66.68"), "B": Decimal("-33.34"), "C": Decimal("-33.34")}),
+    ])
+    def test_rounding_options(self, rounding, expected):
+        """The group's rounding option decides who carries the leftover cent."""
+        expenses = [{"payer": "A", "amount": Decimal("100"), "participants": ["A", "B", "C"]}]
+        assert calculate_balances(expenses, rounding=rounding) == expected
+    
     def test_weighted_split_invalid_sum(self):
         """Test that invalid weight sums raise ValueError."""
         expenses = [
@@ -273,6 +389,96 @@ class TestMinCashFlowDetailed:
             assert len(logs) > 0
 
 
+def settle_totals(balances, settlements):
+    """Return each user's balance after applying the settlements."""
+    remaining = dict(balances)
+    for settlement in settlements:
+        remaining[settlement["from"]] += settlement["amount"]
+        remaining[settlement["to"]] -= settlement["amount"]
+    return remaining
+
+
+def brute_force_min_transactions(values):
+    """Minimum transfers = balances minus the most zero-sum groups they split into."""
+    def most_groups(items):
+        if not items:
+            return 0
+        first, rest = items[0], items[1:]
+        best = 0
+        for size in range(len(rest) + 1):
+            for combo in itertools.combinations(range(len(rest)), size):
+                if first + sum(rest[i] for i in combo) == 0:
+                    others = [rest[i] for i in range(len(rest)) if i not in combo]
+                    best = max(best, 1 + most_groups(others))
+        return best
+    return len(values) - most_groups(values)
+
+
+class TestOptimalStrategy:
+    """Test the optimal min_cash_flow strategy."""
+    
+    def test_fewer_transactions_than_greedy(self):
+        """Zero-sum subsets are settled separately."""
+        balances = {
+            "A": Decimal("10"), "B": Decimal("20"), "C": Decimal("-15"),
+            "D": Decimal("-15"), "E": Decimal("6"), "F": Decimal("-6"),
+            "G": Decimal("13"), "H": Decimal("-9"), "I": Decimal("-4"),
+        }
+        greedy = min_cash_flow(balances)
+        optimal = min_cash_flow(balances, strategy="optimal")
+        
+        assert len(optimal) == 6
+        assert len(optimal) < len(greedy)
+        assert all(abs(value) <= Decimal("0.01") for value in settle_totals(balances, optimal).values())
+    
+    def test_matches_brute_force(self):
+        """Transaction count equals the exhaustive optimum on random small groups."""
+        rng = random.Random(7)
+        for _ in range(40):
+            values = [Decimal(rng.choice([-30, -20, -10, 10, 20, 30])) for _ in range(rng.randint(2, 7))]
+            values.append(-sum(values))
+            balances = {f"U{i}": value for i, value in enumerate(values) if value != 0}
+            if not balances:
+                continue
+            
+            settlements = min_cash_flow(balances, strategy="optimal")
+            
+            assert len(settlements) == brute_force_min_transactions(list(balances.values()))
+            assert all(value == 0 for value in settle_totals(balances, settlements).values())
+    
+    def test_rounding_residual(self):
+        """A residual within tolerance is absorbed without extra transfers."""
+        balances = {"A": Decimal("33.34"), "B": Decimal("-16.67"), "C": Decimal("-16.66"), "D": Decimal("0")}
+        settlements = min_cash_flow(balances, strategy="optimal")
+        
+        assert len(settlements) == 2
+        assert all(abs(value) <= Decimal("0.01") for value in settle_totals(balances, settlements).values())
+    
+    def test_falls_back_to_greedy_above_cutoff(self):
+        """Above optimal_max_members the greedy result is returned."""
+        balances = {
+            "A": Decimal("10"), "B": Decimal("20"), "C": Decimal("-15"),
+            "D": Decimal("-15"), "E": Decimal("6"), "F": Decimal("-6"),
+        }
+        assert min_cash_flow(balances, strategy="optimal", optimal_max_members=4) == min_cash_flow(balances)
+    
+    def test_cutoff_defaults_to_configured_limit(self, monkeypatch):
+        """Without an explicit argument the configured OPTIMAL_MAX_MEMBERS applies."""
+        from app.utils import min_cash_flow as module
+
+        balances = {
+            "A": Decimal("10"), "B": Decimal("20"), "C": Decimal("-15"),
+            "D": Decimal("-15"), "E": Decimal("6"), "F": Decimal("-6"),
+        }
+        monkeypatch.setattr(module, "OPTIMAL_MAX_MEMBERS", 4)
+        assert min_cash_flow(balances, strategy="optimal") == min_cash_flow(balances)
+    
+    def test_unknown_strategy(self):
+        """Unsupported strategies are rejected."""
+        with pytest.raises(ValueError, match="Unknown settlement strategy"):
+            min_cash_flow({"A": Decimal("10"), "B": Decimal("-10")}, strategy="balanced")
+
+
 class TestIntegration:
     """Integration tests combining multiple functions."""
     
@@ -0,0 +1,170 @@
+"""
+Tests for keyset pagination of group expense and settlement listings.
+"""
+import pytest
+from datetime import datetime, timedelta
+from decimal import Decimal
+from fastapi import HTTPException
+
+from app.schemas.expense_schema import BulkExpenseItem, ExpenseShareCreate
+from app.models.settlements import Settlement
+from app.services.expense_service import create_expenses_bulk, get_group_expenses_page, settle_expense_share
+from app.services.settlement_service import get_group_settlements_page
+from app.utils.pagination import decode_cursor, encode_cursor
+
+
+def expense_item(title, date, category="cat", participants=("A", "B")):
+    return BulkExpenseItem(
+        group_category_id=category,
+        title=title,
+        amount=Decimal("10") * len(participants),
+        date=date,
+        shares=[ExpenseShareCreate(user_id=user_id, share_amount=Decimal("10")) for user_id in participants]
+    )
+
+
+def collect_pages(fetch, limit, max_pages=50):
+    """Follow next_cursor until exhausted; return (rows, page count)."""
+    rows, cursor = [], None
+    for pages in range(1, max_pages + 1):
+        page, cursor = fetch(cursor=cursor, limit=limit)
+        rows.extend(page)
+        if cursor is None:
+            return rows, pages
+    pytest.fail("Pagination did not terminate")
+
+
+@pytest.mark.unit
+class TestCursor:
+    """Test cursor encoding."""
+
+    def test_round_trip(self):
+        timestamp = datetime(2026, 1, 2, 3, 4, 5, 678000)
+        assert decode_cursor(encode_cursor(timestamp, "abc")) == (timestamp, "abc")
+
+    def test_invalid_cursor_rejected(self):
+        with pytest.raises(HTTPException) as exc:
+            decode_cursor("not-a-cursor")
+        assert exc.value.status_code == 400
+
+
+@pytest.mark.unit
+class TestExpensePagination:
+    """Test keyset pagination and filters of group expenses."""
+
+    def test_pages_cover_every_expense_once_in_order(self, db_session, group):
+        group_id = group.id
+        # One bulk call shares a single created_at, so ordering relies on the id tiebreaker
+        create_expenses_bulk(db_session, group_id, [
+            expense_item(f"Expense {i}", datetime.utcnow()) for i in range(23)
+        ], "A")
+
+        rows, pages = collect_pages(
+            lambda **kwargs: get_group_expenses_page(db_session, group_id, **kwargs), limit=5
+        )
+
+        assert pages == 5
+        ids = [expense.id for expense in rows]
+        assert len(set(ids)) == 23
+        assert ids == sorted(ids, reverse=True)
+
+    def test_exact_multiple_has_no_empty_trailing_page(self, db_session, group):
+        group_id = group.id
+        create_expenses_bulk(db_session, group_id, [
+            expense_item(f"Expense {i}", datetime.utcnow()) for i in range(4)
+        ], "A")
+
+        page, cursor = get_group_expenses_page(db_session, group_id, limit=4)
+
+        assert len(page) == 4
+        assert cursor is None
+
+    def test_filters(self, db_session, group):
+        group_id = group.id
+        base = datetime(2026, 3, 1)
+        create_expenses_bulk(db_session, group_id, [
+            expense_item("Old food", base, category="food"),
+            expense_item("New food", base + timedelta(days=10), category="food"),
+            expense_item("Taxi", base + timedelta(days=10), category="travel"),
+        ], "A")
+        create_expenses_bulk(db_session, group_id, [
+            expense_item("Hotel", base + timedelta(days=20), category="travel", participants=("B", "C")),
+        ], "B")
+
+        def titles(**filters):
+            page, _ = get_group_expenses_page(db_session, group_id, **filters)
+            return sorted(expense.title for expense in page)
+
+        assert titles(category_id="food") == ["New food", "Old food"]
+        assert titles(paid_by="B") == ["Hotel"]
+        assert titles(date_from=base + timedelta(days=5), date_to=base + timedelta(days=15)) == ["New food", "Taxi"]
+
+        taxi = next(expense for expense in get_group_expenses_page(db_session, group_id)[0] if expense.title == "Taxi")
+        for share in taxi.shares:
+            settle_expense_share(db_session, share.id, share.user_id)
+
+        assert titles(is_settled=True) == ["Taxi"]
+        assert titles(is_settled=False) == ["Hotel", "New food", "Old food"]
+
+    def test_page_includes_shares(self, db_session, group):
+        group_id = group.id
+        create_expenses_bulk(db_session, group_id, [expense_item("Dinner", datetime.utcnow())], "A")
+
+        page, _ = get_group_expenses_page(db_session, group_id)
+
+        assert sorted(share.user_id for share in page[0].shares) == ["A", "B"]
+
+
+@pytest.mark.unit
+class TestSettlementPagination:
+    """Test keyset pagination and filters of group settlements."""
+
+    def test_pages_and_filters(self, db_session, group):
+        group_id = group.id
+        base = datetime(2026, 3, 1)
+        # Pairs of settlements share a timestamp so pages split on the id tiebreaker
+        db_session.add_all(
+            Settlement(
+                group_id=group_id,
+                from_user_id="B" if i % 2 else "C",
+                to_user_id="A",
+                amount=Decimal(i + 1),
+                settled_at=base + timedelta(hours=i // 2)
+            )
+            for i in range(7)
+        )
+        db_session.commit()
+
+        rows, pages = collect_pages(
+            lambda **kwargs: get_group_settlements_page(db_session, group_id, **kwargs), limit=3
+        )
+        assert pages == 3
+        assert len({settlement.id for settlement in rows}) == 7
+        assert [settlement.settled_at for settlement in rows] == sorted(
+            (settlement.settled_at for settlement in rows), reverse=True
+        )
+
+        page, _ = get_group_settlements_page(db_session, group_id, from_user_id="B")
+        assert len(page) == 3
+        assert all(settlement.from_user_id == "B" for settlement in page)
+
+        page, _ = get_group_settlements_page(db_session, group_id, to_user_id="B")
+        assert page == []
+
+
+def test_create_missing_indexes_adds_keyset_indexes_to_existing_tables():
+    from sqlalchemy import create_engine, inspect, text
+    from app.db.database import Base, create_missing_indexes
+
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    with engine.begin() as conn:
+        conn.execute(text("DROP INDEX ix_expenses_group_created_at_id"))
+
+    create_missing_indexes(engine)
+    # Running again finds every index and creates nothing
+    create_missing_indexes(engine)
+
+    names = {index["name"] for index in inspect(engine).get_indexes("expenses")}
+    assert "ix_expenses_group_created_at_id" in names
+    engine.dispose()
@@ -0,0 +1,134 @@
+"""
+Tests for the persistent direct reply-to RPC client.
+"""
+import json
+import queue
+import random
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+import pytest
+
+from app.rabbitmq import rpc_client
+from app.rabbitmq.rpc_client import DIRECT_REPLY_TO, RabbitMQRPCClient
+
+
+@pytest.fixture(autouse=True)
+def plain_properties(monkeypatch):
+    # Other test modules may replace pika with a MagicMock
+    monkeypatch.setattr(rpc_client.pika, "BasicProperties", SimpleNamespace)
+
+
+class FakeChannel:
+    def __init__(self, connection):
+        self.connection = connection
+        self.on_message = None
+
+    def basic_consume(self, queue, on_message_callback, auto_ack):
+        assert queue == DIRECT_REPLY_TO and auto_ack
+        self.on_message = on_message_callback
+
+    def basic_publish(self, exchange, routing_key, body, properties):
+        assert threading.current_thread().name == "RabbitMQ-RPC", "publish must run on the I/O thread"
+        self.connection.published.append(properties.correlation_id)
+        if self.connection.respond:
+            request = json.loads(body)
+            self.connection.replies.append((properties, json.dumps({"echo": request["n"]}).encode()))
+
+
+class FakeConnection:
+    """Blocking connection stand-in answering every request on the I/O thread"""
+
+    def __init__(self, respond=True, fail_after=None):
+        self.respond = respond
+        self.fail_after = fail_after
+        self.is_closed = False
+        self.published = []
+        self.replies = []
+        self.callbacks = queue.Queue()
+        self.channel_ = FakeChannel(self)
+        self.rounds = 0
+
+    def channel(self):
+        return self.channel_
+
+    def add_callback_threadsafe(self, callback):
+        if self.is_closed:
+            raise RuntimeError("connection closed")
+        self.callbacks.put(callback)
+
+    def process_data_events(self, time_limit):
+        self.rounds += 1
+        if self.fail_after is not None and self.rounds > self.fail_after:
+            self.is_closed = True
+            raise ConnectionError("connection reset")
+        try:
+            self.callbacks.get(timeout=time_limit)()
+        except queue.Empty:
+            pass
+        # Deliver replies out of order
+        random.shuffle(self.replies)
+        while self.replies:
+            properties, body = self.replies.pop()
+            self.channel_.on_message(self.channel_, None, properties, body)
+
+    def close(self):
+        self.is_closed = True
+
+
+def test_concurrent_calls_share_one_connection():
+    connections = []
+
+    def factory():
+        connections.append(FakeConnection())
+        return connections[-1]
+
+    client = RabbitMQRPCClient(connection_factory=factory)
+    try:
+        with ThreadPoolExecutor(max_workers=16) as pool:
+            results = list(pool.map(
+                lambda n: client.call("exchange", "key", {"n": n}, timeout=5), range(64)
+            ))
+    finally:
+        client.close()
+
+    assert results == [{"echo": n} for n in range(64)]
+    assert len(connections) == 1
+    assert len(connections[0].published) == 64
+    assert client.pending_count() == 0
+
+
+def test_call_times_out_without_reply():
+    client = RabbitMQRPCClient(connection_factory=lambda: FakeConnection(respond=False))
+    try:
+        assert client.call("exchange", "key", {"n": 1}, timeout=0.3) is None
+        assert client.pending_count() == 0
+    finally:
+        client.close()
+
+
+def test_reconnects_after_connection_loss():
+    connections = []
+
+    def factory():
+        # The first connection dies on its first I/O round
+        connections.append(FakeConnection(fail_after=0 if not connections else None))
+        return connections[-1]
+
+    client = RabbitMQRPCClient(connection_factory=factory)
+    try:
+        assert client.call("exchange", "key", {"n": 1}, timeout=2) is None
+        assert client.call("exchange", "key", {"n": 2}, timeout=2) == {"echo": 2}
+    finally:
+        client.close()
+
+    assert len(connections) == 2
+
+
+def test_unreachable_broker_returns_none():
+    def factory():
+        raise ConnectionError("refused")
+
+    client = RabbitMQRPCClient(connection_factory=factory)
+    assert client.call("exchange", "key", {"n": 1}, timeout=1) is None
@@ -0,0 +1,69 @@
+"""
+Unit tests for the share allocator.
+"""
+import random
+import pytest
+from decimal import Decimal
+
+from app.utils.share_allocation import allocate_shares, integer_weights
+
+
+@pytest.mark.unit
+class TestAllocateShares:
+    """Test splitting amounts in cents between participants."""
+
+    def test_exact_split(self):
+        assert allocate_shares(12000, [1, 1, 1]) == [4000, 4000, 4000]
+
+    def test_largest_remainder(self):
+        """Leftover cents go to the largest remainders, ties to earlier participants."""
+        assert allocate_shares(10000, [1, 1, 1]) == [3334, 3333, 3333]
+        assert allocate_shares(100, [1, 2, 3]) == [17, 33, 50]
+        assert allocate_shares(5, [1, 1, 1, 1]) == [2, 1, 1, 1]
+
+    def test_round_down_payer_absorbs(self):
+        assert allocate_shares(10000, [1, 1, 1], rounding="down", payer_index=1) == [3333, 3334, 3333]
+
+    def test_round_up_payer_absorbs(self):
+        assert allocate_shares(10000, [1, 1, 1], rounding="up", payer_index=1) == [3334, 3332, 3334]
+
+    def test_payer_not_participant_uses_largest_remainder(self):
+        assert allocate_shares(10000, [1, 1, 1], rounding="up") == [3334, 3333, 3333]
+        assert allocate_shares(10000, [1, 1, 1], rounding="down") == [3334, 3333, 3333]
+
+    def test_round_up_never_negative(self):
+        """Rounding up that would leave the payer below zero falls back to largest remainder."""
+        assert allocate_shares(2, [1, 1, 1, 1], rounding="up", payer_index=0) == [1, 1, 0, 0]
+
+    def test_zero_weight_participant(self):
+        assert allocate_shares(1001, [0, 1, 1]) == [0, 501, 500]
+
+    def test_invalid_weights(self):
+        with pytest.raises(ValueError):
+            allocate_shares(100, [])
+        with pytest.raises(ValueError):
+            allocate_shares(100, [0, 0])
+
+    @pytest.mark.parametrize("rounding", ["none", "up", "down"])
+    def test_always_sums_to_amount(self, rounding):
+        rng = random.Random(7)
+        for _ in range(500):
+            weights = [rng.randint(0, 9) for _ in range(rng.randint(1, 8))]
+            weights[0] += 1
+            amount = rng.randint(0, 100000)
+            payer_index = rng.choice([None, rng.randrange(len(weights))])
+            shares = allocate_shares(amount, weights, rounding, payer_index)
+            assert sum(shares) == amount
+            assert all(share >= 0 for share in shares)
+
+
+@pytest.mark.unit
+class TestIntegerWeights:
+    """Test scaling decimal weights to integers."""
+
+    def test_scales_to_common_denominator(self):
+        assert integer_weights([Decimal("0.25"), Decimal("0.5"), Decimal("0.25")]) == [1, 2, 1]
+
+    def test_accepts_floats_and_ints(self):
+        assert integer_weights([0.6, 0.4]) == [3, 2]
+        assert integer_weights([2, 1]) == [2, 1]
@@ -0,0 +1,194 @@
+"""
+Tests for the user info cache in front of fetch_group_users.
+"""
+import pytest
+
+from app.cache import connection as connection_module
+from app.cache.user_info_cache import get_user_info_cache
+from app.rabbitmq.user_events import handle_user_event
+from app.schemas.group_schema import UserInfo
+from app.services import group_user_info_service
+
+
+class FakeRedis:
+    """Minimal in-memory stand-in for the string commands the cache uses"""
+
+    def __init__(self):
+        self.values = {}
+        self.generations = {}
+
+    def mget(self, keys):
+        return [self.generations.get(key, self.values.get(key)) for key in keys]
+
+    def incr(self, key):
+        self.generations[key] = str(int(self.generations.get(key, 0)) + 1)
+
+    def delete(self, key):
+        self.values.pop(key, None)
+
+    def eval(self, script, numkeys, *keys_and_args):
+        # Python equivalent of the conditional set script
+        keys, args = keys_and_args[:numkeys], keys_and_args[numkeys + 1:]
+        for generation_key, info_key, expected, value in zip(keys[::2], keys[1::2], args[::2], args[1::2]):
+            if self.generations.get(generation_key, "") == expected:
+                self.values[info_key] = value
+
+    def pipeline(self):
+        return FakePipeline(self)
+
+
+class FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.commands = []
+
+    def incr(self, key):
+        self.commands.append(lambda: self.redis.incr(key))
+
+    def expire(self, key, seconds):
+        pass
+
+    def delete(self, key):
+        self.commands.append(lambda: self.redis.delete(key))
+
+    def execute(self):
+        for command in self.commands:
+            command()
+
+
+class RecordingRPCClient:
+    """Answers user info requests for the ids it is asked about"""
+
+    def __init__(self, names):
+        self.names = names
+        self.requested = []
+
+    def call(self, exchange, routing_key, payload, timeout=None):
+        self.requested.append(sorted(payload["user_ids"]))
+        return {"users": [
+            {"user_id": user_id, "name": self.names[user_id]}
+            for user_id in payload["user_ids"] if user_id in self.names
+        ]}
+
+
+@pytest.fixture
+def rpc(monkeypatch):
+    client = RecordingRPCClient({"u1": "Alice", "u2": "Bob", "u3": "Carol"})
+    monkeypatch.setattr(group_user_info_service, "get_rpc_client", lambda: client)
+    return client
+
+
+@pytest.fixture
+def fake_redis(monkeypatch):
+    redis = FakeRedis()
+    monkeypatch.setattr(connection_module.get_redis_connection(), "client", redis)
+    return redis
+
+
+def test_only_missing_users_are_requested(rpc):
+    first = group_user_info_service.fetch_group_users(["u1", "u2"], "group-1")
+    second = group_user_info_service.fetch_group_users(["u1", "u2", "u3"], "group-1")
+
+    assert rpc.requested == [["u1", "u2"], ["u3"]]
+    assert {user_id: info.name for user_id, info in first.items()} == {"u1": "Alice", "u2": "Bob"}
+    assert {user_id: info.name for user_id, info in second.items()} == {"u1": "Alice", "u2": "Bob", "u3": "Carol"}
+    assert get_user_info_cache().stats()["local_hits"] == 2
+
+
+def test_fully_cached_group_skips_rpc(rpc):
+    group_user_info_service.fetch_group_users(["u1", "u2"], "group-1")
+    result = group_user_info_service.fetch_group_users(["u2", "u1", "u1"], "group-2")
+
+    assert rpc.requested == [["u1", "u2"]]
+    assert set(result) == {"u1", "u2"}
+
+
+def test_unknown_users_are_not_cached(rpc):
+    group_user_info_service.fetch_group_users(["u1", "ghost"], "group-1")
+    group_user_info_service.fetch_group_users(["u1", "ghost"], "group-1")
+
+    assert rpc.requested == [["ghost", "u1"], ["ghost"]]
+
+
+def test_failed_rpc_returns_cached_users(rpc, monkeypatch):
+    group_user_info_service.fetch_group_users(["u1"], "group-1")
+    monkeypatch.setattr(rpc, "call", lambda *args, **kwargs: None)
+
+    result = group_user_info_service.fetch_group_users(["u1", "u2"], "group-1")
+
+    assert set(result) == {"u1"}
+
+
+def test_user_updated_event_invalidates(rpc):
+    group_user_info_service.fetch_group_users(["u1", "u2"], "group-1")
+    rpc.names["u1"] = "Alicia"
+
+    handle_user_event({"user_id": "u1", "fields": ["name"]})
+    result = group_user_info_service.fetch_group_users(["u1", "u2"], "group-1")
+
+    assert rpc.requested[-1] == ["u1"]
+    assert result["u1"].name == "Alicia"
+
+
+def test_redis_layer_is_shared(rpc, fake_redis):
+    group_user_info_service.fetch_group_users(["u1", "u2"], "group-1")
+    assert set(fake_redis.values) == {"split:user:u1:info", "split:user:u2:info"}
+
+    # Another process: empty LRU, same Redis
+    get_user_info_cache().local.clear()
+    result = group_user_info_service.fetch_group_users(["u1", "u2"], "group-1")
+
+    assert len(rpc.requested) == 1
+    assert result["u2"] == UserInfo(user_id="u2", name="Bob")
+    assert get_user_info_cache().stats()["redis_hits"] == 2
+
+    handle_user_event({"user_id": "u2"})
+    assert set(fake_redis.values) == {"split:user:u1:info"}
+
+
+def test_update_during_rpc_is_not_overwritten(rpc, fake_redis, monkeypatch):
+    answer = rpc.call
+
+    def call_then_update(*args, **kwargs):
+        response = answer(*args, **kwargs)
+        # u1 renames while the answer with the old name is on its way back
+        rpc.names["u1"] = "Alicia"
+        handle_user_event({"user_id": "u1", "fields": ["name"]})
+        return response
+
+    monkeypatch.setattr(rpc, "call", call_then_update)
+    first = group_user_info_service.fetch_group_users(["u1"], "group-1")
+    assert first["u1"].name == "Alice"
+    assert "split:user:u1:info" not in fake_redis.values
+
+    monkeypatch.setattr(rpc, "call", answer)
+    second = group_user_info_service.fetch_group_users(["u1"], "group-1")
+    assert second["u1"].name == "Alicia"
+    assert "split:user:u1:info" in fake_redis.values
+
+
+def test_concurrent_identical_fetches_share_one_rpc(monkeypatch):
+    import threading
+    import time
+    from concurrent.futures import ThreadPoolExecutor
+
+    class SlowRPCClient(RecordingRPCClient):
+        def call(self, exchange, routing_key, payload, timeout=None):
+            # Keep the first request in flight while the others arrive
+            time.sleep(0.3)
+            return super().call(exchange, routing_key, payload, timeout)
+
+    client = SlowRPCClient({"u1": "Alice", "u2": "Bob"})
+    monkeypatch.setattr(group_user_info_service, "get_rpc_client", lambda: client)
+    start = threading.Barrier(8)
+
+    def load(order):
+        start.wait()
+        return group_user_info_service.fetch_group_users(order, "group-1")
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(load, [["u1", "u2"], ["u2", "u1"]] * 4))
+
+    assert client.requested == [["u1", "u2"]]
+    assert all(set(result) == {"u1", "u2"} for result in results)
+    assert group_user_info_service._user_info_flights.in_flight() == 0
@@ -0,0 +1,105 @@
+"""
+Tests for event-driven completion of user lookup requests.
+"""
+import asyncio
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from app.services import user_lookup_service as lookup_module
+from app.services.user_lookup_service import UserLookupService
+
+
+@pytest.fixture
+def service(monkeypatch):
+    producer = SimpleNamespace(publish_user_lookup_request=lambda **kwargs: True)
+    monkeypatch.setattr(lookup_module, "get_rabbitmq_producer", lambda: producer)
+    monkeypatch.setattr(lookup_module, "get_rabbitmq_consumer", lambda: SimpleNamespace())
+    monkeypatch.setattr(lookup_module.rabbitmq_config, "async_consumers", True)
+    service = UserLookupService()
+    # Membership updates are covered elsewhere; only the signalling is under test
+    monkeypatch.setattr(service, "_process_user_lookup_response", lambda request_id, data: None)
+    return service
+
+
+def respond_later(service, request_id, delay=0.1, success=True):
+    def respond():
+        time.sleep(delay)
+        service._handle_user_lookup_response({
+            "request_id": request_id,
+            "success": success,
+            "user_data": {"user_id": "u1"} if success else None,
+        })
+
+    threading.Thread(target=respond, daemon=True).start()
+
+
+def test_get_lookup_result_wakes_on_response(service):
+    request_id = service.lookup_user_by_phone_or_email("a@example.com", "group")
+    respond_later(service, request_id)
+
+    started = time.monotonic()
+    result = service.get_lookup_result(request_id, timeout=5)
+
+    assert result == {"user_id": "u1"}
+    assert time.monotonic() - started < 1
+    assert request_id not in service.pending_requests
+
+
+def test_get_lookup_result_times_out(service):
+    request_id = service.lookup_user_by_phone_or_email("a@example.com", "group")
+
+    assert service.get_lookup_result(request_id, timeout=0.1) is None
+    assert request_id not in service.pending_requests
+
+
+@pytest.mark.asyncio
+async def test_async_waiters_resolve_from_consumer_thread(service):
+    request_id = service.lookup_user_by_phone_or_email("a@example.com", "group")
+    respond_later(service, request_id)
+
+    results = await asyncio.gather(*[
+        service.wait_for_completion_async(request_id, timeout=5) for _ in range(3)
+    ])
+
+    assert results == [True, True, True]
+    # Already completed requests return at once
+    assert await service.wait_for_completion_async(request_id, timeout=0.01)
+    assert not await service.wait_for_completion_async("unknown", timeout=0.01)
+
+
+def test_old_waiters_are_cleaned_up(service):
+    request_id = service.lookup_user_by_phone_or_email("a@example.com", "group")
+    service.pending_requests[request_id].created_at -= 600
+
+    service.cleanup_old_requests()
+
+    assert service.pending_requests == {}
+
+
+@pytest.mark.asyncio
+async def test_long_poll_holds_no_session_while_waiting(service, monkeypatch):
+    from app.api.v1.routes import groups as groups_routes
+
+    request_id = service.lookup_user_by_phone_or_email("a@example.com", "group")
+    statuses = iter([{"status": "pending"}, {"status": "completed"}])
+    loads = []
+
+    def load_status(group_slug, request_id, user_id):
+        loads.append(threading.current_thread())
+        return next(statuses)
+
+    monkeypatch.setattr(groups_routes, "_load_pending_request_status", load_status)
+    monkeypatch.setattr(lookup_module, "get_user_lookup_service", lambda: service)
+    respond_later(service, request_id)
+
+    status = await groups_routes.get_pending_member_request_status(
+        "group", request_id, wait=5, user_id="A"
+    )
+
+    assert status == {"status": "completed"}
+    # Each load ran in the threadpool with its own short-lived session
+    assert len(loads) == 2
+    assert threading.main_thread() not in loads
@@ -10,8 +10,16 @@ The algorithm works by:
 3. Using a greedy matching strategy to match max creditor with max debtor
 4. Minimizing the total number of transactions while ensuring all debts are settled
 
-Time Complexity: O(n log n) for sorting + O(n) for matching = O(n log n)
-Space Complexity: O(n) for storing balances and settlement results
+Amounts are converted to integer cents once on entry; accumulation, splitting
+and matching run on plain ints, and results are converted back to Decimal on
+output.
+
+Time Complexity:
+- greedy: one sort of creditors and debtors, then a two-pointer walk, O(n log n).
+  A partially settled balance stays in place rather than being re-ranked, so
+  this is not the heap variant that always re-picks the largest remainder.
+- optimal: O(2^n * n) subset DP, used up to OPTIMAL_MAX_MEMBERS balances
+Space Complexity: O(n) for greedy, O(2^n) for optimal
 
 Example Usage:
     from app.utils.min_cash_flow import calculate_balances, min_cash_flow
@@ -28,12 +36,28 @@ Example Usage:
 """
 
 import logging
+import os
 from decimal import Decimal
+from itertools import chain
 from typing import Dict, List, Optional, Tuple
 
+from app.utils.share_allocation import allocate_shares, integer_weights
+
+# NumPy is optional; calculate_balances(vectorized=True) falls back to pure Python without it
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 # Configure logger
 logger = logging.getLogger(__name__)
 
+SETTLEMENT_STRATEGIES = ("greedy", "optimal")
+
+# Subset DP is O(2^n * n); beyond this many non-zero balances "optimal" uses greedy.
+# 16 keeps a worst-case call around a tenth of a second; 20 takes over a second.
+OPTIMAL_MAX_MEMBERS = int(os.getenv("SETTLEMENT_OPTIMAL_MAX_MEMBERS", "16"))
+
 
 def round_decimal(value: Decimal, precision: Decimal = Decimal('0.01')) -> Decimal:
     """
@@ -56,6 +80,37 @@ def round_decimal(value: Decimal, precision: Decimal = Decimal('0.01')) -> Decim
     return value.quantize(precision)
 
 
+def _as_decimal(value) -> Decimal:
+    """Return value as a Decimal, converting through str only when needed"""
+    return value if isinstance(value, Decimal) else Decimal(str(value))
+
+
+def to_minor_units(value) -> int:
+    """
+    Convert a monetary amount to integer cents, rounding to the nearest cent.
+    
+    Amounts are converted once at the boundary so the hot loops of the
+    algorithm run on plain ints instead of quantized Decimals.
+    
+    Example:
+        >>> to_minor_units(Decimal("43.335"))
+        4334
+    """
+    # Same half-even rounding as round_decimal(), applied to the scaled value
+    return int(_as_decimal(value).scaleb(2).to_integral_value())
+
+
+def from_minor_units(cents: int) -> Decimal:
+    """
+    Convert integer cents back to a Decimal amount with two decimal places.
+    
+    Example:
+        >>> from_minor_units(-1050)
+        Decimal('-10.50')
+    """
+    return Decimal(cents).scaleb(-2)
+
+
 def validate_balance_sum(balances: Dict[str, Decimal], tolerance: Decimal = Decimal('0.01')) -> None:
     """
     Validate that the sum of all balances is approximately zero.
@@ -85,9 +140,58 @@ def validate_balance_sum(balances: Dict[str, Decimal], tolerance: Decimal = Deci
         )
 
 
+def _payer_index(expense: Dict) -> Optional[int]:
+    """Position of the payer among the participants of an expense, if present"""
+    try:
+        return expense["participants"].index(expense["payer"])
+    except ValueError:
+        return None
+
+
+def _weighted_shares(expense: Dict, amount: int, tolerance: Decimal, rounding: str = "none") -> List[int]:
+    """
+    Validate the weights of an expense and return each participant's share in cents.
+    
+    Shares follow the order of expense["participants"] and are allocated in
+    proportion to the weights with allocate_shares(), so they always sum to
+    the expense amount.
+    
+    Raises:
+        ValueError: If weights don't sum to 1.0 (within tolerance)
+        ValueError: If weights are provided for some participants but not all
+    """
+    weights = expense["weights"]
+    participants = expense["participants"]
+    
+    # Validate weights sum to 1.0
+    weight_sum = sum(_as_decimal(w) for w in weights.values())
+    if abs(weight_sum - Decimal('1.0')) > tolerance:
+        raise ValueError(
+            f"Weights must sum to 1.0, got {weight_sum}. "
+            f"Expense: {expense.get('title', 'unknown')}"
+        )
+    
+    # Validate all participants have weights
+    if set(weights.keys()) != set(participants):
+        missing = set(participants) - set(weights.keys())
+        raise ValueError(
+            f"All participants must have weights. Missing: {missing}. "
+            f"Expense: {expense.get('title', 'unknown')}"
+        )
+    
+    return allocate_shares(
+        amount,
+        integer_weights([weights[participant] for participant in participants]),
+        rounding,
+        _payer_index(expense)
+    )
+
+
 def calculate_balances(
     expenses: List[Dict],
-    tolerance: Decimal = Decimal('0.01')
+    tolerance: Decimal = Decimal('0.01'),
+    vectorized: bool = False,
+    rounding: str = "none"
 ) -> Dict[str, Decimal]:
     """
     Calculate net balance for each user from a list of expenses.
@@ -100,6 +204,10 @@ def calculate_balances(
     - Equal split: Divide amount equally among all participants
     - Weighted split: Use provided weights (weights must sum to 1.0)
     
+    Leftover cents of every split are distributed by allocate_shares()
+    according to rounding, so each expense's shares add up to its amount
+    and the returned balances always sum to exactly zero.
+    
     Args:
         expenses: List of expense dictionaries with format:
             {
@@ -109,6 +217,11 @@ def calculate_balances(
                 "weights": Optional[Dict[str, Decimal]]  # Optional weight per participant
             }
         tolerance: Tolerance for weight sum validation (default: 0.01)
+        vectorized: Compute shares and sums with NumPy arrays, which is much
+            faster for tens of thousands of expenses. Results are identical;
+            falls back to pure Python when NumPy is not installed.
+        rounding: Group rounding option, "none" (default), "up" or "down";
+            see app.utils.share_allocation
     
     Returns:
         Dictionary mapping user_id -> net_balance (Decimal)
@@ -129,45 +242,30 @@ def calculate_balances(
     if not expenses:
         return {}
     
-    balances: Dict[str, Decimal] = {}
+    if vectorized:
+        if np is not None:
+            return _calculate_balances_vectorized(expenses, tolerance, rounding)
+        logger.debug("NumPy is not installed; calculating balances in pure Python")
+    
+    # Accumulate in integer cents; amounts are rounded to the cent on entry
+    balances: Dict[str, int] = {}
+    get_balance = balances.get
     
     for expense in expenses:
         payer = expense["payer"]
-        amount = Decimal(str(expense["amount"]))  # Ensure Decimal
+        amount = to_minor_units(expense["amount"])
         participants = expense["participants"]
         weights = expense.get("weights")
         
         # Initialize payer balance if not exists
         if payer not in balances:
-            balances[payer] = Decimal('0')
+            balances[payer] = 0
         
         # Calculate shares
         if weights:
             # Weighted split
-            # Validate weights sum to 1.0
-            weight_sum = sum(Decimal(str(w)) for w in weights.values())
-            if abs(weight_sum - Decimal('1.0')) > tolerance:
-                raise ValueError(
-                    f"Weights must sum to 1.0, got {weight_sum}. "
-                    f"Expense: {expense.get('title', 'unknown')}"
-                )
-            
-            # Validate all participants have weights
-            if set(weights.keys()) != set(participants):
-                missing = set(participants) - set(weights.keys())
-                raise ValueError(
-                    f"All participants must have weights. Missing: {missing}. "
-                    f"Expense: {expense.get('title', 'unknown')}"
-                )
-            
-            # Calculate shares based on weights
-            for participant in participants:
-                if participant not in balances:
-                    balances[participant] = Decimal('0')
-                
-                weight = Decimal(str(weights[participant]))
-                share = round_decimal(amount * weight)
-                balances[participant] -= share  # Subtract share (what they owe)
+            for participant, share in zip(participants, _weighted_shares(expense, amount, tolerance, rounding)):
+                balances[participant] = get_balance(participant, 0) - share  # Subtract share (what they owe)
         
         else:
             # Equal split
@@ -175,39 +273,145 @@ def calculate_balances(
             if num_participants == 0:
                 continue
             
-            share_per_person = round_decimal(amount / Decimal(str(num_participants)))
+            share_per_person, leftover = divmod(amount, num_participants)
             
-            for participant in participants:
-                if participant not in balances:
-                    balances[participant] = Decimal('0')
-                
-                balances[participant] -= share_per_person  # Subtract share (what they owe)
+            if leftover and rounding != "none":
+                shares = allocate_shares(amount, [1] * num_participants, rounding, _payer_index(expense))
+                for participant, share in zip(participants, shares):
+                    balances[participant] = get_balance(participant, 0) - share  # Subtract share (what they owe)
+            else:
+                for participant in participants:
+                    balances[participant] = get_balance(participant, 0) - share_per_person  # Subtract share (what they owe)
+                # Largest remainder with equal weights: the first participants carry the leftover cents
+                for participant in participants[:leftover]:
+                    balances[participant] -= 1
         
         # Add amount to payer (what they paid)
-        balances[payer] = round_decimal(balances[payer] + amount)
+        balances[payer] += amount
+    
+    return {user_id: from_minor_units(balance) for user_id, balance in balances.items()}
+
+
+def _amounts_to_minor_units(amounts: List) -> "np.ndarray":
+    """
+    Vectorized to_minor_units() for a list of amounts.
+    
+    Amounts go through float64, which is exact once rounded for whole-cent
+    values of realistic size. Any amount whose scaled float is not within a
+    millionth of a whole cent (sub-cent input) or that is too large for float
+    precision is converted exactly with to_minor_units() instead.
+    """
+    scaled = np.fromiter(map(float, amounts), dtype=np.float64, count=len(amounts)) * 100
+    cents = np.rint(scaled)
+    inexact = (np.abs(scaled - cents) > 1e-6) | (np.abs(cents) >= 1e13)
+    cents = cents.astype(np.int64)
+    for position in np.flatnonzero(inexact).tolist():
+        cents[position] = to_minor_units(amounts[position])
+    return cents
+
+
+def _calculate_balances_vectorized(expenses: List[Dict], tolerance: Decimal, rounding: str) -> Dict[str, Decimal]:
+    """
+    NumPy implementation of calculate_balances().
+    
+    User ids are interned into integer indices and every participant of every
+    expense becomes one row of flat user/share arrays. Equal split shares are
+    allocated for all expenses at once, exactly as allocate_shares() would,
+    and balances are summed with np.add.at on int64 cents, which keeps them
+    exact. The result lists users in the order they first appear, like the
+    pure Python path.
+    """
+    count = len(expenses)
+    payers = [expense["payer"] for expense in expenses]
+    participant_lists = [expense["participants"] for expense in expenses]
+    amounts_list = [expense["amount"] for expense in expenses]
+    weighted = [position for position, expense in enumerate(expenses) if expense.get("weights")]
+    
+    flat_participants = list(chain.from_iterable(participant_lists))
+    index = {user_id: position for position, user_id in enumerate(dict.fromkeys(chain(payers, flat_participants)))}
+    users = list(index)
+    
+    amounts = _amounts_to_minor_units(amounts_list)
+    sizes = np.fromiter(map(len, participant_lists), dtype=np.int64, count=count)
+    payer_idx = np.fromiter(map(index.__getitem__, payers), dtype=np.int64, count=count)
+    row_user = np.fromiter(map(index.__getitem__, flat_participants), dtype=np.int64, count=len(flat_participants))
+    
+    # Equal split: every participant gets the floor share and leftover cents
+    # are placed as allocate_shares() places them for equal weights
+    rows = len(flat_participants)
+    row_position = np.arange(rows)
+    row_expense = np.repeat(np.arange(count), sizes)
+    offsets = np.cumsum(sizes) - sizes
+    shares, remainders = np.divmod(amounts, np.maximum(sizes, 1))
+    row_share = np.repeat(shares, sizes)
+    row_remainder = np.repeat(remainders, sizes)
+    
+    uses_payer = np.zeros(count, dtype=bool)
+    if rounding in ("up", "down"):
+        # First row of each expense holding its payer, or rows if the payer is not a participant
+        payer_row = np.full(count, rows, dtype=np.int64)
+        np.minimum.at(payer_row, row_expense, np.where(row_user == payer_idx[row_expense], row_position, rows))
+        uses_payer = (payer_row < rows) & (remainders > 0)
+        if rounding == "up":
+            payer_share = shares + remainders - (sizes - 1)
+            uses_payer &= payer_share >= 0
+    
+    # Largest remainder: equal remainders, so the first leftover participants get a cent
+    largest_remainder = ~np.repeat(uses_payer, sizes)
+    row_share += largest_remainder & (row_position - np.repeat(offsets, sizes) < row_remainder)
+    if rounding == "down":
+        row_share[payer_row[uses_payer]] += remainders[uses_payer]
+    elif rounding == "up":
+        row_share += ~largest_remainder & (row_position != payer_row[row_expense])
+        row_share[payer_row[uses_payer]] = payer_share[uses_payer]
+    
+    # Weighted expenses are allocated per expense
+    for position in weighted:
+        start = int(offsets[position])
+        row_share[start:start + int(sizes[position])] = _weighted_shares(
+            expenses[position], int(amounts[position]), tolerance, rounding
+        )
+    
+    balances = np.zeros(len(users), dtype=np.int64)
+    # Expenses without participants are skipped entirely, as in the pure Python path
+    has_participants = sizes > 0
+    np.add.at(balances, payer_idx[has_participants], amounts[has_participants])
+    np.subtract.at(balances, row_user, row_share)
     
-    # Round all final balances
-    balances = {user_id: round_decimal(balance) for user_id, balance in balances.items()}
+    # Order users by first appearance: each expense occupies 1 + size slots, payer first
+    expense_start = offsets + np.arange(count)
+    first_seen = np.full(len(users), np.iinfo(np.int64).max, dtype=np.int64)
+    np.minimum.at(first_seen, payer_idx, expense_start)
+    np.minimum.at(first_seen, row_user, row_position + row_expense + 1)
     
-    return balances
+    cents = balances.tolist()
+    return {users[position]: from_minor_units(cents[position]) for position in np.argsort(first_seen, kind="stable").tolist()}
 
 
 def min_cash_flow(
     balances: Dict[str, Decimal],
     tolerance: Decimal = Decimal('0.01'),
     max_iterations: int = 1000,
-    strategy: str = "greedy"
+    strategy: str = "greedy",
+    optimal_max_members: Optional[int] = None
 ) -> List[Dict[str, str]]:
     """
     Minimize the number of transactions needed to settle all debts.
     
-    Uses a greedy algorithm that:
+    The "greedy" strategy uses an algorithm that:
     1. Separates users into creditors (positive balance) and debtors (negative balance)
     2. Sorts both lists by absolute amount (largest first)
     3. Iteratively matches max creditor with max debtor
     4. Transfers the minimum of their amounts
     5. Continues until all balances are settled
     
+    Greedy can use more transfers than necessary when subsets of debtors and
+    creditors cancel exactly. The "optimal" strategy partitions balances into
+    the maximum number of zero-sum groups and settles each separately, which
+    yields the minimum transaction count. Its cost is exponential in the
+    number of non-zero balances, so above optimal_max_members it falls back
+    to greedy.
+    
     Edge Cases Handled:
     - If only one user: returns []
     - If all balances are zero (within tolerance): returns []
@@ -218,13 +422,17 @@ def min_cash_flow(
         balances: Dictionary mapping user_id -> net_balance
         tolerance: Maximum allowed deviation from zero for validation (default: 0.01)
         max_iterations: Maximum number of iterations to prevent infinite loops (default: 1000)
-        strategy: Settlement strategy (default: "greedy", future: "balanced" placeholder)
+        strategy: Settlement strategy, "greedy" (default) or "optimal"
+        optimal_max_members: Largest number of non-zero balances solved by the
+            "optimal" strategy before falling back to greedy (default:
+            OPTIMAL_MAX_MEMBERS, set by SETTLEMENT_OPTIMAL_MAX_MEMBERS)
     
     Returns:
         List of settlement transactions, each with format:
         [{"from": str, "to": str, "amount": Decimal}, ...]
     
     Raises:
+        ValueError: If strategy is not supported
         ValueError: If balances don't sum to zero (beyond tolerance)
         RuntimeError: If max_iterations exceeded (rare edge case)
     
@@ -235,6 +443,9 @@ def min_cash_flow(
         [{"from": "C", "to": "A", "amount": Decimal("70.00")},
          {"from": "B", "to": "A", "amount": Decimal("10.00")}]
     """
+    if strategy not in SETTLEMENT_STRATEGIES:
+        raise ValueError(f"Unknown settlement strategy: {strategy}")
+    
     # Validate input: sum of balances should be zero
     if not balances:
         return []
@@ -246,12 +457,15 @@ def min_cash_flow(
     # Validate balance sum
     validate_balance_sum(balances, tolerance)
     
+    # Work in integer cents from here on; tolerance is compared in whole cents
+    tolerance_cents = int(tolerance.scaleb(2))
+    
     # Remove users with zero balance (within tolerance)
-    active_balances = {
-        user_id: balance
-        for user_id, balance in balances.items()
-        if abs(balance) > tolerance
-    }
+    active_balances = {}
+    for user_id, balance in balances.items():
+        cents = to_minor_units(balance)
+        if abs(cents) > tolerance_cents:
+            active_balances[user_id] = cents
     
     # Edge case: all balances are zero
     if not active_balances:
@@ -261,21 +475,60 @@ def min_cash_flow(
     creditors = [
         (user_id, balance)
         for user_id, balance in active_balances.items()
-        if balance > tolerance
+        if balance > 0
     ]
     debtors = [
         (user_id, -balance)  # Store as positive for easier matching
         for user_id, balance in active_balances.items()
-        if balance < -tolerance
+        if balance < 0
     ]
     
     # Edge case: no creditors or no debtors
     if not creditors or not debtors:
         return []
     
+    if optimal_max_members is None:
+        optimal_max_members = OPTIMAL_MAX_MEMBERS
+    if strategy == "optimal" and len(active_balances) <= optimal_max_members:
+        settlements = _optimal_settlements(active_balances, tolerance_cents, max_iterations)
+    else:
+        settlements = _greedy_settlements(creditors, debtors, tolerance_cents, max_iterations)
+    
+    for settlement in settlements:
+        settlement["amount"] = from_minor_units(settlement["amount"])
+    return settlements
+
+
+def _greedy_settlements(
+    creditors: List[Tuple[str, int]],
+    debtors: List[Tuple[str, int]],
+    tolerance: int,
+    max_iterations: int
+) -> List[Dict]:
+    """
+    Greedily match the largest creditor with the largest debtor until settled.
+    
+    Both lists of integer cents are sorted once and walked with two pointers:
+    O(n log n) for the sort plus O(n) for the walk. The remainder of a
+    partial match stays at the current position instead of being re-ranked
+    (no heap), which keeps the pairing identical to the original Decimal
+    implementation.
+    
+    Args:
+        creditors: List of (user_id, cents to receive)
+        debtors: List of (user_id, cents to pay), stored as positive
+        tolerance: Amounts in cents at or below this are considered settled
+        max_iterations: Maximum number of matching steps
+    
+    Returns:
+        List of settlement transactions with amounts in cents
+    
+    Raises:
+        RuntimeError: If max_iterations exceeded
+    """
     # Sort by amount (largest first) for greedy matching
-    creditors.sort(key=lambda x: x[1], reverse=True)
-    debtors.sort(key=lambda x: x[1], reverse=True)
+    creditors = sorted(creditors, key=lambda x: x[1], reverse=True)
+    debtors = sorted(debtors, key=lambda x: x[1], reverse=True)
     
     settlements = []
     iterations = 0
@@ -303,12 +556,12 @@ def min_cash_flow(
             settlements.append({
                 "from": debtor_id,
                 "to": creditor_id,
-                "amount": round_decimal(settlement_amount)
+                "amount": settlement_amount
             })
         
         # Update balances
-        credit_amount = round_decimal(credit_amount - settlement_amount)
-        debt_amount = round_decimal(debt_amount - settlement_amount)
+        credit_amount -= settlement_amount
+        debt_amount -= settlement_amount
         
         creditors[i] = (creditor_id, credit_amount)
         debtors[j] = (debtor_id, debt_amount)
@@ -322,6 +575,119 @@ def min_cash_flow(
     return settlements
 
 
+def _zero_sum_groups(cents: List[int]) -> List[List[int]]:
+    """
+    Partition balances into the maximum number of zero-sum groups.
+    
+    Settling a group of k balances takes k - 1 transactions, so the fewest
+    transactions overall come from the partition with the most groups. The
+    DP over subsets computes, for every mask, the most zero-sum groups its
+    members can be split into when removed one at a time; every zero-sum
+    mask met along the way closes a group. The full set always closes the
+    last group, which absorbs any rounding residual.
+    
+    Time Complexity: O(2^n * n), Space Complexity: O(2^n)
+    
+    Args:
+        cents: Balances in integer cents
+    
+    Returns:
+        List of groups, each a list of indices into cents
+    """
+    n = len(cents)
+    full = (1 << n) - 1
+    
+    # Subset sums built from the sum without the lowest set bit
+    sums = [0] * (1 << n)
+    for mask in range(1, full + 1):
+        low = mask & -mask
+        sums[mask] = sums[mask ^ low] + cents[low.bit_length() - 1]
+    
+    best = [0] * (1 << n)
+    for mask in range(1, full + 1):
+        value = 0
+        bits = mask
+        while bits:
+            low = bits & -bits
+            candidate = best[mask ^ low]
+            if candidate > value:
+                value = candidate
+            bits ^= low
+        best[mask] = value + (1 if sums[mask] == 0 or mask == full else 0)
+    
+    # Walk back from the full set, starting a new group at every zero-sum mask
+    groups: List[List[int]] = []
+    mask = full
+    while mask:
+        closes = sums[mask] == 0 or mask == full
+        if closes:
+            groups.append([])
+        target = best[mask] - (1 if closes else 0)
+        bits = mask
+        while bits:
+            low = bits & -bits
+            if best[mask ^ low] == target:
+                groups[-1].append(low.bit_length() - 1)
+                mask ^= low
+                break
+            bits ^= low
+    
+    return groups
+
+
+def _optimal_settlements(
+    active_balances: Dict[str, int],
+    tolerance: int,
+    max_iterations: int
+) -> List[Dict]:
+    """
+    Settle balances with the minimum number of transactions.
+    
+    Opposite balances of equal size are paired off first, which is always
+    part of some optimal solution and shrinks the subset DP. The remaining
+    balances are split into maximal zero-sum groups and each group is
+    settled greedily, costing exactly its size minus one transactions.
+    
+    Args:
+        active_balances: Dictionary mapping user_id -> non-zero net balance in cents
+        tolerance: Amounts in cents at or below this are considered settled
+        max_iterations: Maximum number of matching steps per group
+    
+    Returns:
+        List of settlement transactions with amounts in cents
+    """
+    settlements = []
+    
+    # Pair exact opposites: each pair settles with a single transfer
+    debtors_by_amount: Dict[int, List[str]] = {}
+    for user_id, balance in active_balances.items():
+        if balance < 0:
+            debtors_by_amount.setdefault(-balance, []).append(user_id)
+    
+    matched = set()
+    for user_id, balance in active_balances.items():
+        if balance > 0 and debtors_by_amount.get(balance):
+            debtor_id = debtors_by_amount[balance].pop()
+            settlements.append({"from": debtor_id, "to": user_id, "amount": balance})
+            matched.update((debtor_id, user_id))
+    
+    remaining = [(user_id, balance) for user_id, balance in active_balances.items() if user_id not in matched]
+    
+    if not remaining:
+        return settlements
+    
+    for group in _zero_sum_groups([balance for _, balance in remaining]):
+        members = [remaining[index] for index in group]
+        settlements.extend(_greedy_settlements(
+            [(user_id, balance) for user_id, balance in members if balance > 0],
+            [(user_id, -balance) for user_id, balance in members if balance < 0],
+            tolerance,
+            max_iterations
+        ))
+    
+    return settlements
+
+
 def min_cash_flow_detailed(
     balances: Dict[str, Decimal],
     tolerance: Decimal = Decimal('0.01'),
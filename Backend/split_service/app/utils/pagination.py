@@ -0,0 +1,106 @@
+import base64
+import json
+from datetime import datetime
+from typing import List, Optional, Tuple
+from fastapi import HTTPException
+from sqlalchemy import Select, and_, or_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Query
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+
+def encode_cursor(timestamp: datetime, row_id: str) -> str:
+    """
+    Encode the (timestamp, id) keyset position of a row as an opaque cursor.
+    """
+    raw = json.dumps([timestamp.isoformat(), row_id])
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, str]:
+    """
+    Decode a cursor produced by encode_cursor().
+
+    Raises:
+        HTTPException: 400 if the cursor is malformed
+    """
+    try:
+        timestamp, row_id = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        return datetime.fromisoformat(timestamp), str(row_id)
+    except (ValueError, TypeError, UnicodeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def paginate_keyset(
+    query: Query,
+    timestamp_column,
+    id_column,
+    cursor: Optional[str] = None,
+    limit: int = DEFAULT_PAGE_SIZE
+) -> Tuple[List, Optional[str]]:
+    """
+    Return one page of a query ordered newest first by (timestamp, id).
+
+    Rows after the cursor position are selected with a range condition that
+    a composite (..., timestamp, id) index can serve directly, so the cost of
+    a page does not depend on how deep into the history it is.
+
+    Args:
+        query: Filtered query to paginate
+        timestamp_column: Column ordering rows in time
+        id_column: Unique column breaking ties between equal timestamps
+        cursor: Cursor returned with the previous page, or None for the first page
+        limit: Maximum number of rows to return
+
+    Returns:
+        Tuple of (rows, next_cursor); next_cursor is None on the last page
+    """
+    if cursor:
+        query = query.filter(_after_cursor(timestamp_column, id_column, cursor))
+
+    # Fetch one extra row to know whether another page exists
+    rows = query.order_by(timestamp_column.desc(), id_column.desc()).limit(limit + 1).all()
+    return _page(rows, timestamp_column, id_column, limit)
+
+
+async def paginate_keyset_async(
+    db: AsyncSession,
+    statement: Select,
+    timestamp_column,
+    id_column,
+    cursor: Optional[str] = None,
+    limit: int = DEFAULT_PAGE_SIZE
+) -> Tuple[List, Optional[str]]:
+    """
+    Async counterpart of paginate_keyset() for a select() of ORM entities.
+
+    Returns:
+        Tuple of (rows, next_cursor); next_cursor is None on the last page
+    """
+    if cursor:
+        statement = statement.where(_after_cursor(timestamp_column, id_column, cursor))
+
+    statement = statement.order_by(timestamp_column.desc(), id_column.desc()).limit(limit + 1)
+    rows = (await db.scalars(statement)).all()
+    return _page(rows, timestamp_column, id_column, limit)
+
+
+def _after_cursor(timestamp_column, id_column, cursor: str):
+    """Condition selecting rows that come after the cursor position"""
+    timestamp, row_id = decode_cursor(cursor)
+    return or_(
+        timestamp_column < timestamp,
+        and_(timestamp_column == timestamp, id_column < row_id)
+    )
+
+
+def _page(rows: List, timestamp_column, id_column, limit: int) -> Tuple[List, Optional[str]]:
+    """Trim the extra row fetched past the page and build the next cursor from the last row"""
+    if len(rows) <= limit:
+        return list(rows), None
+
+    rows = rows[:limit]
+    last = rows[-1]
+    return rows, encode_cursor(getattr(last, timestamp_column.key), getattr(last, id_column.key))
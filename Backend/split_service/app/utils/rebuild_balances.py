@@ -0,0 +1,68 @@
+"""
+Rebuild or verify the materialized group balances ledger.
+
+Recomputes every group's balances from the full expense, share and
+settlement history and compares them with the group_balances table.
+
+Usage:
+    python -m app.utils.rebuild_balances verify [--group SLUG]
+    python -m app.utils.rebuild_balances rebuild [--group SLUG]
+
+`verify` only reports drift and exits with status 1 when any is found;
+`rebuild` overwrites drifted rows with the recomputed values.
+"""
+
+import argparse
+import sys
+from typing import Dict, List
+
+from app.db.database import Base, SessionLocal, engine
+from app.models import Group
+from app.services.balance_service import reconcile_all_balances, reconcile_group_balances
+
+
+def print_report(report: Dict[str, List[Dict]], repaired: bool) -> None:
+    """Print drift entries grouped by group ID."""
+    if not report:
+        print("No drift found: group balances match history")
+        return
+
+    for group_id, drift in report.items():
+        print(f"Group {group_id}: {len(drift)} drifted value(s)")
+        for entry in drift:
+            print(f"  {entry['user_id']} {entry['field']}: "
+                  f"stored={entry['stored']} expected={entry['expected']}")
+
+    action = "repaired" if repaired else "found"
+    print(f"Drift {action} in {len(report)} group(s)")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Rebuild or verify materialized group balances")
+    parser.add_argument("command", choices=["verify", "rebuild"])
+    parser.add_argument("--group", help="Only process the group with this slug")
+    args = parser.parse_args(argv)
+
+    Base.metadata.create_all(bind=engine)
+    repair = args.command == "rebuild"
+
+    db = SessionLocal()
+    try:
+        if args.group:
+            group = db.query(Group).filter(Group.slug == args.group).first()
+            if not group:
+                print(f"Group not found: {args.group}")
+                return 2
+            drift = reconcile_group_balances(db, group.id, repair=repair)
+            report = {group.id: drift} if drift else {}
+        else:
+            report = reconcile_all_balances(db, repair=repair)
+    finally:
+        db.close()
+
+    print_report(report, repaired=repair)
+    return 1 if report and not repair else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
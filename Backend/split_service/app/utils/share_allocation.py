@@ -0,0 +1,108 @@
+"""
+Share Allocation Module
+
+Splits an amount in integer cents between participants so the shares always
+add up to the amount exactly, whatever the split.
+
+Every participant's exact share is amount * weight / total_weight. Shares are
+first rounded down to whole cents and the leftover cents are handed out
+according to the group's rounding option (see RoundingOption in
+app.models.groups):
+- "none": largest remainder; the leftover cents go to the participants with
+  the largest fractional remainders, ties going to earlier participants
+- "down": other participants' shares stay rounded down and the payer's own
+  share absorbs the leftover cents
+- "up": other participants' shares are rounded up and the payer's own share
+  is reduced by the difference
+
+"down" and "up" need the payer to be one of the participants; otherwise, or
+if rounding up would leave the payer with a negative share, the largest
+remainder method is used.
+
+Example Usage:
+    from app.utils.share_allocation import allocate_shares
+
+    allocate_shares(10000, [1, 1, 1])                            # [3334, 3333, 3333]
+    allocate_shares(10000, [1, 1, 1], rounding="down", payer_index=2)  # [3333, 3333, 3334]
+    allocate_shares(10000, [1, 1, 1], rounding="up", payer_index=2)    # [3334, 3334, 3332]
+"""
+
+import math
+from decimal import Decimal
+from typing import List, Optional, Sequence
+
+
+def integer_weights(weights: Sequence) -> List[int]:
+    """
+    Scale decimal weights to integers with the same ratios by bringing them
+    to their least common denominator.
+
+    Example:
+        >>> integer_weights([Decimal("0.25"), Decimal("0.5"), Decimal("0.25")])
+        [1, 2, 1]
+    """
+    ratios = [
+        (weight if isinstance(weight, Decimal) else Decimal(str(weight))).as_integer_ratio()
+        for weight in weights
+    ]
+    denominator = math.lcm(*(ratio_denominator for _, ratio_denominator in ratios))
+    return [numerator * (denominator // ratio_denominator) for numerator, ratio_denominator in ratios]
+
+
+def allocate_shares(
+    amount: int,
+    weights: Sequence[int],
+    rounding: str = "none",
+    payer_index: Optional[int] = None
+) -> List[int]:
+    """
+    Split amount (in cents) between participants in proportion to weights.
+
+    Args:
+        amount: Amount to split, in cents
+        weights: Non-negative integer weight per participant, not all zero
+        rounding: Group rounding option, "none", "up" or "down"
+        payer_index: Position of the payer among the participants, if any
+
+    Returns:
+        List of shares in cents, in participant order, summing to amount
+
+    Raises:
+        ValueError: If weights are empty or all zero
+
+    Example:
+        >>> allocate_shares(10000, [1, 1, 1])
+        [3334, 3333, 3333]
+    """
+    total_weight = sum(weights)
+    if not weights or total_weight <= 0:
+        raise ValueError("At least one participant must have a positive weight")
+
+    shares = []
+    remainders = []
+    for weight in weights:
+        share, remainder = divmod(amount * weight, total_weight)
+        shares.append(share)
+        remainders.append(remainder)
+    leftover = amount - sum(shares)
+
+    if leftover and payer_index is not None:
+        if rounding == "down":
+            shares[payer_index] += leftover
+            return shares
+
+        if rounding == "up":
+            rounded_up = [
+                share + 1 if remainder and index != payer_index else share
+                for index, (share, remainder) in enumerate(zip(shares, remainders))
+            ]
+            payer_share = amount - (sum(rounded_up) - rounded_up[payer_index])
+            if payer_share >= 0:
+                rounded_up[payer_index] = payer_share
+                return rounded_up
+
+    # Largest remainder: sorted() is stable, so ties go to earlier participants
+    for index in sorted(range(len(shares)), key=lambda index: -remainders[index])[:leftover]:
+        shares[index] += 1
+
+    return shares
@@ -1,5 +1,7 @@
 """Auth API routes"""
+import logging
 from fastapi import APIRouter, HTTPException, Depends, BackgroundTasks, Request
+from datetime import datetime, timezone
 from typing import Optional
 from sqlalchemy.orm import Session
 from app.db import get_db
@@ -18,11 +20,14 @@ from app.apps.auth.services import OTPService, JWTService, TokenBlacklistService
 from app.apps.auth.selectors import TokenSelector
 from app.apps.users.models import User, UserRole
 from app.apps.users.selectors import UserSelector
+from app.apps.users.services import UserProfileCacheService
 from app.utils.validators import normalize_phone_number
 from app.utils.google_drive import convert_gdrive_url_to_endpoint_url
 from app.core.dependencies import extract_token, get_current_user, get_current_user_optional
 from app.core.errors import AuthError, UserError
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter(prefix="/auth", tags=["Auth"])
 
 
@@ -98,8 +103,8 @@ def request_otp(
     if identifier_type == "phone_number":
         send_identifier = normalize_phone_number(send_identifier)
 
-    # Create OTP with purpose (field auto-detected for updates)
-    otp = OTPService.create_otp(user_id, request.purpose)
+    # Create OTP with purpose (updates record the pending field)
+    otp = OTPService.create_otp(user_id, request.purpose, identifier_type if request.purpose == "update" else None)
 
     # Send OTP message in background
     background_tasks.add_task(
@@ -143,17 +148,14 @@ def verify_otp(
         if not user:
             raise HTTPException(status_code=400, detail=UserError.OTP_NOT_REQUESTED)
 
-        if not OTPService.validate_otp(user.id, request.otp_code, request.purpose):
+        is_valid, _ = OTPService.validate_otp(user.id, request.otp_code, request.purpose)
+        if not is_valid:
             raise HTTPException(status_code=400, detail=UserError.INVALID_OTP)
 
         is_new_user = user.name == "" or user.name is None
 
         # Generate tokens
-        access_token = JWTService.create_access_token({
-            "user_id": user.id,
-            "email": user.email,
-            "phone_number": user.phone_number
-        })
+        access_token = JWTService.create_access_token({"user_id": user.id})
         refresh_token = JWTService.create_refresh_token({
             "user_id": user.id
         })
@@ -221,6 +223,7 @@ def verify_otp(
         # Update the user
         setattr(user, identifier_type, update_value)
         db.commit()
+        UserProfileCacheService.invalidate(user_id)
 
         # Clear the pending update
         PendingUpdateService.clear_pending_update(user_id, identifier_type)
@@ -253,7 +256,7 @@ def check_user(
     if not payload:
         raise HTTPException(status_code=401, detail=AuthError.INVALID_TOKEN)
 
-    if TokenSelector.is_blacklisted(db, token):
+    if TokenBlacklistService.is_blacklisted(token, db):
         raise HTTPException(status_code=401, detail=AuthError.TOKEN_BLACKLISTED)
 
     return {"msg": "Token is valid"}
@@ -278,22 +281,15 @@ def refresh_token(request: RefreshRequest, db: Session = Depends(get_db)):
     if not payload:
         raise HTTPException(status_code=401, detail=AuthError.INVALID_REFRESH_TOKEN)
 
-    # Check blacklist
-    if TokenBlacklistService.is_blacklisted(refresh_token):
-        raise HTTPException(status_code=401, detail=AuthError.TOKEN_BLACKLISTED)
-
-    if TokenSelector.is_blacklisted(db, refresh_token):
+    # Check blacklist in Redis and the database; the filter may have missed a logout
+    if TokenBlacklistService.is_blacklisted(refresh_token, db, use_filter=False):
         raise HTTPException(status_code=401, detail=AuthError.TOKEN_BLACKLISTED)
 
     user = UserSelector.get_by_id(db, payload["user_id"])
     if not user:
         raise HTTPException(status_code=404, detail=UserError.NOT_FOUND)
 
-    access_token = JWTService.create_access_token({
-        "user_id": user.id,
-        "email": user.email,
-        "phone_number": user.phone_number
-    })
+    access_token = JWTService.create_access_token({"user_id": user.id})
     new_refresh_token = JWTService.create_refresh_token({"user_id": user.id})
 
     return TokenResponse(access_token=access_token, refresh_token=new_refresh_token)
@@ -318,12 +314,16 @@ def logout(request: RefreshRequest, db: Session = Depends(get_db)):
         raise HTTPException(status_code=401, detail=AuthError.INVALID_REFRESH_TOKEN)
 
     user_id = payload["user_id"]
+    expires_at = datetime.fromtimestamp(payload["exp"], tz=timezone.utc)
 
-    # Blacklist in database
-    TokenSelector.blacklist(db, user_id, refresh_token)
+    # Blacklist in database until the token would have expired anyway
+    TokenSelector.blacklist(db, user_id, refresh_token, expires_at)
 
     # Blacklist in Redis
-    TokenBlacklistService.blacklist_token(refresh_token, expires_in=7*24*3600)
+    expires_in = int((expires_at - datetime.now(timezone.utc)).total_seconds())
+    if not TokenBlacklistService.blacklist_token(refresh_token, expires_in=max(1, expires_in)):
+        # The database row still blocks /auth/refresh, which always checks it
+        logger.warning(f"Refresh token of user {user_id} was blacklisted in the database only")
 
     return LogoutResponse(msg="Logged out successfully")
 
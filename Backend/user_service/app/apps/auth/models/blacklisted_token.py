@@ -6,11 +6,15 @@ from app.db import Base
 
 
 class BlacklistedToken(Base):
-    """Blacklisted Token model"""
+    """Blacklisted Token model
+
+    Tokens are stored as their SHA-256 hex digest, never in clear. Rows are
+    only needed until the token itself expires and are purged after that.
+    """
     __tablename__ = "blacklisted_tokens"
 
     id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
     user_id = Column(String, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
-    token = Column(String, nullable=False, index=True)
+    token_hash = Column(String(64), nullable=False, unique=True, index=True)
+    expires_at = Column(DateTime(timezone=True), nullable=False, index=True)
     blacklisted_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
-
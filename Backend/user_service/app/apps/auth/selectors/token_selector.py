@@ -1,7 +1,10 @@
 """Token data access layer"""
-from typing import Optional
+from datetime import datetime, timezone
+from typing import Iterator
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 from app.apps.auth.models import BlacklistedToken
+from app.utils.token_hash import token_digest
 
 
 class TokenSelector:
@@ -9,15 +12,57 @@ class TokenSelector:
 
     @staticmethod
     def is_blacklisted(db: Session, token: str) -> bool:
-        """Check if token is blacklisted"""
-        return db.query(BlacklistedToken).filter_by(token=token).first() is not None
+        """Check if token is blacklisted and not yet expired"""
+        return db.query(BlacklistedToken.id).filter(
+            BlacklistedToken.token_hash == token_digest(token),
+            BlacklistedToken.expires_at > datetime.now(timezone.utc),
+        ).first() is not None
 
     @staticmethod
-    def blacklist(db: Session, user_id: str, token: str) -> BlacklistedToken:
-        """Add token to blacklist"""
-        blacklisted = BlacklistedToken(user_id=user_id, token=token)
-        db.add(blacklisted)
+    def iter_blacklisted_digests(db: Session, batch_size: int = 1000) -> Iterator[str]:
+        """Yield the digest of every unexpired blacklisted token, loading batch_size rows at a time"""
+        query = (
+            db.query(BlacklistedToken.token_hash)
+            .filter(BlacklistedToken.expires_at > datetime.now(timezone.utc))
+            .execution_options(yield_per=batch_size)
+        )
+        for (digest,) in query:
+            yield digest
+
+    @staticmethod
+    def blacklist(db: Session, user_id: str, token: str, expires_at: datetime) -> BlacklistedToken:
+        """Add token to blacklist until expires_at; blacklisting it again returns the existing row"""
+        digest = token_digest(token)
+        existing = db.query(BlacklistedToken).filter_by(token_hash=digest).first()
+        if existing:
+            return existing
+        blacklisted = BlacklistedToken(user_id=user_id, token_hash=digest, expires_at=expires_at)
+        try:
+            # Savepoint, so losing the race only undoes this insert
+            with db.begin_nested():
+                db.add(blacklisted)
+        except IntegrityError:
+            # A concurrent logout with the same token inserted it first
+            return db.query(BlacklistedToken).filter_by(token_hash=digest).one()
         db.commit()
         db.refresh(blacklisted)
         return blacklisted
 
+    @staticmethod
+    def purge_expired(db: Session, batch_size: int = 1000) -> int:
+        """Delete expired rows batch_size at a time, committing after each batch"""
+        now = datetime.now(timezone.utc)
+        purged = 0
+        while True:
+            ids = [
+                row_id for (row_id,) in db.query(BlacklistedToken.id)
+                .filter(BlacklistedToken.expires_at <= now)
+                .limit(batch_size)
+            ]
+            if not ids:
+                return purged
+            db.query(BlacklistedToken).filter(BlacklistedToken.id.in_(ids)).delete(synchronize_session=False)
+            db.commit()
+            purged += len(ids)
+            if len(ids) < batch_size:
+                return purged
@@ -1,36 +1,64 @@
 """JWT token service"""
+import hashlib
+import time
 import jwt
 from datetime import datetime, timedelta
 from typing import Optional, Dict
+from uuid import uuid4
 from app.config import jwt_config
+from app.utils.lru import LRUCache, MISSING
+
+# Decoded access token claims by token digest, kept until the token expires
+_access_claims = LRUCache(jwt_config.claims_cache_size)
+
+
+def _claims_key(token: str) -> bytes:
+    return hashlib.sha256(token.encode("utf-8")).digest()
 
 
 class JWTService:
-    """JWT token service"""
+    """JWT token service
+
+    Tokens carry only user_id plus the registered jti, iat and exp claims.
+    Verified access token claims are memoized in an in-process LRU keyed by
+    the token's SHA-256 digest until the token expires, so repeated requests
+    with the same token skip the signature check.
+    """
+
+    @staticmethod
+    def _claims(data: Dict, lifetime: timedelta) -> Dict:
+        now = datetime.utcnow()
+        to_encode = data.copy()
+        to_encode.update({"jti": uuid4().hex, "iat": now, "exp": now + lifetime})
+        return to_encode
 
     @staticmethod
     def create_access_token(data: Dict) -> str:
         """Create access token"""
-        to_encode = data.copy()
-        expire = datetime.utcnow() + timedelta(minutes=jwt_config.access_token_expire_minutes)
-        to_encode.update({"exp": expire})
+        to_encode = JWTService._claims(data, timedelta(minutes=jwt_config.access_token_expire_minutes))
         return jwt.encode(to_encode, jwt_config.secret_key, algorithm=jwt_config.algorithm)
 
     @staticmethod
     def create_refresh_token(data: Dict) -> str:
         """Create refresh token"""
-        to_encode = data.copy()
-        expire = datetime.utcnow() + timedelta(days=jwt_config.refresh_token_expire_days)
-        to_encode.update({"exp": expire})
+        to_encode = JWTService._claims(data, timedelta(days=jwt_config.refresh_token_expire_days))
         return jwt.encode(to_encode, jwt_config.refresh_secret_key, algorithm=jwt_config.algorithm)
 
     @staticmethod
     def decode_access_token(token: str) -> Optional[Dict]:
         """Decode access token"""
+        key = _claims_key(token)
+        claims = _access_claims.get(key)
+        if claims is not MISSING:
+            return dict(claims)
         try:
-            return jwt.decode(token, jwt_config.secret_key, algorithms=[jwt_config.algorithm])
+            claims = jwt.decode(token, jwt_config.secret_key, algorithms=[jwt_config.algorithm])
         except (jwt.ExpiredSignatureError, jwt.InvalidTokenError):
             return None
+        remaining = claims.get("exp", 0) - time.time()
+        if remaining > 0:
+            _access_claims.set(key, claims, ttl=remaining)
+        return dict(claims)
 
     @staticmethod
     def decode_refresh_token(token: str) -> Optional[Dict]:
@@ -40,3 +68,7 @@ class JWTService:
         except (jwt.ExpiredSignatureError, jwt.InvalidTokenError):
             return None
 
+    @staticmethod
+    def clear_claims_cache() -> None:
+        """Forget memoized access token claims"""
+        _access_claims.clear()
@@ -3,7 +3,6 @@ import random
 import string
 import re
 import logging
-from datetime import datetime, timedelta
 from typing import Optional, Dict
 from app.core.redis import get_cache
 from app.core.rabbitmq import get_rabbitmq_producer
@@ -13,6 +12,38 @@ from app.utils.validators import normalize_phone_number
 logger = logging.getLogger(__name__)
 
 
+# OTPs live in a Redis hash (code, purpose, field, attempts) that expires
+# with the code. Both scripts run atomically on the server in one round trip.
+OTP_TTL_SECONDS = 600
+OTP_MAX_ATTEMPTS = 5
+
+# KEYS[1] otp key; ARGV code, purpose, field, ttl
+CREATE_OTP_SCRIPT = """
+redis.call('DEL', KEYS[1])
+redis.call('HSET', KEYS[1], 'code', ARGV[1], 'purpose', ARGV[2], 'field', ARGV[3], 'attempts', 0)
+redis.call('EXPIRE', KEYS[1], ARGV[4])
+return 1
+"""
+
+# KEYS[1] otp key; ARGV code, purpose, max attempts
+# Returns {valid, field}: a match deletes the OTP, a miss counts an attempt
+# and deletes the OTP once the attempts are used up.
+VERIFY_OTP_SCRIPT = """
+local otp = redis.call('HMGET', KEYS[1], 'code', 'purpose', 'field')
+if not otp[1] or otp[2] ~= ARGV[2] then
+    return {0, otp[3] or ''}
+end
+if otp[1] == ARGV[1] then
+    redis.call('DEL', KEYS[1])
+    return {1, otp[3]}
+end
+if redis.call('HINCRBY', KEYS[1], 'attempts', 1) >= tonumber(ARGV[3]) then
+    redis.call('DEL', KEYS[1])
+end
+return {0, otp[3]}
+"""
+
+
 class OTPService:
     """OTP service"""
 
@@ -22,13 +53,17 @@ class OTPService:
         return ''.join(random.choices(string.digits, k=length))
 
     @staticmethod
-    def create_otp(user_id: str, purpose: str = "auth") -> Dict:
+    def _cache_key(user_id: str, purpose: str) -> str:
+        # Update OTPs record the pending field in the hash, one per user
+        return f"otp:update:{user_id}" if purpose == "update" else f"otp:{user_id}"
+
+    @staticmethod
+    def create_otp(user_id: str, purpose: str = "auth", field: Optional[str] = None) -> Dict:
         """Create and cache OTP"""
         otp_code = OTPService.generate_otp_code()
 
         # For update purpose, auto-detect which field has pending update
-        field = None
-        if purpose == "update":
+        if purpose == "update" and field is None:
             from app.apps.auth.services.pending_update_service import PendingUpdateService
             pending_updates = PendingUpdateService.get_all_pending_updates(user_id)
 
@@ -40,22 +75,11 @@ class OTPService:
             else:
                 raise ValueError("No pending updates found for user")
 
-        # Different cache keys for different purposes
-        if purpose == "update" and field:
-            cache_key = f"otp:update:{user_id}:{field}"
-        else:
-            cache_key = f"otp:{user_id}"
-
-        otp_data = {
-            "code": otp_code,
-            "created_at": datetime.utcnow().isoformat(),
-            "is_used": False,
-            "purpose": purpose,
-            "field": field
-        }
-
-        cache = get_cache()
-        success = cache.set(cache_key, otp_data, expire=600)  # 10 minutes
+        success = get_cache().run_script(
+            CREATE_OTP_SCRIPT,
+            keys=[OTPService._cache_key(user_id, purpose)],
+            args=[otp_code, purpose, field or "", OTP_TTL_SECONDS],
+        ) == 1
 
         if not success:
             logger.warning(f"Failed to store OTP in cache for user {user_id}, purpose {purpose}")
@@ -63,7 +87,7 @@ class OTPService:
         return {
             "user_id": user_id,
             "code": otp_code,
-            "expires_in": 600,
+            "expires_in": OTP_TTL_SECONDS,
             "cached": success,
             "purpose": purpose,
             "field": field
@@ -71,56 +95,22 @@ class OTPService:
 
     @staticmethod
     def validate_otp(user_id: str, otp_code: str, purpose: str = "auth") -> tuple[bool, Optional[str]]:
-        """Validate OTP code and return (is_valid, field)"""
-        # For update purpose, auto-detect which field has pending update
-        field = None
-        if purpose == "update":
-            from app.apps.auth.services.pending_update_service import PendingUpdateService
-            pending_updates = PendingUpdateService.get_all_pending_updates(user_id)
-
-            # Use the first available pending update (prioritize email, then phone)
-            if "email" in pending_updates:
-                field = "email"
-            elif "phone_number" in pending_updates:
-                field = "phone_number"
-
-        # Different cache keys for different purposes
-        if purpose == "update" and field:
-            cache_key = f"otp:update:{user_id}:{field}"
-        else:
-            cache_key = f"otp:{user_id}"
-
-        cache = get_cache()
-        otp_data = cache.get(cache_key)
-
-        if not otp_data:
-            return False, field
-
-        if otp_data.get("is_used", False):
-            return False, field
-
-        if otp_data.get("code") != otp_code:
-            return False, field
-
-        # Verify purpose matches
-        if otp_data.get("purpose") != purpose:
-            return False, field
-
-        # Check expiration
-        created_at_str = otp_data.get("created_at")
-        if created_at_str:
-            try:
-                created_at = datetime.fromisoformat(created_at_str)
-                if datetime.utcnow() - created_at > timedelta(minutes=10):
-                    cache.delete(cache_key)
-                    return False, field
-            except (ValueError, TypeError):
-                cache.delete(cache_key)
-                return False, field
-
-        # OTP is valid, remove it
-        cache.delete(cache_key)
-        return True, field
+        """Validate OTP code and return (is_valid, field)
+
+        Compare, attempt counting and delete happen in one atomic script call,
+        so a code can only be redeemed once and guessing is capped at
+        OTP_MAX_ATTEMPTS tries per code.
+        """
+        result = get_cache().run_script(
+            VERIFY_OTP_SCRIPT,
+            keys=[OTPService._cache_key(user_id, purpose)],
+            args=[otp_code, purpose, OTP_MAX_ATTEMPTS],
+        )
+        if not result:
+            return False, None
+
+        is_valid, field = result
+        return is_valid == 1, field or None
 
     @staticmethod
     def get_identifier_type(identifier: str) -> str:
@@ -41,12 +41,16 @@ class PendingUpdateService:
     def get_pending_update(user_id: str, field: str) -> Optional[Dict[str, Any]]:
         """Get pending update if it exists and hasn't expired"""
         cache_key = f"pending_update:{user_id}:{field}"
-        cache = get_cache()
-        update_data = cache.get(cache_key)
+        return PendingUpdateService._unexpired(cache_key, get_cache().get(cache_key))
 
+    @staticmethod
+    def _unexpired(cache_key: str, update_data: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """Return update_data unless it is missing or older than 30 minutes"""
         if not update_data:
             return None
 
+        cache = get_cache()
+
         # Check expiration
         created_at_str = update_data.get("created_at")
         if created_at_str:
@@ -70,18 +74,14 @@ class PendingUpdateService:
 
     @staticmethod
     def get_all_pending_updates(user_id: str) -> Dict[str, Dict[str, Any]]:
-        """Get all pending updates for a user"""
-        cache = get_cache()
+        """Get all pending updates for a user (email and phone in one MGET)"""
+        keys = {field: f"pending_update:{user_id}:{field}" for field in ("email", "phone_number")}
+        cached = get_cache().get_many(keys.values())
         updates = {}
 
-        # Check for email update
-        email_update = PendingUpdateService.get_pending_update(user_id, "email")
-        if email_update:
-            updates["email"] = email_update
-
-        # Check for phone update
-        phone_update = PendingUpdateService.get_pending_update(user_id, "phone_number")
-        if phone_update:
-            updates["phone_number"] = phone_update
+        for field, cache_key in keys.items():
+            update_data = PendingUpdateService._unexpired(cache_key, cached.get(cache_key))
+            if update_data:
+                updates[field] = update_data
 
         return updates
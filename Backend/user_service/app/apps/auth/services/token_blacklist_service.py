@@ -1,19 +1,190 @@
-"""Token blacklist service"""
-from app.core.redis import get_cache
+"""Token blacklist service
+
+Revoked tokens are identified by the SHA-256 digest of the token string;
+neither Redis, the database nor the filter below ever holds the token itself.
+
+Every process keeps a Bloom filter of blacklisted digests. A token the
+filter has never seen is accepted without any I/O, which is the answer for
+nearly every authenticated request. Only a filter positive (a revoked token
+or a rare false positive) goes on to Redis and then the database. Refreshing
+a token skips the filter and always asks Redis and the database, since a
+lost pub/sub message would otherwise let a revoked refresh token through.
+
+The filter is warmed from Redis and the database when the subscriber
+connects, and new entries reach every process through Redis pub/sub. While
+the subscriber is disconnected the filter cannot see other processes'
+logouts, so it reports "maybe" for everything and checks fall back to
+Redis and the database.
+"""
+import logging
+import threading
+from typing import Iterable, Optional
+
+from sqlalchemy.orm import Session
+
+from app.apps.auth.selectors import TokenSelector
+from app.config import jwt_config
+from app.core.redis import get_cache, get_redis_client
+from app.db import SessionLocal
+from app.utils.bloom_filter import BloomFilter
+from app.utils.token_hash import token_digest
+
+logger = logging.getLogger(__name__)
+
+BLACKLIST_KEY_PREFIX = "blacklist:"
+
+
+class BlacklistFilter:
+    """In-process Bloom filter of blacklisted token digests"""
+
+    def __init__(self):
+        self.bloom = self._new_bloom()
+        self.ready = False
+
+    @staticmethod
+    def _new_bloom() -> BloomFilter:
+        return BloomFilter(jwt_config.blacklist_bloom_capacity, jwt_config.blacklist_bloom_error_rate)
+
+    def warm(self, digests: Iterable[str]) -> None:
+        """Replace the filter contents and start trusting negatives"""
+        bloom = self._new_bloom()
+        bloom.update(digests)
+        self.bloom = bloom
+        self.ready = True
+
+    def add(self, digest: str) -> None:
+        self.bloom.add(digest)
+
+    def might_contain(self, digest: str) -> bool:
+        """False only if the digest is certainly not blacklisted"""
+        return not self.ready or digest in self.bloom
+
+
+_blacklist_filter = BlacklistFilter()
+
+
+def get_blacklist_filter() -> BlacklistFilter:
+    """Get the process-wide blacklist filter"""
+    return _blacklist_filter
 
 
 class TokenBlacklistService:
-    """Token blacklist service using Redis"""
+    """Token blacklist service using a Bloom filter, Redis and the database"""
 
     @staticmethod
     def blacklist_token(token: str, expires_in: int = 3600) -> bool:
-        """Add token to blacklist"""
-        key = f"blacklist:{token}"
-        return get_cache().set(key, "blacklisted", expire=expires_in)
+        """Add token to blacklist
+
+        Returns False if Redis is unavailable or the SET and PUBLISH failed,
+        in which case other processes' filters have not seen the token.
+        """
+        digest = token_digest(token)
+        get_blacklist_filter().add(digest)
+        try:
+            with get_cache().pipeline() as pipe:
+                if pipe is None:
+                    return False
+                pipe.set(f"{BLACKLIST_KEY_PREFIX}{digest}", "blacklisted", ex=expires_in)
+                # Other processes add the digest to their filters
+                pipe.publish(jwt_config.blacklist_channel, digest)
+        except Exception:
+            # Already logged by the cache
+            return False
+        return True
 
     @staticmethod
-    def is_blacklisted(token: str) -> bool:
-        """Check if token is blacklisted"""
-        key = f"blacklist:{token}"
-        return get_cache().exists(key)
+    def is_blacklisted(token: str, db: Optional[Session] = None, use_filter: bool = True) -> bool:
+        """Check if token is blacklisted; the database is only queried on a filter positive
+
+        Pass use_filter=False to always check Redis and the database, for
+        paths where a missed pub/sub message must not let a revoked token
+        through.
+        """
+        digest = token_digest(token)
+        if use_filter and not get_blacklist_filter().might_contain(digest):
+            return False
+        if get_cache().exists(f"{BLACKLIST_KEY_PREFIX}{digest}"):
+            return True
+        return db is not None and TokenSelector.is_blacklisted(db, token)
+
+
+def warm_blacklist_filter() -> int:
+    """Load every blacklisted digest from Redis and the database into the filter"""
+    digests = set()
+    client = get_redis_client()
+    if client is not None:
+        for key in client.scan_iter(match=f"{BLACKLIST_KEY_PREFIX}*", count=1000):
+            digests.add(key[len(BLACKLIST_KEY_PREFIX):])
+    with SessionLocal() as db:
+        digests.update(TokenSelector.iter_blacklisted_digests(db))
+    get_blacklist_filter().warm(digests)
+    logger.info(f"Token blacklist filter warmed with {len(digests)} entries")
+    return len(digests)
+
+
+class BlacklistSubscriber:
+    """Keeps this process's blacklist filter in sync through Redis pub/sub"""
+
+    def __init__(self):
+        self.thread: Optional[threading.Thread] = None
+        self.running = False
+        self._stopped = threading.Event()
+
+    def start(self) -> None:
+        """Start listening in a background thread"""
+        if self.running:
+            return
+        self.running = True
+        self._stopped.clear()
+        self.thread = threading.Thread(target=self._run, daemon=True, name="TokenBlacklistSubscriber")
+        self.thread.start()
+
+    def stop(self) -> None:
+        """Stop listening"""
+        self.running = False
+        self._stopped.set()
+        if self.thread and self.thread.is_alive():
+            self.thread.join(timeout=2)
+
+    def _run(self) -> None:
+        blacklist_filter = get_blacklist_filter()
+        while self.running:
+            client = get_redis_client()
+            if client is None:
+                blacklist_filter.ready = False
+                self._stopped.wait(5)
+                continue
+
+            pubsub = client.pubsub(ignore_subscribe_messages=True)
+            try:
+                # Subscribe before warming so no entry falls between the two
+                pubsub.subscribe(jwt_config.blacklist_channel)
+                warm_blacklist_filter()
+                while self.running:
+                    message = pubsub.get_message(timeout=1.0)
+                    if message and message.get("type") == "message":
+                        blacklist_filter.add(message["data"])
+            except Exception as e:
+                blacklist_filter.ready = False
+                if self.running:
+                    logger.error(f"Token blacklist subscriber error: {e}")
+            finally:
+                try:
+                    pubsub.close()
+                except Exception:
+                    # Best-effort cleanup
+                    pass
+            self._stopped.wait(5)
+
+
+_blacklist_subscriber = BlacklistSubscriber()
+
+
+def start_blacklist_subscriber() -> None:
+    """Warm the blacklist filter and follow new entries"""
+    _blacklist_subscriber.start()
+
 
+def stop_blacklist_subscriber() -> None:
+    """Stop following blacklist entries"""
+    _blacklist_subscriber.stop()
@@ -1,6 +1,6 @@
 """User API routes"""
 from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Form, Request, Response, BackgroundTasks
-from typing import Optional
+from typing import Optional, Union
 from sqlalchemy.orm import Session
 import httpx
 import io
@@ -9,9 +9,9 @@ from app.db import get_db, SessionLocal
 from app.apps.users.models import User
 from app.apps.users.schemas import UserOut, UserUpdate, ErrorResponse
 from app.apps.auth.services import PendingUpdateService
-from app.apps.users.services import UserService
+from app.apps.users.services import UserService, UserProfileCacheService
 from app.utils.validators import FIELD_VALIDATORS, normalize_phone_number
-from app.core.dependencies import get_current_user, get_drive_service
+from app.core.dependencies import get_current_user, get_current_user_profile, get_drive_service
 from app.core.errors import UserError
 from app.utils.google_drive import convert_gdrive_url_to_endpoint_url, GoogleDriveService
 from app.utils.validators import validate_image_file
@@ -20,10 +20,24 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/users", tags=["Users"])
 
+# Profile fields other services cache (split_service group member info)
+SHARED_PROFILE_FIELDS = ("name", "avatar_url", "card_number", "card_holder_name")
 
-def _convert_user_avatar_url(user: User, request: Request) -> UserOut:
+
+def _shared_profile(user: User) -> dict:
+    return {field: getattr(user, field) for field in SHARED_PROFILE_FIELDS}
+
+
+def _publish_user_updated(user_id: str, fields: list) -> None:
+    """Tell other services which cached profile fields of a user changed"""
+    from app.core.rabbitmq import get_rabbitmq_producer
+    if not get_rabbitmq_producer().publish_user_updated(user_id, fields):
+        logger.warning(f"Failed to publish user.updated for user {user_id}")
+
+
+def _convert_user_avatar_url(user: Union[User, UserOut], request: Request) -> UserOut:
     """Convert user avatar URL from gdrive:// format to endpoint URL"""
-    user_out = UserOut.model_validate(user)
+    user_out = UserOut.model_validate(user) if isinstance(user, User) else user.model_copy()
     if user_out.avatar_url and user_out.avatar_url.startswith('gdrive://'):
         user_out.avatar_url = convert_gdrive_url_to_endpoint_url(
             user_out.avatar_url, str(request.base_url)
@@ -81,7 +95,9 @@ def _upload_profile_image_background(
         if user:
             user.avatar_url = avatar_url
             db.commit()
+            UserProfileCacheService.invalidate(user_id)
             logger.info(f"Successfully uploaded profile image for user {user_id}")
+            _publish_user_updated(user_id, ["avatar_url"])
         else:
             logger.error(f"User {user_id} not found when updating avatar_url")
             
@@ -104,7 +120,7 @@ def _upload_profile_image_background(
 )
 def get_current_user_info(
     request: Request,
-    current_user: User = Depends(get_current_user)
+    current_user: UserOut = Depends(get_current_user_profile)
 ) -> UserOut:
     """Get current user profile"""
     return _convert_user_avatar_url(current_user, request)
@@ -137,6 +153,8 @@ async def update_user_profile(
     drive_service: GoogleDriveService = Depends(get_drive_service)
 ) -> UserOut:
     """Update user profile"""
+    shared_before = _shared_profile(current_user)
+
     # Handle profile image upload (async background processing)
     if profile_image and profile_image.filename and profile_image.filename.strip():
         validate_image_file(profile_image)
@@ -223,6 +241,13 @@ async def update_user_profile(
 
     db.commit()
     db.refresh(current_user)
+    UserProfileCacheService.invalidate(current_user.id)
+
+    shared_after = _shared_profile(current_user)
+    changed_fields = [field for field in SHARED_PROFILE_FIELDS if shared_before[field] != shared_after[field]]
+    if changed_fields:
+        # Published after the response so the broker round trip does not delay it
+        background_tasks.add_task(_publish_user_updated, current_user.id, changed_fields)
 
     # Create response
     response_data = _convert_user_avatar_url(current_user, request)
@@ -1,5 +1,6 @@
 """User services"""
 from .user_service import UserService
+from .profile_cache_service import UserProfileCacheService
 
-__all__ = ["UserService"]
+__all__ = ["UserService", "UserProfileCacheService"]
 
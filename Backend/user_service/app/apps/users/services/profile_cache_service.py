@@ -0,0 +1,50 @@
+"""Cached user profile projection"""
+import logging
+from typing import Optional
+from app.apps.users.models import User
+from app.apps.users.schemas import UserOut
+from app.config import redis_config
+from app.core.redis import get_cache
+
+logger = logging.getLogger(__name__)
+
+
+class UserProfileCacheService:
+    """Caches the UserOut projection of each user in Redis.
+
+    Lets authenticated profile reads skip the users table. Every write to a
+    user's profile must call invalidate() after committing; entries also
+    expire after redis_config.user_profile_ttl seconds.
+    """
+
+    @staticmethod
+    def _key(user_id: str) -> str:
+        return f"user:{user_id}:profile"
+
+    @staticmethod
+    def get(user_id: str) -> Optional[UserOut]:
+        """Return the cached projection, if any"""
+        cached = get_cache().get(UserProfileCacheService._key(user_id))
+        if not isinstance(cached, dict):
+            return None
+        try:
+            return UserOut.model_validate(cached)
+        except ValueError as e:
+            logger.warning(f"Discarding unreadable cached profile for user {user_id}: {e}")
+            return None
+
+    @staticmethod
+    def set(user: User) -> UserOut:
+        """Cache and return the projection of a freshly loaded user"""
+        profile = UserOut.model_validate(user)
+        get_cache().set(
+            UserProfileCacheService._key(user.id),
+            profile.model_dump(mode="json", exclude={"pending_updates", "message"}),
+            expire=redis_config.user_profile_ttl,
+        )
+        return profile
+
+    @staticmethod
+    def invalidate(user_id: str) -> None:
+        """Drop the cached projection after the user changed"""
+        get_cache().delete(UserProfileCacheService._key(user_id))
@@ -0,0 +1,111 @@
+"""
+Latency benchmark for the authentication dependency.
+
+Times get_current_user() for a valid access token with a growing number
+of blacklisted tokens, comparing the previous blacklist check (a Redis
+EXISTS followed by a query on blacklisted_tokens for every request) with
+the warmed Bloom filter, which answers for tokens it has never
+seen without any I/O. The user lookup and JWT decode are included in both.
+
+Uses an in-memory SQLite database. Redis is whatever REDIS_* points at;
+without a reachable Redis the previous check skips it, which flatters the
+baseline.
+
+Run this module directly:
+    python -m app.benchmarks.auth_dependency_benchmark
+"""
+
+import statistics
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Callable, List
+
+from fastapi.security import HTTPAuthorizationCredentials
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import StaticPool
+
+# Import the dependency module first, as the app does, to avoid an import cycle
+from app.core.dependencies import get_current_user
+from app.apps.auth.models import BlacklistedToken
+from app.apps.auth.selectors import TokenSelector
+from app.apps.auth.services import JWTService
+from app.apps.auth.services.token_blacklist_service import get_blacklist_filter
+from app.apps.users.models import User, UserRole
+from app.apps.users.selectors import UserSelector
+from app.core.redis import get_cache
+from app.db import Base
+from app.utils.token_hash import token_digest
+
+
+BLACKLIST_SIZES = [0, 1_000, 10_000, 50_000]
+REQUESTS = 2000
+
+
+def legacy_get_current_user(credentials: HTTPAuthorizationCredentials, db: Session) -> User:
+    """Reference implementation checking Redis and the database on every request."""
+    token = credentials.credentials
+    if get_cache().exists(f"blacklist:{token_digest(token)}"):
+        raise RuntimeError("blacklisted")
+    if TokenSelector.is_blacklisted(db, token):
+        raise RuntimeError("blacklisted")
+    payload = JWTService.decode_access_token(token)
+    return UserSelector.get_by_id(db, payload["user_id"])
+
+
+def seed(db: Session, blacklisted: int) -> HTTPAuthorizationCredentials:
+    user = User(name="Bench User", email="bench@example.com", phone_number="989000000000", role=UserRole.user)
+    db.add(user)
+    db.commit()
+    expires_at = datetime.now(timezone.utc) + timedelta(days=7)
+    db.bulk_save_objects([
+        BlacklistedToken(user_id=user.id, token_hash=token_digest(f"bench-token-{n}"), expires_at=expires_at)
+        for n in range(blacklisted)
+    ])
+    db.commit()
+    token = JWTService.create_access_token({"user_id": user.id})
+    return HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+
+
+def measure(fn: Callable[[], object]) -> List[float]:
+    fn()
+    samples = []
+    for _ in range(REQUESTS):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1_000_000)
+    return sorted(samples)
+
+
+def run_benchmark():
+    print("\n" + "=" * 78)
+    print(f"get_current_user latency for a valid token ({REQUESTS} calls, microseconds)")
+    print("=" * 78)
+    print(f"{'blacklisted':>11} | {'previous p50':>12} {'p95':>8} | {'bloom p50':>10} {'p95':>8} | {'speedup':>7}")
+    print("-" * 78)
+
+    for size in BLACKLIST_SIZES:
+        engine = create_engine(
+            "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+        )
+        Base.metadata.create_all(engine)
+        db = sessionmaker(bind=engine)()
+        credentials = seed(db, size)
+
+        blacklist_filter = get_blacklist_filter()
+        blacklist_filter.warm(TokenSelector.iter_blacklisted_digests(db))
+
+        legacy = measure(lambda: legacy_get_current_user(credentials, db))
+        current = measure(lambda: get_current_user(credentials, db))
+        speedup = statistics.median(legacy) / statistics.median(current)
+        print(f"{size:>11} | {statistics.median(legacy):>12.1f} {legacy[int(0.95 * REQUESTS)]:>8.1f} | "
+              f"{statistics.median(current):>10.1f} {current[int(0.95 * REQUESTS)]:>8.1f} | {speedup:>6.1f}x")
+
+        db.close()
+        engine.dispose()
+
+    print("=" * 78)
+
+
+if __name__ == "__main__":
+    run_benchmark()
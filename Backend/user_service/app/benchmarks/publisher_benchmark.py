@@ -0,0 +1,90 @@
+"""
+Throughput benchmark for the RabbitMQ publisher.
+
+Compares publishing on a fresh BlockingConnection per message (what the
+producer did before, closed here so the run does not leak connections)
+with the shared confirm-mode RabbitMQPublisher, reporting messages per
+second as the number of publishing threads grows. Every message of the
+shared publisher is confirmed by the broker; the per-connection baseline
+publishes without confirms, so it is measured at its most favourable.
+
+Needs a reachable broker configured through the usual RABBITMQ_* settings.
+Messages go to a temporary queue through the default exchange and the
+queue is deleted afterwards.
+
+Run this module directly:
+    python -m app.benchmarks.publisher_benchmark
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable
+
+import pika
+
+from app.core.rabbitmq.connection import RabbitMQConnection
+from app.core.rabbitmq.publisher import RabbitMQPublisher
+
+
+THREADS = [1, 8, 32]
+MESSAGES = 2000
+LEGACY_MESSAGES = 200
+QUEUE = "user.benchmark.publisher.queue"
+BODY = b'{"identifier": "bench@example.com", "otp_code": "123456"}'
+PROPERTIES = pika.BasicProperties(delivery_mode=2, content_type="application/json")
+
+
+def publish_per_connection() -> bool:
+    """Open a connection, publish one message and close it."""
+    conn = RabbitMQConnection()
+    conn.connect()
+    try:
+        conn.channel.basic_publish(exchange="", routing_key=QUEUE, body=BODY, properties=PROPERTIES)
+        return True
+    finally:
+        conn.disconnect()
+
+
+def run(publish: Callable[[], bool], threads: int, messages: int) -> float:
+    """Publish `messages` messages from `threads` threads and return messages per second."""
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        results = list(pool.map(lambda _: publish(), range(messages)))
+    elapsed = time.perf_counter() - start
+    assert all(results), f"{results.count(False)} messages were not published"
+    return messages / elapsed
+
+
+def run_benchmark():
+    admin = RabbitMQConnection()
+    admin.connect()
+    admin.channel.queue_declare(queue=QUEUE, durable=True)
+
+    publisher = RabbitMQPublisher()
+
+    def publisher_publish() -> bool:
+        return publisher.publish_and_wait("", QUEUE, BODY, PROPERTIES)
+
+    # Open the connection before timing
+    publisher_publish()
+
+    try:
+        print("\n" + "=" * 64)
+        print(f"RabbitMQ publish throughput ({MESSAGES} confirmed messages per run)")
+        print("=" * 64)
+        print(f"{'threads':>7} | {'per-connection msg/s':>20} | {'shared publisher msg/s':>22}")
+        print("-" * 64)
+        for threads in THREADS:
+            legacy = run(publish_per_connection, threads, LEGACY_MESSAGES)
+            shared = run(publisher_publish, threads, MESSAGES)
+            print(f"{threads:>7} | {legacy:>20.1f} | {shared:>22.1f}")
+        print("=" * 64)
+        print(f"Publisher stats: {publisher.stats()}")
+    finally:
+        publisher.close()
+        admin.channel.queue_delete(queue=QUEUE)
+        admin.disconnect()
+
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,166 @@
+"""
+Redis round trips per authentication flow.
+
+Drives the auth and profile endpoints through a TestClient and counts the
+Redis round trips each request makes: every command sent on its own, every
+pipeline execution and every script call counts as one. PINGs are listed
+separately, since the connection no longer pings per call and should only
+show them when the pool health-checks an idle connection. Wall time per flow
+is reported alongside.
+
+Uses an in-memory SQLite database and a warmed, empty blacklist filter. Needs
+a reachable Redis configured through the usual REDIS_* settings; OTP messages
+are not sent.
+
+Run this module directly:
+    python -m app.benchmarks.redis_round_trips_benchmark
+"""
+
+import statistics
+import time
+from collections import Counter
+from typing import Callable, Dict, List, Tuple
+
+import redis
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+# Import the dependency module first, as the app does, to avoid an import cycle
+import app.core.dependencies  # noqa: F401
+from app.apps.auth.services import OTPService, PendingUpdateService
+from app.apps.auth.services.token_blacklist_service import get_blacklist_filter
+from app.core.redis import get_redis_connection
+from app.db import Base, get_db
+from app.main import app
+
+
+ITERATIONS = 50
+
+_commands: Counter = Counter()
+
+
+def _count_command(execute_command):
+    def wrapper(self, *args, **options):
+        _commands[args[0].upper() if isinstance(args[0], str) else args[0]] += 1
+        return execute_command(self, *args, **options)
+    return wrapper
+
+
+def _count_pipeline(execute):
+    def wrapper(self, *args, **kwargs):
+        _commands["PIPELINE"] += 1
+        return execute(self, *args, **kwargs)
+    return wrapper
+
+
+def instrument() -> None:
+    # Pipeline overrides execute_command to queue, so only sent commands count
+    redis.Redis.execute_command = _count_command(redis.Redis.execute_command)
+    redis.client.Pipeline.execute = _count_pipeline(redis.client.Pipeline.execute)
+
+
+def measure(step: Callable[[], None]) -> Tuple[Counter, float]:
+    _commands.clear()
+    start = time.perf_counter()
+    step()
+    elapsed = (time.perf_counter() - start) * 1000
+    return Counter(_commands), elapsed
+
+
+def run_benchmark():
+    if not get_redis_connection().is_connected():
+        print("Redis is not reachable; set REDIS_* to a running server")
+        return
+
+    instrument()
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(engine)
+    session_factory = sessionmaker(bind=engine)
+
+    def override_get_db():
+        db = session_factory()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app.dependency_overrides[get_db] = override_get_db
+    OTPService.send_otp_message = staticmethod(lambda *args, **kwargs: True)
+    get_blacklist_filter().warm([])
+    client = TestClient(app)
+
+    results: Dict[str, List[Tuple[Counter, float]]] = {}
+
+    def record(name: str, step: Callable[[], None], setup: Callable[[], None] = lambda: None):
+        setup()
+        results.setdefault(name, []).append(measure(step))
+
+    for n in range(ITERATIONS):
+        phone = f"98912{n:07d}"
+        state = {}
+
+        def request_login_otp():
+            state["otp"] = client.post("/auth/request-otp", json={"identifier": phone}).json()["otp_code"]
+
+        def verify_login_otp():
+            tokens = client.post("/auth/verify-otp", json={"identifier": phone, "otp_code": state["otp"]}).json()
+            state["headers"] = {"Authorization": f"Bearer {tokens['access_token']}"}
+            state["refresh"] = tokens["refresh_token"]
+
+        def read_profile():
+            client.get("/users/profile", headers=state["headers"])
+
+        def stage_email_update():
+            user_id = client.get("/users/profile", headers=state["headers"]).json()["id"]
+            PendingUpdateService.cache_pending_update(user_id, "email", f"bench{n}@example.com")
+
+        def request_update_otp():
+            state["otp"] = client.post(
+                "/auth/request-otp", json={"identifier": phone, "purpose": "update"}, headers=state["headers"]
+            ).json()["otp_code"]
+
+        def verify_update_otp():
+            client.post(
+                "/auth/verify-otp",
+                json={"identifier": phone, "otp_code": state["otp"], "purpose": "update"},
+                headers=state["headers"],
+            )
+
+        def refresh():
+            state["refresh"] = client.post("/auth/refresh", json={"refresh_token": state["refresh"]}).json()[
+                "refresh_token"
+            ]
+
+        def logout():
+            client.post("/auth/logout", json={"refresh_token": state["refresh"]})
+
+        record("request-otp (login)", request_login_otp)
+        record("verify-otp (login)", verify_login_otp)
+        record("GET /users/profile (cold)", read_profile)
+        record("GET /users/profile (cached)", read_profile)
+        record("request-otp (update)", request_update_otp, setup=stage_email_update)
+        record("verify-otp (update)", verify_update_otp)
+        record("refresh", refresh)
+        record("logout", logout)
+
+    app.dependency_overrides.pop(get_db, None)
+
+    print("\n" + "=" * 86)
+    print(f"Redis round trips per request ({ITERATIONS} iterations, medians)")
+    print("=" * 86)
+    print(f"{'flow':<28} | {'round trips':>11} {'pings':>6} | {'ms':>7} | commands")
+    print("-" * 86)
+    for name, samples in results.items():
+        commands, _ = samples[-1]
+        pings = commands.pop("PING", 0)
+        round_trips = statistics.median(sum(c.values()) - c.get("PING", 0) for c, _ in samples)
+        elapsed = statistics.median(ms for _, ms in samples)
+        summary = ", ".join(f"{command} x{count}" for command, count in sorted(commands.items()))
+        print(f"{name:<28} | {round_trips:>11.0f} {pings:>6} | {elapsed:>7.2f} | {summary}")
+    print("=" * 86)
+
+
+if __name__ == "__main__":
+    run_benchmark()
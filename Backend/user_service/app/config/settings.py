@@ -45,6 +45,14 @@ class RedisConfig(BaseSettings):
     max_connections: int = 20
     socket_timeout: int = 5
     socket_connect_timeout: int = 5
+    # Seconds a cached user profile projection lives without invalidation
+    user_profile_ttl: int = 300
+    # Seconds an idle pooled connection may sit before it is checked on reuse
+    health_check_interval: int = 30
+    # Seconds to wait before reconnecting after Redis becomes unreachable
+    retry_interval: float = 30
+    # Value encoding for RedisCache: json, orjson or msgpack
+    serializer: str = "json"
 
     @property
     def redis_url(self) -> str:
@@ -75,6 +83,22 @@ class RabbitMQConfig(BaseSettings):
     heartbeat: int = 600
     message_ttl: int = 300000
 
+    # Asyncio consumers (aio-pika) on the event loop instead of consumer threads
+    async_consumers: bool = False
+    prefetch_count: int = 10
+    consumer_concurrency: int = 10
+
+    # Batched user info RPC: consumer threads, each with its own connection
+    user_info_workers: int = 4
+    user_info_prefetch_count: int = 2
+    # Requests arriving within this window share one DB query (0 disables)
+    user_info_coalesce_window_ms: float = 5.0
+    # Seconds between queue depth reads on the first worker's connection
+    user_info_queue_depth_interval: float = 5.0
+
+    # Seconds a publish waits for the broker's confirm before reporting failure
+    publish_confirm_timeout: float = 5.0
+
     # Exchanges
     otp_exchange: str = "user.otp.exchange"
     user_lookup_exchange: str = "user.lookup.exchange"
@@ -84,6 +108,9 @@ class RabbitMQConfig(BaseSettings):
     user_info_exchange: str = "user_info_exchange"
     user_info_exchange_type: str = "direct"
 
+    # User events (profile changes) for other services' caches
+    user_events_exchange: str = "user.events.exchange"
+
     # Queues
     email_queue: str = "user.otp.email.queue"
     sms_queue: str = "user.otp.sms.queue"
@@ -99,6 +126,7 @@ class RabbitMQConfig(BaseSettings):
     user_lookup_request_key: str = "user.lookup.request"
     user_lookup_response_key: str = "user.lookup.response"
     user_info_request_routing_key: str = "user_info_request"
+    user_updated_routing_key: str = "user.updated"
 
     model_config = SettingsConfigDict(
         env_file=".env",
@@ -118,6 +146,17 @@ class JWTConfig(BaseSettings):
     algorithm: str = "HS256"
     access_token_expire_minutes: int = 60
     refresh_token_expire_days: int = 7
+    # Verified access token claims memoized in-process until expiry
+    claims_cache_size: int = 10000
+
+    # In-process Bloom filter of blacklisted token digests
+    blacklist_bloom_capacity: int = 1_000_000
+    blacklist_bloom_error_rate: float = 0.001
+    # Redis pub/sub channel announcing newly blacklisted digests
+    blacklist_channel: str = "auth:blacklist"
+    # Periodic deletion of expired blacklisted_tokens rows
+    blacklist_purge_interval_seconds: int = 3600
+    blacklist_purge_batch_size: int = 1000
 
     model_config = SettingsConfigDict(
         env_file=".env",
@@ -5,10 +5,11 @@ from sqlalchemy.orm import Session
 from typing import Optional
 from app.db import get_db
 from app.apps.auth.services import JWTService
-from app.apps.auth.selectors import TokenSelector
 from app.apps.auth.services import TokenBlacklistService
 from app.apps.users.selectors import UserSelector
 from app.apps.users.models import User
+from app.apps.users.schemas import UserOut
+from app.apps.users.services.profile_cache_service import UserProfileCacheService
 from app.core.errors import AuthError, UserError
 from app.utils.google_drive import GoogleDriveService
 from app.config.settings import google_drive_config
@@ -17,32 +18,51 @@ security = HTTPBearer()
 security_optional = HTTPBearer(auto_error=False)
 
 
+def _authenticated_user_id(token: str, db: Session) -> str:
+    """Return the user id of a valid, non-blacklisted access token"""
+    # Bloom filter first; Redis and the database only on a filter positive
+    if TokenBlacklistService.is_blacklisted(token, db):
+        raise HTTPException(status_code=401, detail=AuthError.TOKEN_BLACKLISTED)
+
+    # Decode token (memoized per token until it expires)
+    payload = JWTService.decode_access_token(token)
+    if not payload:
+        raise HTTPException(status_code=401, detail=AuthError.INVALID_TOKEN)
+
+    return payload["user_id"]
+
+
 def get_current_user(
     credentials: HTTPAuthorizationCredentials = Security(security),
     db: Session = Depends(get_db)
 ) -> User:
     """Get current authenticated user"""
-    token = credentials.credentials
+    user_id = _authenticated_user_id(credentials.credentials, db)
 
-    # Check Redis blacklist first (fast path)
-    if TokenBlacklistService.is_blacklisted(token):
-        raise HTTPException(status_code=401, detail=AuthError.TOKEN_BLACKLISTED)
+    # Get user
+    user = UserSelector.get_by_id(db, user_id)
+    if not user:
+        raise HTTPException(status_code=404, detail=UserError.NOT_FOUND)
 
-    # Check database blacklist as fallback
-    if TokenSelector.is_blacklisted(db, token):
-        raise HTTPException(status_code=401, detail=AuthError.TOKEN_BLACKLISTED)
+    return user
 
-    # Decode token
-    payload = JWTService.decode_access_token(token)
-    if not payload:
-        raise HTTPException(status_code=401, detail=AuthError.INVALID_TOKEN)
 
-    # Get user
-    user = UserSelector.get_by_id(db, payload["user_id"])
+def get_current_user_profile(
+    credentials: HTTPAuthorizationCredentials = Security(security),
+    db: Session = Depends(get_db)
+) -> UserOut:
+    """Get the cached profile projection of the current user, for read-only routes"""
+    user_id = _authenticated_user_id(credentials.credentials, db)
+
+    profile = UserProfileCacheService.get(user_id)
+    if profile is not None:
+        return profile
+
+    user = UserSelector.get_by_id(db, user_id)
     if not user:
         raise HTTPException(status_code=404, detail=UserError.NOT_FOUND)
 
-    return user
+    return UserProfileCacheService.set(user)
 
 
 def get_current_user_optional(
@@ -55,12 +75,8 @@ def get_current_user_optional(
 
     token = credentials.credentials
 
-    # Check Redis blacklist first (fast path)
-    if TokenBlacklistService.is_blacklisted(token):
-        return None
-
-    # Check database blacklist as fallback
-    if TokenSelector.is_blacklisted(db, token):
+    # Bloom filter first; Redis and the database only on a filter positive
+    if TokenBlacklistService.is_blacklisted(token, db):
         return None
 
     # Decode token
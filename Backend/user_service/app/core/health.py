@@ -2,8 +2,9 @@
 import logging
 from fastapi import APIRouter
 from app.db import check_db_connection
-from app.core.redis.connection import RedisConnection
+from app.core.redis.connection import get_redis_connection
 from app.core.rabbitmq.connection import RabbitMQConnection
+from app.core.rabbitmq import get_user_info_consumer_manager
 
 logger = logging.getLogger(__name__)
 
@@ -13,8 +14,7 @@ router = APIRouter(prefix="/health", tags=["Health"])
 def check_redis_connection() -> bool:
     """Check Redis connection health"""
     try:
-        conn = RedisConnection()
-        return conn.connect()
+        return get_redis_connection().is_connected()
     except Exception as e:
         logger.debug(f"Redis health check failed: {e}")
         return False
@@ -63,3 +63,9 @@ def health_check():
         }
     }
 
+
+
+@router.get("/consumers", operation_id="consumerMetricsApi", include_in_schema=False)
+def consumer_metrics():
+    """User info RPC worker metrics: request latency and request queue depth"""
+    return {"user_info": get_user_info_consumer_manager().stats()}
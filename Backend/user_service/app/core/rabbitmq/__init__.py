@@ -1,6 +1,7 @@
 """RabbitMQ module"""
 from .connection import get_rabbitmq_connection
 from .producer import get_rabbitmq_producer, RabbitMQProducer
+from .publisher import get_rabbitmq_publisher, close_rabbitmq_publisher, RabbitMQPublisher
 from .consumer import get_rabbitmq_consumer, create_user_lookup_callback
 from .setup import init_rabbitmq, setup_rabbitmq
 from app.tasks.user_lookup_consumer import (
@@ -20,6 +21,9 @@ __all__ = [
     "get_rabbitmq_connection",
     "get_rabbitmq_producer",
     "RabbitMQProducer",
+    "get_rabbitmq_publisher",
+    "close_rabbitmq_publisher",
+    "RabbitMQPublisher",
     "get_rabbitmq_consumer",
     "create_user_lookup_callback",
     "init_rabbitmq",
@@ -0,0 +1,169 @@
+"""
+Asyncio RabbitMQ consumers (aio-pika)
+
+Runs queue consumers on the application's event loop instead of one
+BlockingConnection thread per consumer. Handlers keep the interface of the
+pika callbacks in consumer.py: they take the decoded JSON body (and, with
+with_properties=True, the message, which exposes reply_to and
+correlation_id) and return True to ack or False to nack. Plain functions run
+in worker threads so blocking DB or publish calls do not stall the loop;
+coroutine functions are awaited directly.
+
+Up to prefetch_count unacked messages are delivered per channel and up to
+concurrency handlers run at once. connect_robust() reconnects on its own and
+restores QoS, queues and consumers; the first connection is retried every
+retry_delay seconds until the broker is reachable.
+
+Enabled with RABBITMQ_ASYNC_CONSUMERS=true.
+"""
+import asyncio
+import json
+import logging
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Set
+
+try:
+    import aio_pika
+except ImportError:  # pragma: no cover - optional dependency
+    aio_pika = None
+
+from app.config import rabbitmq_config
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class QueueHandler:
+    """A handler bound to a queue; an empty queue_name declares an exclusive server-named queue"""
+    queue_name: str
+    handler: Callable[..., Any]
+    requeue_on_failure: bool = True
+    with_properties: bool = False
+    exchange: Optional[str] = None
+    routing_key: Optional[str] = None
+    exchange_type: str = "topic"
+
+
+class AsyncRabbitMQConsumer:
+    """Consumes several queues on one robust connection with bounded concurrency"""
+
+    def __init__(self, prefetch_count: Optional[int] = None, concurrency: Optional[int] = None):
+        self.prefetch_count = prefetch_count or rabbitmq_config.prefetch_count
+        self.concurrency = concurrency or rabbitmq_config.consumer_concurrency
+        self.handlers: List[QueueHandler] = []
+        self.connection = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._tasks: Set[asyncio.Task] = set()
+        self._runner: Optional[asyncio.Task] = None
+        self.is_consuming = False
+
+    def add_handler(self, queue_name: str, handler: Callable[..., Any], **options) -> None:
+        """Register handler(data) -> bool for a queue before start()"""
+        self.handlers.append(QueueHandler(queue_name, handler, **options))
+
+    async def start(self) -> None:
+        """Connect and start consuming in the background"""
+        if aio_pika is None:
+            raise RuntimeError("aio-pika is required for RABBITMQ_ASYNC_CONSUMERS")
+        self._semaphore = asyncio.Semaphore(self.concurrency)
+        self._runner = asyncio.create_task(self._run())
+
+    async def _run(self) -> None:
+        while not self.is_consuming:
+            try:
+                await self._connect_and_consume()
+            except Exception as e:
+                logger.error(f"Failed to start async RabbitMQ consumer: {e}")
+                if self.connection is not None:
+                    await self.connection.close()
+                    self.connection = None
+                await asyncio.sleep(rabbitmq_config.retry_delay)
+
+    async def _connect_and_consume(self) -> None:
+        self.connection = await aio_pika.connect_robust(
+            host=rabbitmq_config.host,
+            port=rabbitmq_config.port,
+            login=rabbitmq_config.username,
+            password=rabbitmq_config.password,
+            virtualhost=rabbitmq_config.virtual_host,
+            heartbeat=rabbitmq_config.heartbeat,
+            reconnect_interval=rabbitmq_config.retry_delay,
+        )
+        channel = await self.connection.channel()
+        await channel.set_qos(prefetch_count=self.prefetch_count)
+        for queue_handler in self.handlers:
+            await self._consume(channel, queue_handler)
+        self.is_consuming = True
+        logger.info(
+            f"Async RabbitMQ consumer started (prefetch={self.prefetch_count}, "
+            f"concurrency={self.concurrency}, queues={len(self.handlers)})"
+        )
+
+    async def _consume(self, channel, queue_handler: QueueHandler) -> None:
+        if queue_handler.queue_name:
+            queue = await channel.declare_queue(
+                queue_handler.queue_name,
+                durable=True,
+                arguments={"x-message-ttl": rabbitmq_config.message_ttl},
+            )
+        else:
+            queue = await channel.declare_queue(exclusive=True, auto_delete=True)
+        if queue_handler.exchange:
+            exchange = await channel.declare_exchange(
+                queue_handler.exchange, queue_handler.exchange_type, durable=True
+            )
+            await queue.bind(exchange, routing_key=queue_handler.routing_key)
+
+        async def on_message(message) -> None:
+            # Dispatch without blocking delivery; prefetch and the semaphore bound the backlog
+            task = asyncio.create_task(self.dispatch(queue_handler, message))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+        await queue.consume(on_message, no_ack=False)
+        logger.info(f"Async consumer setup for queue: {queue.name}")
+
+    async def dispatch(self, queue_handler: QueueHandler, message) -> None:
+        """Run the handler for one message and ack or nack it"""
+        async with self._semaphore:
+            try:
+                data = json.loads(message.body.decode("utf-8"))
+            except json.JSONDecodeError as e:
+                logger.error(f"Failed to parse message JSON: {e}")
+                await message.reject(requeue=False)
+                return
+
+            args = (data, message) if queue_handler.with_properties else (data,)
+            try:
+                if asyncio.iscoroutinefunction(queue_handler.handler):
+                    success = await queue_handler.handler(*args)
+                else:
+                    success = await asyncio.to_thread(queue_handler.handler, *args)
+            except Exception as e:
+                logger.error(f"Error processing message from {queue_handler.queue_name}: {e}", exc_info=True)
+                success = False
+
+            if success:
+                await message.ack()
+            else:
+                await message.nack(requeue=queue_handler.requeue_on_failure)
+
+    async def stop(self) -> None:
+        """Stop consuming, let running handlers finish and close the connection"""
+        self.is_consuming = False
+        if self._runner and not self._runner.done():
+            self._runner.cancel()
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+        if self.connection is not None:
+            await self.connection.close()
+            self.connection = None
+        logger.info("Async RabbitMQ consumer stopped")
+
+    def is_healthy(self) -> bool:
+        """True while consuming on an open connection"""
+        return self.is_consuming and self.connection is not None and not self.connection.is_closed
+
+    def stats(self) -> Dict[str, int]:
+        """Messages being handled and the configured limits"""
+        return {"in_flight": len(self._tasks), "prefetch": self.prefetch_count, "concurrency": self.concurrency}
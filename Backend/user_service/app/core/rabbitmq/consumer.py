@@ -12,9 +12,10 @@ logger = logging.getLogger(__name__)
 class RabbitMQConsumer:
     """RabbitMQ consumer service"""
 
-    def __init__(self):
+    def __init__(self, prefetch_count: int = 1):
         self.connection: Optional[pika.BlockingConnection] = None
         self.channel: Optional[pika.channel.Channel] = None
+        self.prefetch_count = prefetch_count
 
     def connect(self) -> None:
         """Establish connection"""
@@ -24,7 +25,7 @@ class RabbitMQConsumer:
         self.connection = conn.connection
         self.channel = conn.channel
         if self.channel:
-            self.channel.basic_qos(prefetch_count=1)
+            self.channel.basic_qos(prefetch_count=self.prefetch_count)
         logger.info("RabbitMQ consumer connected")
 
     def setup_consumer(self, queue_name: str, callback: Callable) -> None:
@@ -99,7 +100,7 @@ def create_user_lookup_callback(handler: Callable) -> Callable:
     return callback
 
 
-def get_rabbitmq_consumer() -> RabbitMQConsumer:
+def get_rabbitmq_consumer(prefetch_count: int = 1) -> RabbitMQConsumer:
     """Create a new RabbitMQ consumer instance.
 
     Note:
@@ -116,5 +117,5 @@ def get_rabbitmq_consumer() -> RabbitMQConsumer:
         By giving each high-level consumer manager its own `RabbitMQConsumer`,
         we avoid cross-thread interference and re-entrancy issues in Pika.
     """
-    return RabbitMQConsumer()
+    return RabbitMQConsumer(prefetch_count=prefetch_count)
 
@@ -2,31 +2,31 @@
 import json
 import logging
 import pika
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterable, Optional
 from datetime import datetime
-from .connection import get_rabbitmq_connection
+from .publisher import get_rabbitmq_publisher
 from app.config import rabbitmq_config
 
 logger = logging.getLogger(__name__)
 
 
 class RabbitMQProducer:
-    """RabbitMQ producer service"""
+    """RabbitMQ producer service
+
+    Publishes through the shared confirm-mode publisher and reports success
+    only once the broker has confirmed the message.
+    """
 
     def publish_otp_message(self, identifier: str, otp_code: str, routing_key: str) -> bool:
         """Publish OTP message"""
         try:
-            conn = get_rabbitmq_connection()
-            if not conn.connection or conn.connection.is_closed:
-                conn.connect()
-
             message_data = {
                 "identifier": identifier,
                 "otp_code": otp_code,
                 "timestamp": datetime.utcnow().isoformat()
             }
 
-            conn.channel.basic_publish(
+            confirmed = get_rabbitmq_publisher().publish_and_wait(
                 exchange=rabbitmq_config.otp_exchange,
                 routing_key=routing_key,
                 body=json.dumps(message_data),
@@ -35,6 +35,9 @@ class RabbitMQProducer:
                     content_type='application/json'
                 )
             )
+            if not confirmed:
+                logger.error(f"OTP message to {routing_key} was not confirmed: {identifier}")
+                return False
             logger.info(f"Published OTP message to {routing_key}: {identifier}")
             return True
         except Exception as e:
@@ -44,10 +47,6 @@ class RabbitMQProducer:
     def publish_message(self, exchange: str, routing_key: str, message: Dict[str, Any], correlation_id: Optional[str] = None) -> bool:
         """Publish generic message"""
         try:
-            conn = get_rabbitmq_connection()
-            if not conn.connection or conn.connection.is_closed:
-                conn.connect()
-
             properties = pika.BasicProperties(
                 delivery_mode=2,
                 content_type='application/json'
@@ -55,18 +54,33 @@ class RabbitMQProducer:
             if correlation_id:
                 properties.correlation_id = correlation_id
 
-            conn.channel.basic_publish(
+            confirmed = get_rabbitmq_publisher().publish_and_wait(
                 exchange=exchange,
                 routing_key=routing_key,
                 body=json.dumps(message),
                 properties=properties
             )
+            if not confirmed:
+                logger.error(f"Message to {exchange} with key {routing_key} was not confirmed")
+                return False
             logger.info(f"Published message to {exchange} with key {routing_key}")
             return True
         except Exception as e:
             logger.error(f"Failed to publish message: {e}")
             return False
 
+    def publish_user_updated(self, user_id: str, fields: Iterable[str]) -> bool:
+        """Publish a user.updated event so other services drop cached user info"""
+        return self.publish_message(
+            exchange=rabbitmq_config.user_events_exchange,
+            routing_key=rabbitmq_config.user_updated_routing_key,
+            message={
+                "user_id": user_id,
+                "fields": sorted(fields),
+                "timestamp": datetime.utcnow().isoformat()
+            }
+        )
+
 
 # Global producer instance
 _rabbitmq_producer: Optional[RabbitMQProducer] = None
@@ -0,0 +1,271 @@
+"""RabbitMQ publisher with asynchronous publisher confirms
+
+Every publish used to open its own BlockingConnection, which was never
+closed. RabbitMQPublisher keeps one SelectConnection and one channel in
+confirm mode, driven by a background I/O thread. Any thread may publish:
+messages go onto a queue, the I/O thread writes everything queued in one
+pass and resolves each caller's Future when the broker acks or nacks it.
+The broker confirms many delivery tags with one multiple=True frame, so
+concurrent publishers share confirm round trips instead of waiting one
+after another.
+
+If the connection drops, unconfirmed and queued messages fail (callers get
+False and may retry) and the next publish reconnects, at most once every
+retry_delay seconds while the broker is unreachable.
+"""
+import logging
+import queue
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from typing import Any, Callable, Dict, NamedTuple, Optional
+
+import pika
+
+from app.config import rabbitmq_config
+
+logger = logging.getLogger(__name__)
+
+
+class _Outgoing(NamedTuple):
+    exchange: str
+    routing_key: str
+    body: bytes
+    properties: Any
+    future: Future
+
+
+def _create_connection(on_open, on_open_error, on_close) -> pika.SelectConnection:
+    credentials = pika.PlainCredentials(rabbitmq_config.username, rabbitmq_config.password)
+    parameters = pika.ConnectionParameters(
+        host=rabbitmq_config.host,
+        port=rabbitmq_config.port,
+        virtual_host=rabbitmq_config.virtual_host,
+        credentials=credentials,
+        heartbeat=rabbitmq_config.heartbeat,
+        connection_attempts=rabbitmq_config.connection_attempts,
+        retry_delay=rabbitmq_config.retry_delay,
+    )
+    return pika.SelectConnection(
+        parameters,
+        on_open_callback=on_open,
+        on_open_error_callback=on_open_error,
+        on_close_callback=on_close,
+    )
+
+
+class RabbitMQPublisher:
+    """Thread-safe publisher sharing one confirm-mode channel"""
+
+    def __init__(self, connection_factory: Optional[Callable[..., Any]] = None, confirm_timeout: Optional[float] = None):
+        self._connection_factory = connection_factory or _create_connection
+        self.confirm_timeout = confirm_timeout or rabbitmq_config.publish_confirm_timeout
+        self._outgoing: "queue.Queue[_Outgoing]" = queue.Queue()
+        # delivery tag -> Future, in publish order (touched by the I/O thread only)
+        self._unconfirmed: "OrderedDict[int, Future]" = OrderedDict()
+        self._delivery_tag = 0
+        self._connection = None
+        self._channel = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._closing = False
+        self._retry_at = 0.0
+        self._counters = {"published": 0, "acked": 0, "nacked": 0, "failed": 0}
+
+    # ----- caller side -----
+
+    def _ensure_started(self) -> bool:
+        """Start the I/O thread if it is not running; False while the broker is unreachable"""
+        with self._lock:
+            if self._thread and self._thread.is_alive():
+                return True
+            if time.monotonic() < self._retry_at:
+                return False
+
+            self._closing = False
+            try:
+                self._connection = self._connection_factory(
+                    self._on_connection_open,
+                    self._on_connection_open_error,
+                    self._on_connection_closed,
+                )
+            except Exception as e:
+                logger.error(f"Failed to create RabbitMQ publisher connection: {e}")
+                self._retry_at = time.monotonic() + rabbitmq_config.retry_delay
+                return False
+
+            self._thread = threading.Thread(target=self._run, daemon=True, name="RabbitMQ-Publisher")
+            self._thread.start()
+            return True
+
+    def publish(self, exchange: str, routing_key: str, body: bytes, properties: Any = None) -> Future:
+        """Queue a message; the Future resolves to True once the broker confirms it"""
+        future: Future = Future()
+        if not self._ensure_started():
+            future.set_result(False)
+            return future
+
+        self._outgoing.put(_Outgoing(exchange, routing_key, body, properties, future))
+        try:
+            self._connection.ioloop.add_callback_threadsafe(self._flush)
+        except Exception as e:
+            # The I/O thread is shutting down and fails whatever is queued
+            logger.debug("Publisher I/O loop unavailable: %s", e)
+        return future
+
+    def publish_and_wait(self, exchange: str, routing_key: str, body: bytes, properties: Any = None, timeout: Optional[float] = None) -> bool:
+        """Publish and block until the broker confirms the message; False on nack, failure or timeout"""
+        future = self.publish(exchange, routing_key, body, properties)
+        try:
+            return future.result(timeout=timeout or self.confirm_timeout)
+        except FutureTimeoutError:
+            # Not sent yet: cancelling keeps the I/O thread from publishing it late
+            future.cancel()
+            logger.warning(f"No publisher confirm for {exchange}/{routing_key} within {timeout or self.confirm_timeout}s")
+            return False
+
+    # ----- I/O thread -----
+
+    def _run(self) -> None:
+        connection = self._connection
+        try:
+            connection.ioloop.start()
+        except Exception as e:
+            logger.error(f"RabbitMQ publisher I/O loop failed: {e}")
+        finally:
+            self._channel = None
+            self._fail_all()
+
+    def _on_connection_open(self, connection) -> None:
+        connection.channel(on_open_callback=self._on_channel_open)
+
+    def _on_connection_open_error(self, connection, error) -> None:
+        logger.error(f"Failed to open RabbitMQ publisher connection: {error}")
+        self._retry_at = time.monotonic() + rabbitmq_config.retry_delay
+        connection.ioloop.stop()
+
+    def _on_connection_closed(self, connection, reason) -> None:
+        if not self._closing:
+            logger.error(f"RabbitMQ publisher connection lost: {reason}")
+        connection.ioloop.stop()
+
+    def _on_channel_open(self, channel) -> None:
+        channel.add_on_close_callback(self._on_channel_closed)
+        channel.confirm_delivery(self._on_delivery_confirmation)
+        self._delivery_tag = 0
+        self._channel = channel
+        logger.info("RabbitMQ publisher channel open in confirm mode")
+        self._flush()
+
+    def _on_channel_closed(self, channel, reason) -> None:
+        self._channel = None
+        if not self._closing:
+            logger.error(f"RabbitMQ publisher channel closed: {reason}")
+        if not self._connection.is_closed:
+            self._connection.close()
+
+    def _flush(self) -> None:
+        """Write every queued message to the channel"""
+        if self._channel is None:
+            return
+        while True:
+            try:
+                item = self._outgoing.get_nowait()
+            except queue.Empty:
+                return
+            if not item.future.set_running_or_notify_cancel():
+                # The caller gave up waiting
+                continue
+            try:
+                self._channel.basic_publish(
+                    exchange=item.exchange,
+                    routing_key=item.routing_key,
+                    body=item.body,
+                    properties=item.properties,
+                )
+            except Exception as e:
+                logger.error(f"Failed to publish to {item.exchange}/{item.routing_key}: {e}")
+                self._counters["failed"] += 1
+                item.future.set_result(False)
+                continue
+            self._delivery_tag += 1
+            self._unconfirmed[self._delivery_tag] = item.future
+            self._counters["published"] += 1
+
+    def _on_delivery_confirmation(self, method_frame) -> None:
+        method = method_frame.method
+        acked = method.NAME.split(".")[1].lower() == "ack"
+        if method.multiple:
+            tags = [tag for tag in self._unconfirmed if tag <= method.delivery_tag]
+        else:
+            tags = [method.delivery_tag] if method.delivery_tag in self._unconfirmed else []
+        for tag in tags:
+            self._unconfirmed.pop(tag).set_result(acked)
+        self._counters["acked" if acked else "nacked"] += len(tags)
+        if not acked:
+            logger.warning(f"Broker nacked {len(tags)} message(s) up to delivery tag {method.delivery_tag}")
+
+    def _fail_all(self) -> None:
+        """Fail unconfirmed and queued messages after the connection is gone"""
+        unconfirmed, self._unconfirmed = self._unconfirmed, OrderedDict()
+        for future in unconfirmed.values():
+            future.set_result(False)
+        failed = len(unconfirmed)
+        while True:
+            try:
+                item = self._outgoing.get_nowait()
+            except queue.Empty:
+                break
+            if item.future.set_running_or_notify_cancel():
+                item.future.set_result(False)
+                failed += 1
+        self._counters["failed"] += failed
+
+    # ----- lifecycle -----
+
+    def stats(self) -> Dict[str, int]:
+        """Message counters since startup plus the current backlog"""
+        stats = dict(self._counters)
+        stats["queued"] = self._outgoing.qsize()
+        stats["unconfirmed"] = len(self._unconfirmed)
+        return stats
+
+    def close(self) -> None:
+        """Close the connection and stop the I/O thread"""
+        with self._lock:
+            self._closing = True
+            connection, thread = self._connection, self._thread
+            if connection is not None and thread and thread.is_alive():
+                try:
+                    connection.ioloop.add_callback_threadsafe(connection.close)
+                except Exception:
+                    # Best-effort cleanup
+                    pass
+            self._thread = None
+        if thread and thread.is_alive() and thread is not threading.current_thread():
+            thread.join(timeout=5)
+
+
+# Global publisher instance
+_rabbitmq_publisher: Optional[RabbitMQPublisher] = None
+_rabbitmq_publisher_lock = threading.Lock()
+
+
+def get_rabbitmq_publisher() -> RabbitMQPublisher:
+    """Get the shared publisher, creating it on first use"""
+    global _rabbitmq_publisher
+    if _rabbitmq_publisher is None:
+        with _rabbitmq_publisher_lock:
+            if _rabbitmq_publisher is None:
+                _rabbitmq_publisher = RabbitMQPublisher()
+    return _rabbitmq_publisher
+
+
+def close_rabbitmq_publisher() -> None:
+    """Close the shared publisher, if one was created"""
+    global _rabbitmq_publisher
+    with _rabbitmq_publisher_lock:
+        if _rabbitmq_publisher is not None:
+            _rabbitmq_publisher.close()
+            _rabbitmq_publisher = None
@@ -37,6 +37,13 @@ def setup_rabbitmq() -> None:
             durable=True,
             auto_delete=False
         )
+        # Topic exchange for user events; subscribers bind their own queues
+        channel.exchange_declare(
+            exchange=rabbitmq_config.user_events_exchange,
+            exchange_type=rabbitmq_config.exchange_type,
+            durable=True,
+            auto_delete=False
+        )
 
         # Declare queues
         queues = [
@@ -1,6 +1,6 @@
 """Redis module"""
 from .cache import get_cache, RedisCache
 from .connection import get_redis_connection, get_redis_client
+from .serializers import get_serializer
 
-__all__ = ["get_cache", "RedisCache", "get_redis_connection", "get_redis_client"]
-
+__all__ = ["get_cache", "RedisCache", "get_redis_connection", "get_redis_client", "get_serializer"]
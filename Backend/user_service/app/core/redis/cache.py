@@ -1,66 +1,173 @@
 """Redis cache service"""
-import json
 import logging
-from typing import Any, Optional
-from .connection import get_redis_client
+from contextlib import contextmanager
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional
+import redis
+from app.config import redis_config
+from .connection import get_redis_connection
+from .serializers import get_serializer
 
 logger = logging.getLogger(__name__)
 
 
 class RedisCache:
-    """Redis cache service"""
+    """Redis cache service
 
-    def __init__(self):
-        self.client = get_redis_client()
+    Values go through the serializer named by redis_config.serializer.
+    Batch reads use MGET and batch writes a pipeline, so each costs one
+    round trip however many keys it touches.
+    """
+
+    def __init__(self, serializer=None):
+        self.serializer = serializer or get_serializer(redis_config.serializer)
+        self._connection = get_redis_connection()
+        # Binary serializers need replies as raw bytes
+        self._value_connection = get_redis_connection(binary=self.serializer.binary)
+        self._scripts: Dict[str, Any] = {}
+
+    @property
+    def client(self) -> Optional[redis.Redis]:
+        return self._connection.get_client()
+
+    @property
+    def value_client(self) -> Optional[redis.Redis]:
+        return self._value_connection.get_client()
+
+    def _failed(self, action: str, error: Exception) -> None:
+        logger.error(f"Error {action}: {error}")
+        if isinstance(error, (redis.ConnectionError, redis.TimeoutError)):
+            self._connection.mark_failed(error)
+            if self._value_connection is not self._connection:
+                self._value_connection.mark_failed(error)
 
     def get(self, key: str) -> Optional[Any]:
         """Get value from cache"""
         try:
-            if not self.client:
+            client = self.value_client
+            if not client:
                 return None
-            value = self.client.get(key)
+            value = client.get(key)
             if value is None:
                 return None
-            try:
-                return json.loads(value)
-            except (json.JSONDecodeError, TypeError):
-                return value
+            return self.serializer.loads(value)
         except Exception as e:
-            logger.error(f"Error getting cache key '{key}': {e}")
+            self._failed(f"getting cache key '{key}'", e)
             return None
 
+    def get_many(self, keys: Iterable[str]) -> Dict[str, Any]:
+        """Get several values with one MGET; missing keys are left out"""
+        keys = list(keys)
+        try:
+            client = self.value_client
+            if not client or not keys:
+                return {}
+            return {
+                key: self.serializer.loads(value)
+                for key, value in zip(keys, client.mget(keys))
+                if value is not None
+            }
+        except Exception as e:
+            self._failed(f"getting {len(keys)} cache keys", e)
+            return {}
+
     def set(self, key: str, value: Any, expire: Optional[int] = None) -> bool:
         """Set value in cache"""
         try:
-            if not self.client:
+            client = self.value_client
+            if not client:
                 return False
-            if not isinstance(value, str):
-                value = json.dumps(value)
-            return self.client.set(key, value, ex=expire) is True
+            return client.set(key, self.serializer.dumps(value), ex=expire) is True
         except Exception as e:
-            logger.error(f"Error setting cache key '{key}': {e}")
+            self._failed(f"setting cache key '{key}'", e)
             return False
 
+    def set_many(self, values: Mapping[str, Any], expire: Optional[int] = None) -> bool:
+        """Set several values in one pipelined round trip"""
+        try:
+            client = self.value_client
+            if not client or not values:
+                return False
+            pipe = client.pipeline(transaction=False)
+            for key, value in values.items():
+                pipe.set(key, self.serializer.dumps(value), ex=expire)
+            return all(result is True for result in pipe.execute())
+        except Exception as e:
+            self._failed(f"setting {len(values)} cache keys", e)
+            return False
+
+    @contextmanager
+    def pipeline(self, transaction: bool = False) -> Iterator[Optional[redis.client.Pipeline]]:
+        """Queue raw Redis commands and send them in one round trip on exit
+
+        Yields None while Redis is unavailable. Values are passed to Redis
+        unserialized, so this is meant for deletes, expiries and plain
+        string markers. Unlike the other methods a failed execute is raised,
+        after it was logged, so callers can tell the commands did not run.
+        """
+        client = self.client
+        if not client:
+            yield None
+            return
+        pipe = client.pipeline(transaction=transaction)
+        yield pipe
+        try:
+            pipe.execute()
+        except Exception as e:
+            self._failed("executing pipeline", e)
+            raise
+
     def delete(self, key: str) -> bool:
         """Delete key from cache"""
         try:
-            if not self.client:
+            client = self.client
+            if not client:
                 return False
-            return self.client.delete(key) > 0
+            return client.delete(key) > 0
         except Exception as e:
-            logger.error(f"Error deleting cache key '{key}': {e}")
+            self._failed(f"deleting cache key '{key}'", e)
             return False
 
     def exists(self, key: str) -> bool:
         """Check if key exists"""
         try:
-            if not self.client:
+            client = self.client
+            if not client:
+                return False
+            return client.exists(key) > 0
+        except Exception as e:
+            self._failed(f"checking cache key '{key}'", e)
+            return False
+
+    def publish(self, channel: str, message: str) -> bool:
+        """Publish a message to a pub/sub channel"""
+        try:
+            client = self.client
+            if not client:
                 return False
-            return self.client.exists(key) > 0
+            client.publish(channel, message)
+            return True
         except Exception as e:
-            logger.error(f"Error checking cache key '{key}': {e}")
+            self._failed(f"publishing to channel '{channel}'", e)
             return False
 
+    def run_script(self, script: str, keys: List[str], args: List[Any]) -> Any:
+        """Run a Lua script atomically on the server
+
+        Scripts are registered once and then called by SHA (EVALSHA),
+        so only the keys and arguments travel on each call.
+        """
+        try:
+            client = self.client
+            if not client:
+                return None
+            registered = self._scripts.get(script)
+            if registered is None:
+                registered = self._scripts[script] = client.register_script(script)
+            return registered(keys=keys, args=args, client=client)
+        except Exception as e:
+            self._failed(f"running script on keys {keys}", e)
+            return None
+
 
 # Global cache instance
 _cache_instance: Optional[RedisCache] = None
@@ -72,4 +179,3 @@ def get_cache() -> RedisCache:
     if _cache_instance is None:
         _cache_instance = RedisCache()
     return _cache_instance
-
@@ -1,5 +1,7 @@
 """Redis connection management"""
 import logging
+import threading
+import time
 from typing import Optional
 import redis
 from app.config import redis_config
@@ -8,15 +10,25 @@ logger = logging.getLogger(__name__)
 
 
 class RedisConnection:
-    """Redis connection manager"""
+    """Redis connection manager
 
-    def __init__(self):
+    The client is created and pinged once, then reused without further
+    pings: its connection pool checks idle connections itself every
+    redis_config.health_check_interval seconds before handing them out.
+    When Redis cannot be reached, callers get None and no new connection is
+    attempted for redis_config.retry_interval seconds.
+    """
+
+    def __init__(self, decode_responses: bool = True):
+        self.decode_responses = decode_responses
         self.client: Optional[redis.Redis] = None
+        self._retry_at = 0.0
+        self._lock = threading.Lock()
 
     def connect(self) -> bool:
         """Establish Redis connection"""
         try:
-            self.client = redis.Redis(
+            client = redis.Redis(
                 host=redis_config.host,
                 port=redis_config.port,
                 password=redis_config.password,
@@ -24,47 +36,59 @@ class RedisConnection:
                 max_connections=redis_config.max_connections,
                 socket_timeout=redis_config.socket_timeout,
                 socket_connect_timeout=redis_config.socket_connect_timeout,
-                decode_responses=True
+                health_check_interval=redis_config.health_check_interval,
+                retry_on_timeout=True,
+                decode_responses=self.decode_responses
             )
-            self.client.ping()
+            client.ping()
+            self.client = client
             logger.info(f"Connected to Redis at {redis_config.host}:{redis_config.port}")
             return True
         except Exception as e:
             logger.error(f"Failed to connect to Redis: {e}")
+            self._retry_at = time.monotonic() + redis_config.retry_interval
             return False
 
     def is_connected(self) -> bool:
-        """Check if connection is active"""
-        if self.client is None:
+        """Check if connection is active (one explicit PING, for health checks)"""
+        client = self.get_client()
+        if client is None:
             return False
         try:
-            self.client.ping()
+            client.ping()
             return True
         except Exception:
             return False
 
     def get_client(self) -> Optional[redis.Redis]:
-        """Get Redis client"""
-        if not self.is_connected():
-            if not self.connect():
-                return None
+        """Get Redis client, or None while Redis is unreachable"""
+        if self.client is not None:
+            return self.client
+        if time.monotonic() < self._retry_at:
+            return None
+        with self._lock:
+            if self.client is None and time.monotonic() >= self._retry_at:
+                self.connect()
         return self.client
 
+    def mark_failed(self, error: Exception) -> None:
+        """Drop the client after a connection failure and back off before reconnecting"""
+        logger.warning(f"Redis connection failed, retrying in {redis_config.retry_interval}s: {error}")
+        with self._lock:
+            self.client = None
+            self._retry_at = time.monotonic() + redis_config.retry_interval
 
-# Global connection instance
-_redis_connection: Optional[RedisConnection] = None
 
+# Global connection instances (text replies, and raw bytes for binary serializers)
+_redis_connection = RedisConnection()
+_binary_redis_connection = RedisConnection(decode_responses=False)
 
-def get_redis_connection() -> RedisConnection:
-    """Get or create Redis connection"""
-    global _redis_connection
-    if _redis_connection is None or not _redis_connection.is_connected():
-        _redis_connection = RedisConnection()
-        _redis_connection.connect()
-    return _redis_connection
 
+def get_redis_connection(binary: bool = False) -> RedisConnection:
+    """Get the shared Redis connection"""
+    return _binary_redis_connection if binary else _redis_connection
 
-def get_redis_client() -> Optional[redis.Redis]:
-    """Get Redis client directly"""
-    return get_redis_connection().get_client()
 
+def get_redis_client(binary: bool = False) -> Optional[redis.Redis]:
+    """Get Redis client directly"""
+    return get_redis_connection(binary).get_client()
@@ -0,0 +1,84 @@
+"""Value serializers for RedisCache
+
+The JSON serializers store strings as-is, so plain markers such as the
+blacklist's "blacklisted" stay readable by redis-cli and other services.
+Values that cannot be decoded are returned raw.
+"""
+import json
+from typing import Any, Dict, Type
+
+
+class JSONSerializer:
+    """Standard library JSON"""
+
+    binary = False
+
+    def dumps(self, value: Any) -> str:
+        return value if isinstance(value, str) else json.dumps(value)
+
+    def loads(self, raw: Any) -> Any:
+        try:
+            return json.loads(raw)
+        except (json.JSONDecodeError, TypeError):
+            return raw
+
+
+class OrjsonSerializer:
+    """orjson, a faster JSON codec producing the same format"""
+
+    binary = False
+
+    def __init__(self):
+        import orjson
+        self._orjson = orjson
+
+    def dumps(self, value: Any) -> str:
+        return value if isinstance(value, str) else self._orjson.dumps(value).decode("utf-8")
+
+    def loads(self, raw: Any) -> Any:
+        try:
+            return self._orjson.loads(raw)
+        except (self._orjson.JSONDecodeError, TypeError):
+            return raw
+
+
+class MsgpackSerializer:
+    """MessagePack; smaller values, read through a binary Redis connection"""
+
+    binary = True
+
+    def __init__(self):
+        import msgpack
+        self._msgpack = msgpack
+
+    def dumps(self, value: Any) -> bytes:
+        return self._msgpack.packb(value, use_bin_type=True)
+
+    def loads(self, raw: bytes) -> Any:
+        try:
+            return self._msgpack.unpackb(raw, raw=False)
+        except (ValueError, TypeError, self._msgpack.UnpackException):
+            return raw.decode("utf-8", errors="replace")
+
+
+SERIALIZERS: Dict[str, Type] = {
+    "json": JSONSerializer,
+    "orjson": OrjsonSerializer,
+    "msgpack": MsgpackSerializer,
+}
+
+
+def get_serializer(name: str):
+    """Create the serializer configured by name
+
+    orjson and msgpack are optional packages; selecting one that is not
+    installed fails at startup rather than on the first cache call.
+    """
+    try:
+        serializer_class = SERIALIZERS[name.lower()]
+    except KeyError:
+        raise ValueError(f"Unknown Redis serializer '{name}', expected one of {', '.join(SERIALIZERS)}")
+    try:
+        return serializer_class()
+    except ImportError as e:
+        raise RuntimeError(f"Redis serializer '{name}' needs the '{e.name}' package installed") from e
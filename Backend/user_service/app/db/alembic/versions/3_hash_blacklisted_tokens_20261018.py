@@ -0,0 +1,104 @@
+"""hash_blacklisted_tokens
+
+Revision ID: 3
+Revises: 2
+Create Date: 2026-10-18 09:12:40.318204
+
+"""
+import hashlib
+from datetime import datetime, timedelta, timezone
+from typing import Sequence, Union
+
+from alembic import op
+import jwt
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3'
+down_revision: Union[str, Sequence[str], None] = '2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Lifetime assumed for stored tokens whose exp claim cannot be read
+FALLBACK_LIFETIME = timedelta(days=7)
+BATCH_SIZE = 1000
+
+blacklisted_tokens = sa.table(
+    'blacklisted_tokens',
+    sa.column('id', sa.String()),
+    sa.column('token', sa.String()),
+    sa.column('token_hash', sa.String()),
+    sa.column('expires_at', sa.DateTime(timezone=True)),
+    sa.column('blacklisted_at', sa.DateTime(timezone=True)),
+)
+
+
+def _expires_at(token: str, blacklisted_at: datetime) -> datetime:
+    try:
+        exp = jwt.decode(token, options={"verify_signature": False, "verify_exp": False})["exp"]
+        return datetime.fromtimestamp(exp, tz=timezone.utc)
+    except (jwt.InvalidTokenError, KeyError, TypeError, ValueError):
+        if blacklisted_at.tzinfo is None:
+            blacklisted_at = blacklisted_at.replace(tzinfo=timezone.utc)
+        return blacklisted_at + FALLBACK_LIFETIME
+
+
+def _backfill() -> None:
+    """Hash stored tokens in batches, dropping duplicate rows for the same token"""
+    bind = op.get_bind()
+    seen = set()
+    last_id = ''
+    while True:
+        rows = bind.execute(
+            sa.select(blacklisted_tokens.c.id, blacklisted_tokens.c.token, blacklisted_tokens.c.blacklisted_at)
+            .where(blacklisted_tokens.c.id > last_id)
+            .order_by(blacklisted_tokens.c.id)
+            .limit(BATCH_SIZE)
+        ).all()
+        if not rows:
+            return
+        duplicates = []
+        for row_id, token, blacklisted_at in rows:
+            digest = hashlib.sha256(token.encode("utf-8")).hexdigest()
+            if digest in seen:
+                duplicates.append(row_id)
+                continue
+            seen.add(digest)
+            bind.execute(
+                blacklisted_tokens.update()
+                .where(blacklisted_tokens.c.id == row_id)
+                .values(token_hash=digest, expires_at=_expires_at(token, blacklisted_at))
+            )
+        if duplicates:
+            bind.execute(blacklisted_tokens.delete().where(blacklisted_tokens.c.id.in_(duplicates)))
+        last_id = rows[-1][0]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('blacklisted_tokens', sa.Column('token_hash', sa.String(length=64), nullable=True))
+    op.add_column('blacklisted_tokens', sa.Column('expires_at', sa.DateTime(timezone=True), nullable=True))
+
+    _backfill()
+
+    op.alter_column('blacklisted_tokens', 'token_hash', nullable=False)
+    op.alter_column('blacklisted_tokens', 'expires_at', nullable=False)
+    op.drop_index(op.f('ix_blacklisted_tokens_token'), table_name='blacklisted_tokens')
+    op.drop_column('blacklisted_tokens', 'token')
+    op.create_index(op.f('ix_blacklisted_tokens_token_hash'), 'blacklisted_tokens', ['token_hash'], unique=True)
+    op.create_index(op.f('ix_blacklisted_tokens_expires_at'), 'blacklisted_tokens', ['expires_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema.
+
+    Digests cannot be turned back into tokens, so existing rows are dropped.
+    """
+    op.drop_index(op.f('ix_blacklisted_tokens_expires_at'), table_name='blacklisted_tokens')
+    op.drop_index(op.f('ix_blacklisted_tokens_token_hash'), table_name='blacklisted_tokens')
+    op.execute(blacklisted_tokens.delete())
+    op.add_column('blacklisted_tokens', sa.Column('token', sa.String(), nullable=False))
+    op.drop_column('blacklisted_tokens', 'expires_at')
+    op.drop_column('blacklisted_tokens', 'token_hash')
+    op.create_index(op.f('ix_blacklisted_tokens_token'), 'blacklisted_tokens', ['token'], unique=False)
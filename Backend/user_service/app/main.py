@@ -13,18 +13,22 @@ from app.apps.auth.api import router as auth_router
 from app.core.health import router as health_router
 from app.core.rabbitmq import (
     init_rabbitmq,
+    close_rabbitmq_publisher,
     start_user_lookup_consumer,
     stop_user_lookup_consumer,
     start_user_info_consumer,
     stop_user_info_consumer,
 )
 from app.core.redis.init import init_redis
+from app.apps.auth.services.token_blacklist_service import start_blacklist_subscriber, stop_blacklist_subscriber
+from app.tasks.blacklist_purge import start_blacklist_purge, stop_blacklist_purge
+from app.tasks.async_consumers import start_async_consumers, stop_async_consumers
 from app.core.exceptions import (
     http_exception_handler,
     validation_exception_handler,
     general_exception_handler,
 )
-from app.config import app_config
+from app.config import app_config, rabbitmq_config
 
 
 @asynccontextmanager
@@ -33,14 +37,25 @@ async def lifespan(app_instance: FastAPI):
     # Startup
     init_rabbitmq()
     init_redis()
-    start_user_lookup_consumer()
-    start_user_info_consumer()
+    start_blacklist_subscriber()
+    start_blacklist_purge()
+    if rabbitmq_config.async_consumers:
+        await start_async_consumers()
+    else:
+        start_user_lookup_consumer()
+        start_user_info_consumer()
     
     yield
     
     # Shutdown
-    stop_user_lookup_consumer()
-    stop_user_info_consumer()
+    if rabbitmq_config.async_consumers:
+        await stop_async_consumers()
+    else:
+        stop_user_lookup_consumer()
+        stop_user_info_consumer()
+    close_rabbitmq_publisher()
+    stop_blacklist_subscriber()
+    stop_blacklist_purge()
 
 
 app = FastAPI(
@@ -0,0 +1,43 @@
+"""Asyncio consumers for the user lookup and user info queues"""
+import logging
+from typing import Optional
+
+from app.config import rabbitmq_config
+from app.core.rabbitmq.aio_consumer import AsyncRabbitMQConsumer
+from app.tasks.user_info_consumer import get_user_info_consumer_manager
+from app.tasks.user_lookup_consumer import get_user_lookup_consumer_manager
+
+logger = logging.getLogger(__name__)
+
+# Used instead of the consumer threads when RABBITMQ_ASYNC_CONSUMERS is set
+_async_consumer: Optional[AsyncRabbitMQConsumer] = None
+
+
+def get_async_consumer() -> Optional[AsyncRabbitMQConsumer]:
+    """Return the running asyncio consumer, if any"""
+    return _async_consumer
+
+
+async def start_async_consumers() -> None:
+    """Consume user lookup and user info requests on the event loop"""
+    global _async_consumer
+    _async_consumer = AsyncRabbitMQConsumer()
+    _async_consumer.add_handler(
+        rabbitmq_config.user_lookup_request_queue,
+        get_user_lookup_consumer_manager()._handle,
+    )
+    _async_consumer.add_handler(
+        rabbitmq_config.user_info_request_queue,
+        get_user_info_consumer_manager()._handle,
+        with_properties=True,
+    )
+    await _async_consumer.start()
+    logger.info("🚀 Async user consumers started")
+
+
+async def stop_async_consumers() -> None:
+    """Stop the asyncio consumer, if it was started"""
+    global _async_consumer
+    if _async_consumer is not None:
+        await _async_consumer.stop()
+        _async_consumer = None
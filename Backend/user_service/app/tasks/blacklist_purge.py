@@ -0,0 +1,66 @@
+"""Periodic purge of expired blacklisted tokens"""
+import logging
+import threading
+from typing import Optional
+
+from app.apps.auth.selectors import TokenSelector
+from app.config import jwt_config
+from app.db import SessionLocal
+
+logger = logging.getLogger(__name__)
+
+
+class BlacklistPurgeJob:
+    """Deletes expired blacklisted_tokens rows on a fixed interval"""
+
+    def __init__(self, interval: Optional[float] = None, batch_size: Optional[int] = None):
+        self.interval = interval if interval is not None else jwt_config.blacklist_purge_interval_seconds
+        self.batch_size = batch_size or jwt_config.blacklist_purge_batch_size
+        self.thread: Optional[threading.Thread] = None
+        self.running = False
+        self._stopped = threading.Event()
+
+    def start(self):
+        """Start purging in a background thread"""
+        if self.running:
+            return
+        self.running = True
+        self._stopped.clear()
+        self.thread = threading.Thread(target=self._run, daemon=True, name="BlacklistPurgeJob")
+        self.thread.start()
+
+    def stop(self):
+        """Stop purging"""
+        self.running = False
+        self._stopped.set()
+        if self.thread and self.thread.is_alive():
+            self.thread.join(timeout=5)
+
+    def run_once(self) -> int:
+        """Purge expired rows now and return how many were deleted"""
+        with SessionLocal() as db:
+            purged = TokenSelector.purge_expired(db, self.batch_size)
+        if purged:
+            logger.info(f"Purged {purged} expired blacklisted tokens")
+        return purged
+
+    def _run(self):
+        while self.running:
+            try:
+                self.run_once()
+            except Exception as e:
+                logger.error(f"Blacklisted token purge failed: {e}")
+            self._stopped.wait(self.interval)
+
+
+_purge_job = BlacklistPurgeJob()
+
+
+def start_blacklist_purge():
+    """Start the blacklisted token purge job"""
+    _purge_job.start()
+
+
+def stop_blacklist_purge():
+    """Stop the blacklisted token purge job"""
+    _purge_job.stop()
@@ -2,7 +2,9 @@
 import json
 import logging
 import threading
-from typing import Optional, List, Dict, Any
+import time
+from collections import deque
+from typing import Optional, List, Dict, Any, Set
 from datetime import datetime
 
 from app.core.rabbitmq.consumer import RabbitMQConsumer
@@ -16,9 +18,142 @@ from app.apps.users.models.user import User
 logger = logging.getLogger(__name__)
 
 
+class ConsumerMetrics:
+    """Thread-safe request counters and latency percentiles over recent requests"""
+
+    def __init__(self, window: int = 1000) -> None:
+        self._lock = threading.Lock()
+        self._latencies: deque = deque(maxlen=window)
+        self.processed = 0
+        self.failed = 0
+        self.in_flight = 0
+        self.max_latency_ms = 0.0
+
+    def started(self) -> None:
+        with self._lock:
+            self.in_flight += 1
+
+    def finished(self, latency_ms: float, success: bool) -> None:
+        with self._lock:
+            self.in_flight -= 1
+            self._latencies.append(latency_ms)
+            self.max_latency_ms = max(self.max_latency_ms, latency_ms)
+            if success:
+                self.processed += 1
+            else:
+                self.failed += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            latencies = sorted(self._latencies)
+            stats: Dict[str, Any] = {
+                "processed": self.processed,
+                "failed": self.failed,
+                "in_flight": self.in_flight,
+                "max_latency_ms": round(self.max_latency_ms, 2),
+            }
+
+        def percentile(p: float) -> Optional[float]:
+            if not latencies:
+                return None
+            return round(latencies[min(len(latencies) - 1, int(p * len(latencies)))], 2)
+
+        stats["p50_latency_ms"] = percentile(0.50)
+        stats["p95_latency_ms"] = percentile(0.95)
+        return stats
+
+
+def load_user_infos(user_ids: Set[str]) -> Dict[str, Dict[str, Any]]:
+    """Load the public user info fields for user_ids with one query."""
+    users: Dict[str, Dict[str, Any]] = {}
+    if not user_ids:
+        return users
+    with SessionLocal() as db:
+        for user in db.query(User).filter(User.id.in_(list(user_ids))).all():
+            users[user.id] = {
+                "user_id": user.id,
+                "name": user.name,
+                "avatar_url": user.avatar_url,
+                "card_number": user.card_number,
+                "card_holder_name": user.card_holder_name,
+                "created_at": user.created_at.isoformat()
+                if user.created_at
+                else None,
+            }
+    return users
+
+
+class _PendingLoad:
+    def __init__(self) -> None:
+        self.user_ids: Set[str] = set()
+        self.done = threading.Event()
+        self.users: Dict[str, Dict[str, Any]] = {}
+        self.error: Optional[Exception] = None
+
+
+class UserInfoLoader:
+    """Merges user info lookups arriving within a short window into one query.
+
+    The first request to arrive opens a batch and waits window_ms for
+    others (from any worker thread) to add their ids; it then runs a single
+    IN query for the union and every request takes its own users from the
+    result. A window of 0 queries immediately without merging.
+    """
+
+    def __init__(self, window_ms: Optional[float] = None, load=load_user_infos) -> None:
+        self.window = (rabbitmq_config.user_info_coalesce_window_ms if window_ms is None else window_ms) / 1000
+        self._load = load
+        self._lock = threading.Lock()
+        self._pending: Optional[_PendingLoad] = None
+        self.queries = 0
+        self.requests = 0
+
+    def load(self, user_ids: Set[str]) -> Dict[str, Dict[str, Any]]:
+        """Return user info by id for the users in user_ids that exist."""
+        if self.window <= 0:
+            with self._lock:
+                self.queries += 1
+                self.requests += 1
+            return self._load(user_ids)
+
+        with self._lock:
+            self.requests += 1
+            batch = self._pending
+            leader = batch is None
+            if leader:
+                batch = self._pending = _PendingLoad()
+            batch.user_ids.update(user_ids)
+
+        if leader:
+            time.sleep(self.window)
+            with self._lock:
+                # Later requests start a new batch
+                self._pending = None
+                self.queries += 1
+            try:
+                batch.users = self._load(batch.user_ids)
+            except Exception as e:
+                batch.error = e
+            finally:
+                batch.done.set()
+        else:
+            batch.done.wait()
+
+        if batch.error is not None:
+            raise batch.error
+        return {uid: batch.users[uid] for uid in user_ids if uid in batch.users}
+
+
 class UserInfoConsumer:
     """Consumer that handles batched user info lookup requests.
 
+    Runs rabbitmq_config.user_info_workers threads, each consuming the
+    request queue on its own connection with user_info_prefetch_count
+    unacked messages, and each request opens its own DB session, so a burst
+    of group page loads is served in parallel instead of one at a time.
+    Requests handled within user_info_coalesce_window_ms of each other share
+    one DB query (see UserInfoLoader).
+
     Expected message body:
         {
             "request_id": str,
@@ -27,39 +162,69 @@ class UserInfoConsumer:
         }
     """
 
-    def __init__(self) -> None:
-        self.consumer: RabbitMQConsumer = get_rabbitmq_consumer()
-        self.thread: Optional[threading.Thread] = None
+    def __init__(self, workers: Optional[int] = None, prefetch_count: Optional[int] = None) -> None:
+        self.workers = max(1, workers or rabbitmq_config.user_info_workers)
+        self.prefetch_count = prefetch_count or rabbitmq_config.user_info_prefetch_count
+        self.consumers: List[RabbitMQConsumer] = []
+        self.threads: List[threading.Thread] = []
         self.running: bool = False
+        self._stopped = threading.Event()
+        self.metrics = ConsumerMetrics()
+        self.loader = UserInfoLoader()
+        self._queue_depth: Optional[int] = None
+        self._queue_depth_at = 0.0
 
     def start(self) -> None:
-        """Start the consumer in a background thread."""
+        """Start the consumer workers in background threads."""
         if self.running:
             logger.warning("User info consumer is already running")
             return
 
         self.running = True
-        self.thread = threading.Thread(
-            target=self._run, daemon=True, name="UserInfoConsumer"
+        self._stopped.clear()
+        self.consumers = [
+            get_rabbitmq_consumer(prefetch_count=self.prefetch_count)
+            for _ in range(self.workers)
+        ]
+        self.threads = [
+            threading.Thread(
+                target=self._run, args=(consumer,), daemon=True, name=f"UserInfoConsumer-{index}"
+            )
+            for index, consumer in enumerate(self.consumers)
+        ]
+        for thread in self.threads:
+            thread.start()
+        logger.info(
+            f"🚀 User info consumer started (workers={self.workers}, prefetch={self.prefetch_count})"
         )
-        self.thread.start()
-        logger.info("🚀 User info consumer started")
 
     def stop(self) -> None:
-        """Stop the consumer and join the thread."""
+        """Stop the consumer workers and join their threads."""
         if not self.running:
             logger.warning("User info consumer is not running")
             return
 
         self.running = False
-        self.consumer.stop_consuming()
-        if self.thread and self.thread.is_alive():
-            self.thread.join(timeout=5)
-        self.consumer.disconnect()
+        self._stopped.set()
+        for consumer, thread in zip(self.consumers, self.threads):
+            # BlockingConnection is bound to its thread; ask it to stop from there
+            if consumer.connection and not consumer.connection.is_closed:
+                try:
+                    consumer.connection.add_callback_threadsafe(consumer.stop_consuming)
+                except Exception as e:
+                    logger.debug(f"Could not signal user info worker {thread.name}: {e}")
+        for thread in self.threads:
+            if thread.is_alive():
+                thread.join(timeout=5)
+        for consumer in self.consumers:
+            try:
+                consumer.disconnect()
+            except Exception as e:
+                logger.debug(f"Error disconnecting user info worker: {e}")
         logger.info("🛑 User info consumer stopped")
 
-    def _run(self) -> None:
-        """Run the consumer loop."""
+    def _run(self, consumer: RabbitMQConsumer) -> None:
+        """Run one worker's consumer loop."""
         try:
             def callback(ch, method, properties, body):
                 try:
@@ -83,26 +248,75 @@ class UserInfoConsumer:
                     # Requeue to allow transient issues to be retried
                     ch.basic_nack(delivery_tag=method.delivery_tag, requeue=True)
 
-            self.consumer.setup_consumer(
-                rabbitmq_config.user_info_request_queue, callback
-            )
-
             while self.running:
                 try:
-                    self.consumer.start_consuming()
+                    if not consumer.connection or consumer.connection.is_closed:
+                        consumer.setup_consumer(
+                            rabbitmq_config.user_info_request_queue, callback
+                        )
+                        if consumer is self.consumers[0]:
+                            self._refresh_queue_depth(consumer)
+                    consumer.start_consuming()
                 except Exception as e:
                     if self.running:
                         logger.error(f"User info consumer error: {e}", exc_info=True)
-                        import time
-
-                        time.sleep(5)
+                        self._stopped.wait(5)
         except Exception as e:
             logger.error(f"Fatal error in user info consumer: {e}", exc_info=True)
-        finally:
-            self.running = False
+
+    def _refresh_queue_depth(self, consumer: RabbitMQConsumer) -> None:
+        """Read the queue depth on a worker's own channel and schedule the next read.
+
+        Runs on the worker's thread (pika's call_later fires while it is
+        consuming), so health checks never open a connection of their own.
+        """
+        try:
+            result = consumer.channel.queue_declare(
+                queue=rabbitmq_config.user_info_request_queue, passive=True
+            )
+            self._queue_depth = result.method.message_count
+            self._queue_depth_at = time.monotonic()
+        except Exception as e:
+            logger.debug(f"Could not read user info queue depth: {e}")
+        if self.running and consumer.connection and not consumer.connection.is_closed:
+            consumer.connection.call_later(
+                rabbitmq_config.user_info_queue_depth_interval,
+                lambda: self._refresh_queue_depth(consumer),
+            )
+
+    def queue_depth(self) -> Optional[int]:
+        """Last read depth of the request queue, or None if it is unknown or stale."""
+        max_age = 3 * rabbitmq_config.user_info_queue_depth_interval
+        if time.monotonic() - self._queue_depth_at > max_age:
+            return None
+        return self._queue_depth
+
+    def stats(self) -> Dict[str, Any]:
+        """Worker configuration, request metrics and current queue depth."""
+        stats = self.metrics.snapshot()
+        stats.update(
+            workers=self.workers,
+            alive_workers=sum(1 for thread in self.threads if thread.is_alive()),
+            prefetch=self.prefetch_count,
+            lookups=self.loader.requests,
+            lookup_queries=self.loader.queries,
+            queue_depth=self.queue_depth(),
+        )
+        return stats
 
     def _handle(self, data: Dict[str, Any], properties) -> bool:
-        """Handle a single batched user info request."""
+        """Handle a single batched user info request, recording its latency."""
+        self.metrics.started()
+        started = time.perf_counter()
+        success = False
+        try:
+            success = self._process(data, properties)
+            return success
+        finally:
+            self.metrics.finished((time.perf_counter() - started) * 1000, success)
+
+    def _process(self, data: Dict[str, Any], properties) -> bool:
+        """Look up the requested users and publish the reply."""
         request_id = data.get("request_id") or ""
         group_id = data.get("group_id") or ""
         user_ids: List[str] = data.get("user_ids") or []
@@ -134,28 +348,8 @@ class UserInfoConsumer:
 
         try:
             if user_ids:
-                with SessionLocal() as db:
-                    # Deduplicate user_ids for efficiency
-                    unique_user_ids = list({uid for uid in user_ids if uid})
-                    if unique_user_ids:
-                        query = (
-                            db.query(User)
-                            .filter(User.id.in_(unique_user_ids))
-                            .all()
-                        )
-                        for user in query:
-                            users_out.append(
-                                {
-                                    "user_id": user.id,
-                                    "name": user.name,
-                                    "avatar_url": user.avatar_url,
-                                    "card_number": user.card_number,
-                                    "card_holder_name": user.card_holder_name,
-                                    "created_at": user.created_at.isoformat()
-                                    if user.created_at
-                                    else None,
-                                }
-                            )
+                found = self.loader.load({uid for uid in user_ids if uid})
+                users_out = list(found.values())
         except Exception as db_error:
             logger.error(
                 f"Database error during batched user info lookup for request_id={request_id}: "
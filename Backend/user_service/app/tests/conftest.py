@@ -1,5 +1,6 @@
 import os
-from typing import Callable, Dict, List
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterable, List, Mapping
 
 import pytest
 from fastapi.testclient import TestClient
@@ -14,6 +15,7 @@ os.environ.setdefault("REFRESH_SECRET_KEY", "test-refresh-secret")
 
 from app.db import Base, get_db  # noqa: E402  pylint: disable=wrong-import-position
 from app.main import app  # noqa: E402  pylint: disable=wrong-import-position
+from app.apps.auth.services import otp_service  # noqa: E402  pylint: disable=wrong-import-position
 
 
 TEST_DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./test.db")
@@ -30,10 +32,22 @@ class FakeCache:
 
     def __init__(self):
         self.store: Dict[str, object] = {}
+        self.published: List[tuple] = []
 
     def get(self, key: str):
         return self.store.get(key)
 
+    def get_many(self, keys: Iterable[str]) -> Dict[str, object]:
+        return {key: self.store[key] for key in keys if key in self.store}
+
+    def set_many(self, values: Mapping[str, object], expire: int | None = None) -> bool:
+        self.store.update(values)
+        return True
+
+    @contextmanager
+    def pipeline(self, transaction: bool = False):
+        yield FakePipeline(self)
+
     def set(self, key: str, value, expire: int | None = None) -> bool:
         self.store[key] = value
         return True
@@ -44,6 +58,56 @@ class FakeCache:
     def exists(self, key: str) -> bool:
         return key in self.store
 
+    def publish(self, channel: str, message: str) -> bool:
+        self.published.append((channel, message))
+        return True
+
+    def run_script(self, script: str, keys: List[str], args: List[object]):
+        return FAKE_SCRIPTS[script](self.store, keys, args)
+
+
+class FakePipeline:
+    """Applies queued commands to the FakeCache immediately."""
+
+    def __init__(self, cache: FakeCache):
+        self.cache = cache
+
+    def set(self, key: str, value, ex: int | None = None):
+        self.cache.set(key, value, expire=ex)
+
+    def delete(self, key: str):
+        self.cache.delete(key)
+
+    def publish(self, channel: str, message: str):
+        self.cache.publish(channel, message)
+
+
+def _fake_create_otp(store: Dict[str, object], keys: List[str], args: List[object]):
+    code, purpose, field, _ttl = args
+    store[keys[0]] = {"code": code, "purpose": purpose, "field": field, "attempts": 0}
+    return 1
+
+
+def _fake_verify_otp(store: Dict[str, object], keys: List[str], args: List[object]):
+    code, purpose, max_attempts = args
+    otp = store.get(keys[0])
+    if not isinstance(otp, dict) or otp.get("purpose") != purpose:
+        return [0, otp.get("field", "") if isinstance(otp, dict) else ""]
+    if otp["code"] == code:
+        del store[keys[0]]
+        return [1, otp["field"]]
+    otp["attempts"] += 1
+    if otp["attempts"] >= max_attempts:
+        del store[keys[0]]
+    return [0, otp["field"]]
+
+
+# Python equivalents of the Lua scripts, run by FakeCache.run_script
+FAKE_SCRIPTS: Dict[str, Callable] = {
+    otp_service.CREATE_OTP_SCRIPT: _fake_create_otp,
+    otp_service.VERIFY_OTP_SCRIPT: _fake_verify_otp,
+}
+
 
 class FakeProducer:
     """Stub for RabbitMQ producer interactions."""
@@ -51,6 +115,7 @@ class FakeProducer:
     def __init__(self):
         self.otp_messages: List[Dict[str, object]] = []
         self.messages: List[Dict[str, object]] = []
+        self.user_updates: List[Dict[str, object]] = []
 
     def publish_otp_message(self, identifier: str, otp_code: str, routing_key: str) -> bool:
         self.otp_messages.append(
@@ -69,6 +134,10 @@ class FakeProducer:
         )
         return True
 
+    def publish_user_updated(self, user_id: str, fields) -> bool:
+        self.user_updates.append({"user_id": user_id, "fields": sorted(fields)})
+        return True
+
 
 @pytest.fixture(scope="session", autouse=True)
 def prepare_database():
@@ -105,6 +174,9 @@ def fake_cache(monkeypatch: pytest.MonkeyPatch) -> FakeCache:
     monkeypatch.setattr(
         "app.apps.auth.services.token_blacklist_service.get_cache", lambda: cache
     )
+    monkeypatch.setattr(
+        "app.apps.users.services.profile_cache_service.get_cache", lambda: cache
+    )
     return cache
 
 
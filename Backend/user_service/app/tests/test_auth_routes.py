@@ -1,10 +1,10 @@
-from datetime import datetime
-
 import pytest
 
 from app.apps.auth.models import BlacklistedToken
 from app.apps.auth.services import JWTService
 from app.apps.users.models import User, UserRole
+from app.core.errors import AuthError, UserError
+from app.utils.token_hash import token_digest
 
 
 def test_request_otp_creates_user_and_sends_message(
@@ -43,11 +43,7 @@ def test_verify_otp_returns_tokens(client, db_session, fake_cache):
 
     fake_cache.set(
         f"otp:{user.id}",
-        {
-            "code": "12345",
-            "created_at": datetime.utcnow().isoformat(),
-            "is_used": False,
-        },
+        {"code": "12345", "purpose": "auth", "field": "", "attempts": 0},
     )
 
     response = client.post(
@@ -75,11 +71,7 @@ def test_verify_otp_rejects_invalid_code(client, db_session, fake_cache):
 
     fake_cache.set(
         f"otp:{user.id}",
-        {
-            "code": "99999",
-            "created_at": datetime.utcnow().isoformat(),
-            "is_used": False,
-        },
+        {"code": "99999", "purpose": "auth", "field": "", "attempts": 0},
     )
 
     response = client.post(
@@ -88,7 +80,7 @@ def test_verify_otp_rejects_invalid_code(client, db_session, fake_cache):
     )
 
     assert response.status_code == 400
-    assert response.json()["detail"] == "Invalid or expired OTP"
+    assert response.json()["error"] == {"code": "BAD_REQUEST", "message": UserError.INVALID_OTP}
 
 
 def test_refresh_token_returns_new_tokens(client, db_session):
@@ -123,12 +115,41 @@ def test_refresh_token_rejects_blacklisted(client, db_session, fake_cache):
     db_session.refresh(user)
 
     refresh_token = JWTService.create_refresh_token({"user_id": user.id})
-    fake_cache.set(f"blacklist:{refresh_token}", "blacklisted")
+    fake_cache.set(f"blacklist:{token_digest(refresh_token)}", "blacklisted")
 
     response = client.post("/auth/refresh", json={"refresh_token": refresh_token})
 
     assert response.status_code == 401
-    assert response.json()["detail"] == "Token blacklisted"
+    assert response.json()["error"] == {"code": "UNAUTHORIZED", "message": AuthError.TOKEN_BLACKLISTED}
+
+
+def test_refresh_token_checks_database_despite_filter(client, db_session, fake_cache):
+    from datetime import datetime, timedelta, timezone
+
+    from app.apps.auth.selectors import TokenSelector
+    from app.apps.auth.services.token_blacklist_service import get_blacklist_filter
+
+    user = User(
+        name="Missed",
+        email="missed@example.com",
+        phone_number="983333333334",
+        role=UserRole.user,
+    )
+    db_session.add(user)
+    db_session.commit()
+    db_session.refresh(user)
+
+    # Revoked by another process whose publish never reached this one
+    refresh_token = JWTService.create_refresh_token({"user_id": user.id})
+    TokenSelector.blacklist(db_session, user.id, refresh_token, datetime.now(timezone.utc) + timedelta(days=1))
+    blacklist_filter = get_blacklist_filter()
+    blacklist_filter.warm([])
+    try:
+        response = client.post("/auth/refresh", json={"refresh_token": refresh_token})
+    finally:
+        blacklist_filter.ready = False
+
+    assert response.status_code == 401
 
 
 def test_logout_blacklists_refresh_token(client, db_session, fake_cache):
@@ -147,10 +168,10 @@ def test_logout_blacklists_refresh_token(client, db_session, fake_cache):
 
     assert response.status_code == 200
     assert response.json()["msg"] == "Logged out successfully"
-    assert fake_cache.exists(f"blacklist:{refresh_token}")
+    assert fake_cache.exists(f"blacklist:{token_digest(refresh_token)}")
     assert (
         db_session.query(BlacklistedToken)
-        .filter_by(token=refresh_token, user_id=user.id)
+        .filter_by(token_hash=token_digest(refresh_token), user_id=user.id)
         .first()
         is not None
     )
@@ -16,3 +16,22 @@ def test_health_endpoint_returns_status(client, monkeypatch: pytest.MonkeyPatch)
     assert payload["services"]["redis"]["connected"] is False
     assert payload["services"]["rabbitmq"]["connected"] is False
 
+
+
+def test_consumer_metrics_endpoint(client, monkeypatch: pytest.MonkeyPatch):
+    """Consumer metrics should report latency percentiles and queue depth."""
+    from app.core.rabbitmq import get_user_info_consumer_manager
+
+    manager = get_user_info_consumer_manager()
+    monkeypatch.setattr(manager, "queue_depth", lambda: 7)
+    manager.metrics.started()
+    manager.metrics.finished(12.5, True)
+
+    response = client.get("/health/consumers")
+
+    assert response.status_code == 200
+    stats = response.json()["user_info"]
+    assert stats["queue_depth"] == 7
+    assert stats["processed"] >= 1
+    assert stats["p95_latency_ms"] is not None
+    assert stats["workers"] >= 1
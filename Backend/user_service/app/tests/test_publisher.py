@@ -0,0 +1,147 @@
+"""
+Tests for the shared confirm-mode RabbitMQ publisher.
+"""
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+import pika
+
+from app.core.rabbitmq.publisher import RabbitMQPublisher
+
+
+class FakeIOLoop:
+    def __init__(self):
+        self.callbacks = queue.Queue()
+        self.stopped = False
+
+    def add_callback_threadsafe(self, callback):
+        if self.stopped:
+            raise RuntimeError("ioloop stopped")
+        self.callbacks.put(callback)
+
+    def start(self):
+        while not self.stopped:
+            self.callbacks.get()()
+
+    def stop(self):
+        self.stopped = True
+
+
+class FakeChannel:
+    def __init__(self, connection):
+        self.connection = connection
+        self.on_confirm = None
+        self.published = []
+        self.confirmed_tag = 0
+        self.confirm_scheduled = False
+
+    def add_on_close_callback(self, callback):
+        pass
+
+    def confirm_delivery(self, callback):
+        self.on_confirm = callback
+
+    def basic_publish(self, exchange, routing_key, body, properties):
+        assert threading.current_thread().name == "RabbitMQ-Publisher", "publish must run on the I/O thread"
+        self.published.append(routing_key)
+        if self.connection.confirm and not self.confirm_scheduled:
+            self.confirm_scheduled = True
+            self.connection.ioloop.add_callback_threadsafe(self._confirm)
+
+    def _confirm(self):
+        # Confirm everything published so far with one multiple=True frame
+        self.confirm_scheduled = False
+        tag = len(self.published)
+        method = pika.spec.Basic.Nack if self.connection.nack else pika.spec.Basic.Ack
+        self.on_confirm(SimpleNamespace(method=method(delivery_tag=tag, multiple=True)))
+        self.connection.confirm_frames += 1
+
+
+class FakeConnection:
+    """SelectConnection stand-in whose ioloop runs on the publisher thread"""
+
+    def __init__(self, on_open, on_open_error, on_close, confirm=True, nack=False):
+        self.on_close = on_close
+        self.confirm = confirm
+        self.nack = nack
+        self.confirm_frames = 0
+        self.is_closed = False
+        self.ioloop = FakeIOLoop()
+        self.channel_ = FakeChannel(self)
+        self.ioloop.add_callback_threadsafe(lambda: on_open(self))
+
+    def channel(self, on_open_callback):
+        self.ioloop.add_callback_threadsafe(lambda: on_open_callback(self.channel_))
+
+    def close(self):
+        self.is_closed = True
+        self.on_close(self, "closed")
+
+
+def test_concurrent_publishes_share_one_connection():
+    connections = []
+
+    def factory(*callbacks):
+        connections.append(FakeConnection(*callbacks))
+        return connections[-1]
+
+    publisher = RabbitMQPublisher(connection_factory=factory, confirm_timeout=5)
+    try:
+        with ThreadPoolExecutor(max_workers=16) as pool:
+            results = list(pool.map(
+                lambda n: publisher.publish_and_wait("exchange", f"key.{n}", b"{}"), range(400)
+            ))
+    finally:
+        publisher.close()
+
+    assert all(results)
+    assert len(connections) == 1
+    assert len(connections[0].channel_.published) == 400
+    # Confirms arrive in batches rather than one frame per message
+    assert connections[0].confirm_frames < 400
+    assert publisher.stats()["acked"] == 400
+    assert publisher.stats()["unconfirmed"] == 0
+
+
+def test_nacked_message_reports_failure():
+    publisher = RabbitMQPublisher(
+        connection_factory=lambda *callbacks: FakeConnection(*callbacks, nack=True), confirm_timeout=2
+    )
+    try:
+        assert publisher.publish_and_wait("exchange", "key", b"{}") is False
+        assert publisher.stats()["nacked"] == 1
+    finally:
+        publisher.close()
+
+
+def test_reconnects_after_connection_loss():
+    connections = []
+
+    def factory(*callbacks):
+        # The first connection never confirms
+        connections.append(FakeConnection(*callbacks, confirm=bool(connections)))
+        return connections[-1]
+
+    publisher = RabbitMQPublisher(connection_factory=factory, confirm_timeout=2)
+    try:
+        future = publisher.publish("exchange", "key", b"{}")
+        first = connections[0]
+        first.ioloop.add_callback_threadsafe(first.close)
+        assert future.result(timeout=2) is False
+
+        publisher._thread.join(timeout=2)
+        assert publisher.publish_and_wait("exchange", "key", b"{}") is True
+    finally:
+        publisher.close()
+
+    assert len(connections) == 2
+
+
+def test_unreachable_broker_returns_false():
+    def factory(*callbacks):
+        raise ConnectionError("refused")
+
+    publisher = RabbitMQPublisher(connection_factory=factory)
+    assert publisher.publish_and_wait("exchange", "key", b"{}") is False
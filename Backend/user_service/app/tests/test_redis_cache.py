@@ -0,0 +1,64 @@
+import pytest
+
+from app.core.redis import cache as cache_module
+from app.core.redis.cache import RedisCache
+from app.core.redis.serializers import JSONSerializer, OrjsonSerializer, get_serializer
+
+
+class StubPipeline:
+    def __init__(self, client):
+        self.client = client
+        self.commands = []
+
+    def set(self, key, value, ex=None):
+        self.commands.append((key, value))
+
+    def execute(self):
+        self.client.round_trips += 1
+        self.client.data.update(self.commands)
+        return [True] * len(self.commands)
+
+
+class StubClient:
+    """Counts round trips of the Redis commands RedisCache batches."""
+
+    def __init__(self):
+        self.data = {}
+        self.round_trips = 0
+
+    def mget(self, keys):
+        self.round_trips += 1
+        return [self.data.get(key) for key in keys]
+
+    def pipeline(self, transaction=False):
+        return StubPipeline(self)
+
+
+class StubConnection:
+    def __init__(self, client):
+        self.client = client
+
+    def get_client(self):
+        return self.client
+
+
+@pytest.fixture
+def stub_client(monkeypatch):
+    client = StubClient()
+    monkeypatch.setattr(cache_module, "get_redis_connection", lambda binary=False: StubConnection(client))
+    return client
+
+
+@pytest.mark.parametrize("serializer_class", [JSONSerializer, OrjsonSerializer])
+def test_batch_operations_take_one_round_trip(stub_client, serializer_class):
+    cache = RedisCache(serializer=serializer_class())
+
+    assert cache.set_many({"a": {"n": 1}, "b": [1, 2], "c": "plain"}, expire=60) is True
+    assert cache.get_many(["a", "b", "c", "missing"]) == {"a": {"n": 1}, "b": [1, 2], "c": "plain"}
+    assert stub_client.round_trips == 2
+
+
+def test_get_serializer_validates_name():
+    assert isinstance(get_serializer("JSON"), JSONSerializer)
+    with pytest.raises(ValueError):
+        get_serializer("pickle")
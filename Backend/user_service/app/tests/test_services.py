@@ -1,14 +1,16 @@
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 
 import jwt
 import pytest
 from fastapi import HTTPException
 
+from app.apps.auth.models import BlacklistedToken
+from app.apps.auth.selectors import TokenSelector
 from app.apps.auth.services import JWTService, OTPService, TokenBlacklistService
 from app.apps.users.models import User, UserRole
 from app.apps.users.schemas import UserUpdate
 from app.apps.users.selectors import UserSelector
-from app.apps.users.services import UserService
+from app.apps.users.services import UserService, UserProfileCacheService
 from app.config import jwt_config
 
 
@@ -16,20 +18,24 @@ def test_otp_service_create_and_validate(fake_cache):
     otp = OTPService.create_otp("user-1")
     assert otp["code"] == fake_cache.get("otp:user-1")["code"]
 
-    is_valid = OTPService.validate_otp("user-1", otp["code"])
-    assert is_valid is True
+    assert OTPService.validate_otp("user-1", otp["code"]) == (True, None)
     assert fake_cache.get("otp:user-1") is None
+    # A code can only be redeemed once
+    assert OTPService.validate_otp("user-1", otp["code"]) == (False, None)
 
 
-def test_otp_service_rejects_expired(fake_cache):
-    expired = {
-        "code": "54321",
-        "created_at": (datetime.utcnow() - timedelta(minutes=11)).isoformat(),
-        "is_used": False,
-    }
-    fake_cache.set("otp:user-2", expired)
+def test_otp_service_limits_attempts(fake_cache):
+    from app.apps.auth.services.otp_service import OTP_MAX_ATTEMPTS
 
-    assert OTPService.validate_otp("user-2", "54321") is False
+    otp = OTPService.create_otp("user-2", purpose="update", field="email")
+    wrong = "00000" if otp["code"] != "00000" else "11111"
+
+    for _ in range(OTP_MAX_ATTEMPTS):
+        assert OTPService.validate_otp("user-2", wrong, purpose="update") == (False, "email")
+
+    # The OTP is gone once the attempts are used up, even for the right code
+    assert OTPService.validate_otp("user-2", otp["code"], purpose="update") == (False, None)
+    assert fake_cache.get("otp:update:user-2") is None
 
 
 def test_jwt_service_encodes_and_decodes():
@@ -39,6 +45,20 @@ def test_jwt_service_encodes_and_decodes():
     assert decoded["user_id"] == "abc"
 
 
+def test_jwt_service_issues_unique_jti_and_memoizes_claims(monkeypatch):
+    JWTService.clear_claims_cache()
+    first = JWTService.create_access_token({"user_id": "abc"})
+    second = JWTService.create_access_token({"user_id": "abc"})
+    assert first != second
+    assert JWTService.decode_access_token(first)["jti"] != JWTService.decode_access_token(second)["jti"]
+
+    def fail_decode(*args, **kwargs):
+        raise AssertionError("cached claims should skip verification")
+
+    monkeypatch.setattr(jwt, "decode", fail_decode)
+    assert JWTService.decode_access_token(first)["user_id"] == "abc"
+
+
 def test_jwt_service_returns_none_on_invalid_token():
     expired_token = jwt.encode(
         {"user_id": "abc", "exp": datetime.utcnow() - timedelta(minutes=1)},
@@ -55,6 +75,117 @@ def test_token_blacklist_service_marks_and_checks(fake_cache):
     assert TokenBlacklistService.is_blacklisted(token) is True
 
 
+def test_blacklist_filter_skips_database_on_negative(fake_cache):
+    from app.apps.auth.services.token_blacklist_service import get_blacklist_filter, token_digest
+
+    class ExplodingSession:
+        def query(self, *args, **kwargs):
+            raise AssertionError("database queried for a token the filter has never seen")
+
+    blacklist_filter = get_blacklist_filter()
+    blacklist_filter.warm([])
+    try:
+        revoked = JWTService.create_refresh_token({"user_id": "revoked"})
+        TokenBlacklistService.blacklist_token(revoked, expires_in=5)
+
+        fresh = JWTService.create_access_token({"user_id": "fresh"})
+        assert TokenBlacklistService.is_blacklisted(fresh, ExplodingSession()) is False
+        assert TokenBlacklistService.is_blacklisted(revoked, ExplodingSession()) is True
+        assert fake_cache.published == [(jwt_config.blacklist_channel, token_digest(revoked))]
+        assert revoked not in str(fake_cache.store)
+    finally:
+        blacklist_filter.ready = False
+
+
+def test_blacklist_token_reports_failed_publish(fake_cache, monkeypatch):
+    from contextlib import contextmanager
+
+    queue_commands = fake_cache.pipeline
+
+    @contextmanager
+    def failing_pipeline(transaction=False):
+        with queue_commands() as pipe:
+            yield pipe
+        raise ConnectionError("publish failed")
+
+    monkeypatch.setattr(fake_cache, "pipeline", failing_pipeline)
+
+    assert TokenBlacklistService.blacklist_token("token-456", expires_in=5) is False
+
+
+def test_bloom_filter_has_no_false_negatives():
+    from app.utils.bloom_filter import BloomFilter
+
+    bloom = BloomFilter(capacity=1000, error_rate=0.01)
+    items = [f"token-{i}" for i in range(1000)]
+    bloom.update(items)
+
+    assert all(item in bloom for item in items)
+    false_positives = sum(f"other-{i}" in bloom for i in range(10000))
+    assert false_positives < 300
+
+
+def test_token_selector_stores_digests_and_purges_expired(db_session):
+    user = User(name="Purge", email="purge@example.com", phone_number="981313131313", role=UserRole.user)
+    db_session.add(user)
+    db_session.commit()
+
+    now = datetime.now(timezone.utc)
+    TokenSelector.blacklist(db_session, user.id, "live-token", now + timedelta(days=1))
+    for n in range(5):
+        TokenSelector.blacklist(db_session, user.id, f"old-token-{n}", now - timedelta(minutes=1))
+
+    assert TokenSelector.is_blacklisted(db_session, "live-token") is True
+    assert TokenSelector.is_blacklisted(db_session, "old-token-0") is False
+    assert "live-token" not in {row.token_hash for row in db_session.query(BlacklistedToken)}
+
+    assert TokenSelector.purge_expired(db_session, batch_size=2) == 5
+    assert db_session.query(BlacklistedToken).count() == 1
+    assert list(TokenSelector.iter_blacklisted_digests(db_session)) == [
+        db_session.query(BlacklistedToken.token_hash).scalar()
+    ]
+
+
+def test_token_selector_blacklist_tolerates_concurrent_insert(db_session, monkeypatch):
+    from sqlalchemy.orm import Query
+
+    user = User(name="Race", email="race@example.com", phone_number="981414141414", role=UserRole.user)
+    db_session.add(user)
+    db_session.commit()
+    expires_at = datetime.now(timezone.utc) + timedelta(days=1)
+    first = TokenSelector.blacklist(db_session, user.id, "raced-token", expires_at)
+
+    # The other request's row is committed after this one's existence check
+    original_first = Query.first
+    calls = []
+
+    def first_missing_once(self):
+        calls.append(self)
+        return None if len(calls) == 1 else original_first(self)
+
+    monkeypatch.setattr(Query, "first", first_missing_once)
+
+    again = TokenSelector.blacklist(db_session, user.id, "raced-token", expires_at)
+
+    assert again.id == first.id
+    assert db_session.query(BlacklistedToken).count() == 1
+
+
+def test_user_profile_cache_round_trip(db_session, fake_cache):
+    user = User(name="Cached", email="cached@example.com", phone_number="981212121212", role=UserRole.user)
+    db_session.add(user)
+    db_session.commit()
+
+    assert UserProfileCacheService.get(user.id) is None
+    UserProfileCacheService.set(user)
+    cached = UserProfileCacheService.get(user.id)
+    assert cached is not None
+    assert cached.email == "cached@example.com"
+
+    UserProfileCacheService.invalidate(user.id)
+    assert UserProfileCacheService.get(user.id) is None
+
+
 def test_user_service_applies_validations(db_session):
     user = User(
         name="Valid Name",
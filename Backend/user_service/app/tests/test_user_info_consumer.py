@@ -2,6 +2,7 @@ import json
 from datetime import datetime
 from types import SimpleNamespace
 
+from app.config import rabbitmq_config
 from app.tasks.user_info_consumer import UserInfoConsumer
 
 
@@ -57,3 +58,118 @@ def test_user_info_consumer_handle_empty_ids(monkeypatch):
         datetime.fromisoformat(published["message"]["timestamp"]), datetime
     )
 
+
+
+def test_user_info_consumer_records_failed_request_latency():
+    """Every handled request is counted with its latency, failures included."""
+    consumer = UserInfoConsumer(workers=1)
+
+    ok = consumer._handle({"group_id": "group-1", "user_ids": []}, SimpleNamespace())
+
+    stats = consumer.metrics.snapshot()
+    assert ok is False
+    assert stats["failed"] == 1
+    assert stats["in_flight"] == 0
+    assert stats["p50_latency_ms"] is not None
+
+
+def test_user_info_consumer_starts_one_connection_per_worker(monkeypatch):
+    """Each worker thread consumes on its own consumer with the configured prefetch."""
+    import threading
+
+    from app.tasks import user_info_consumer as module
+
+    created = []
+
+    class FakeConnection:
+        is_closed = False
+
+        def __init__(self, consumer):
+            self.consumer = consumer
+
+        def add_callback_threadsafe(self, callback):
+            callback()
+
+    class FakeConsumer:
+        def __init__(self, prefetch_count):
+            self.prefetch_count = prefetch_count
+            self.connection = None
+            self.stopped = threading.Event()
+            self.disconnected = False
+
+        def setup_consumer(self, queue_name, callback):
+            self.connection = FakeConnection(self)
+
+        def start_consuming(self):
+            self.stopped.wait(timeout=5)
+
+        def stop_consuming(self):
+            self.stopped.set()
+
+        def disconnect(self):
+            self.disconnected = True
+
+    def factory(prefetch_count=1):
+        created.append(FakeConsumer(prefetch_count))
+        return created[-1]
+
+    monkeypatch.setattr(module, "get_rabbitmq_consumer", factory)
+
+    consumer = UserInfoConsumer(workers=3, prefetch_count=5)
+    consumer.start()
+    try:
+        assert len(created) == 3
+        assert {c.prefetch_count for c in created} == {5}
+        assert len({t.name for t in consumer.threads}) == 3
+    finally:
+        consumer.stop()
+
+    assert all(c.disconnected for c in created)
+    assert not any(t.is_alive() for t in consumer.threads)
+
+
+def test_user_info_loader_merges_concurrent_lookups():
+    """Lookups arriving within the window share one query and get only their users."""
+    import threading
+    from concurrent.futures import ThreadPoolExecutor
+
+    from app.tasks.user_info_consumer import UserInfoLoader
+
+    queries = []
+
+    def fake_load(user_ids):
+        queries.append(set(user_ids))
+        return {uid: {"user_id": uid} for uid in user_ids if uid != "ghost"}
+
+    loader = UserInfoLoader(window_ms=100, load=fake_load)
+    requests = [{"u1", "u2"}, {"u2", "u3"}, {"u4", "ghost"}, {"u1"}]
+    start = threading.Barrier(len(requests))
+
+    def lookup(user_ids):
+        start.wait()
+        return loader.load(user_ids)
+
+    with ThreadPoolExecutor(max_workers=len(requests)) as pool:
+        results = list(pool.map(lookup, requests))
+
+    assert queries == [{"u1", "u2", "u3", "u4", "ghost"}]
+    assert [set(result) for result in results] == [{"u1", "u2"}, {"u2", "u3"}, {"u4"}, {"u1"}]
+    assert (loader.requests, loader.queries) == (4, 1)
+
+
+def test_user_info_consumer_reads_queue_depth_on_worker_connection(monkeypatch):
+    scheduled = []
+    channel = SimpleNamespace(
+        queue_declare=lambda queue, passive: SimpleNamespace(method=SimpleNamespace(message_count=3))
+    )
+    connection = SimpleNamespace(is_closed=False, call_later=lambda delay, callback: scheduled.append(delay))
+    worker = SimpleNamespace(channel=channel, connection=connection)
+
+    consumer = UserInfoConsumer(workers=1)
+    assert consumer.queue_depth() is None
+
+    consumer.running = True
+    consumer._refresh_queue_depth(worker)
+
+    assert consumer.queue_depth() == 3
+    assert scheduled == [rabbitmq_config.user_info_queue_depth_interval]
@@ -1,4 +1,5 @@
 from app.apps.users.models import User, UserRole
+from app.apps.users.schemas import UserOut
 from app.core import dependencies
 
 
@@ -20,9 +21,11 @@ def test_get_profile_returns_current_user(client, db_session):
     db_session.commit()
     db_session.refresh(user)
 
-    client.app.dependency_overrides[dependencies.get_current_user] = _override_current_user(user)
+    client.app.dependency_overrides[dependencies.get_current_user_profile] = _override_current_user(
+        UserOut.model_validate(user)
+    )
     response = client.get("/users/profile")
-    client.app.dependency_overrides.pop(dependencies.get_current_user, None)
+    client.app.dependency_overrides.pop(dependencies.get_current_user_profile, None)
 
     assert response.status_code == 200
     assert response.json()["email"] == "profile@example.com"
@@ -111,3 +114,26 @@ def test_update_profile_rejects_duplicate_phone(client, db_session):
     assert response.status_code == 400
     assert response.json()["detail"] == "Phone number already registered"
 
+
+
+def test_update_profile_publishes_user_updated(client, db_session, fake_producer):
+    user = User(
+        name="Publisher",
+        email="publisher@example.com",
+        phone_number="985555555555",
+        role=UserRole.user,
+    )
+    db_session.add(user)
+    db_session.commit()
+    db_session.refresh(user)
+
+    client.app.dependency_overrides[dependencies.get_current_user] = _override_current_user(user)
+    response = client.patch("/users/profile", data={"name": "Renamed", "card_holder_name": "R Enamed"})
+    unchanged = client.patch("/users/profile", data={"name": "Renamed"})
+    client.app.dependency_overrides.pop(dependencies.get_current_user, None)
+
+    assert response.status_code == 200
+    assert unchanged.status_code == 200
+    assert fake_producer.user_updates == [
+        {"user_id": user.id, "fields": ["card_holder_name", "name"]}
+    ]
@@ -0,0 +1,7 @@
+"""Token hashing utilities"""
+import hashlib
+
+
+def token_digest(token: str) -> str:
+    """SHA-256 hex digest identifying a token in the blacklist"""
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()